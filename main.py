@@ -19,6 +19,7 @@ Y además muestra CÓDIGOS MALOS para comparar:
  - DIP BUENO: models/PRINCIPIOSOLIDD5.py       (Inscripcion con inyección)
 """
 
+import os
 from datetime import datetime, timedelta
 
 # ================== PRINCIPIOS SOLID (CLASES BUENAS) ==================
@@ -41,23 +42,34 @@ from models.Inscripcion import Inscripcion              # Inscripcion REAL del m
 from models.Evaluacion import Evaluacion
 from models.Asignacion import Asignacion
 from models.PuntajePostulacion import PuntajePostulacion
+from models.RepositorioInscripciones import RepositorioInscripciones
+from models.RegistroPostulantes import RegistroPostulantes
+from models.CatalogoOfertas import CatalogoOfertas
+from models.ResumenSedes import ResumenSedes
+from models.Instantanea import EstadoAdmision
+from models.TablaIdempotencia import TablaIdempotencia
+from models.AsignadorIds import AsignadorIds
 
 
 # ==================== ALMACENAMIENTO GLOBAL ====================
 sedes_disponibles = []
-ofertas_disponibles = []
+catalogo_ofertas = CatalogoOfertas()    # ofertas indexadas por carrera, OFA_ID, CUS_ID y atributos
 registros_nacionales = []
-postulantes_creados = []
-inscripciones_creadas = []
-evaluaciones_creadas = []
-asignaciones_creadas = []
-puntajes_creados = []
+registro_postulantes = RegistroPostulantes()    # postulantes por cedula/id con sus vinculos
+repositorio_inscripciones = RepositorioInscripciones()
+resumen_sedes = ResumenSedes(repositorio=repositorio_inscripciones)    # totales por sede al día
+solicitudes_inscripcion = TablaIdempotencia()    # cedula + carrera + orden -> inscripcion ya creada
+
+# Instantánea opcional: si existe se arranca desde ella; si no, se crea al inicializar.
+# Guarda catálogo, registros, postulantes e inscripciones (con sus evaluaciones)
+# y se reescribe al salir del menú, así el siguiente arranque continúa donde quedó
+RUTA_INSTANTANEA = os.environ.get("ULEAM_INSTANTANEA")
 
 
 # ==================== INICIALIZACIÓN DE DATOS ====================
 def inicializar_sistema():
     """Inicializa el sistema con datos reales de ULEAM"""
-    global sedes_disponibles, ofertas_disponibles, registros_nacionales
+    global sedes_disponibles, catalogo_ofertas, registros_nacionales
 
     import sys
     import io
@@ -91,6 +103,9 @@ def inicializar_sistema():
             sede_pichincha
         ]
 
+        if _cargar_instantanea():
+            return
+
         # ----- OFERTAS ACADEMICAS (USA OfertaCarrera REAL) -----
         oferta_ti_matriz = OfertaCarrera(
             carrera_id=101,
@@ -136,12 +151,16 @@ def inicializar_sistema():
             jornada="NOCTURNA"
         )
 
-        ofertas_disponibles = [
+        catalogo_ofertas = CatalogoOfertas([
             oferta_ti_matriz,
             oferta_software_matriz,
             oferta_medicina_matriz,
             oferta_admin_chone
-        ]
+        ])
+        for sede in sedes_disponibles:
+            resumen_sedes.registrar_sede(sede)
+        for oferta in catalogo_ofertas:
+            resumen_sedes.registrar_oferta(oferta)
 
         # ----- REGISTROS NACIONALES (USA RegistroNacional BUENO - SRP) -----
         registro1 = RegistroNacional(
@@ -179,11 +198,44 @@ def inicializar_sistema():
 
         registros_nacionales = [registro1, registro2, registro3]
 
+        _guardar_instantanea()
+
     finally:
         # restaurar stdout
         sys.stdout = old_stdout
 
 
+def _cargar_instantanea() -> bool:
+    """Carga el estado guardado en RUTA_INSTANTANEA si el archivo existe."""
+    global catalogo_ofertas, registros_nacionales
+
+    if not RUTA_INSTANTANEA or not os.path.exists(RUTA_INSTANTANEA):
+        return False
+    estado = EstadoAdmision.cargar(RUTA_INSTANTANEA)
+    catalogo_ofertas = CatalogoOfertas(estado.ofertas)
+    registros_nacionales = estado.registros
+    for sede in sedes_disponibles:
+        resumen_sedes.registrar_sede(sede)
+    for oferta in catalogo_ofertas:
+        resumen_sedes.registrar_oferta(oferta)
+    # Los postulantes vuelven con sus inscripciones enlazadas: solo se indexan
+    for postulante in estado.postulantes:
+        registro_postulantes.agregar(postulante)
+    for inscripcion in estado.inscripciones:
+        repositorio_inscripciones.agregar(inscripcion)
+    return True
+
+
+def _guardar_instantanea() -> None:
+    """Escribe el estado completo en RUTA_INSTANTANEA (si está configurada)."""
+    if not RUTA_INSTANTANEA:
+        return
+    # Las evaluaciones se guardan junto a su inscripción (relación _evaluacion)
+    EstadoAdmision(ofertas=catalogo_ofertas, registros=registros_nacionales,
+                   postulantes=registro_postulantes,
+                   inscripciones=repositorio_inscripciones).guardar(RUTA_INSTANTANEA)
+
+
 # ==================== FUNCIONES PRINCIPALES (SISTEMA REAL) ====================
 
 def ver_sedes():
@@ -193,8 +245,11 @@ def ver_sedes():
     print("=" * 60)
 
     for sede in sedes_disponibles:
+        resumen = resumen_sedes.resumen(sede_id=sede.sede_id)
         print(f"\nSede:   {sede.nombre_sede}")
         print(f"Codigo: {sede.sede_id}")
+        print(f"Carreras: {resumen['ofertas']} | Cupos: {resumen['total_cupos']} | "
+              f"Inscripciones: {resumen['inscripciones']}")
 
     print(f"\nTotal de sedes: {len(sedes_disponibles)}")
 
@@ -205,8 +260,8 @@ def ver_ofertas_carreras():
     print("OFERTAS ACADEMICAS ULEAM - PERIODO 2025-1")
     print("=" * 60)
 
-    for i, oferta in enumerate(ofertas_disponibles, 1):
-        print(f"\n[{i}] {oferta.nombre_carrera}")
+    for oferta in catalogo_ofertas:
+        print(f"\n[{oferta.ofa_id}] {oferta.nombre_carrera}")
         print(f"   Sede:     {oferta.nombre_sede}")
         print(f"   Cupos:    {oferta.cupos_total}")
         print(f"   Nivel:    {oferta.nivel}")
@@ -235,6 +290,9 @@ def verificar_registro_nacional():
         print(f"Calificacion:     {registro.calificacion}")
         print(f"Provincia:        {registro.provincia_reside}")
         print(f"Canton:           {registro.canton_reside}")
+        sede_id = SedeCampus.obtener_sede_por_canton(registro.canton_reside or "")
+        if sede_id is not None:
+            print(f"Sede del canton:  {SedeCampus.obtener(sede_id).nombre}")
         print(f"Correo:           {registro.correo}")
         print(f"Celular:          {registro.celular}")
     else:
@@ -285,58 +343,72 @@ def crear_inscripcion():
     # La edad y validaciones ya están en RegistroNacional; aquí solo usamos la fecha
     fecha_nac_str = "2000-01-01"  # valor por defecto por si no estuviera cargada
 
-    # Postulante viene de Postulante.py (OCP BUENO)
-    postulante = Postulante(
+    # Un solo Postulante por cedula (Postulante.py, OCP BUENO): reintentar no crea otro
+    postulante, creado = registro_postulantes.obtener_o_crear(
         cedula=registro.identificacion,
         nombre_completo=nombre_completo,
         email=email,
         telefono=telefono,
         fecha_nacimiento=fecha_nac_str
     )
-
-    postulantes_creados.append(postulante)
-    print(f"Postulante creado exitosamente (ID: {postulante.id_postulante})")
+    if creado:
+        print(f"Postulante creado exitosamente (ID: {postulante.id_postulante})")
+    else:
+        print(f"Postulante existente (ID: {postulante.id_postulante})")
 
     print("\nCARRERAS DISPONIBLES:")
-    for i, oferta in enumerate(ofertas_disponibles, 1):
-        print(f"{i}. {oferta.nombre_carrera} - "
+    for oferta in catalogo_ofertas:
+        print(f"{oferta.ofa_id}. {oferta.nombre_carrera} - "
               f"{oferta.nombre_sede} ({oferta.jornada})")
 
     try:
-        opcion_carrera = int(
-            input("\nSeleccione carrera (1-{0}): "
-                  .format(len(ofertas_disponibles)))
-        )
-        if opcion_carrera < 1 or opcion_carrera > len(ofertas_disponibles):
-            print("Opcion invalida")
-            return
+        ofa_id = int(input("\nIngrese el codigo (OFA_ID) de la carrera: "))
     except ValueError:
         print("Entrada invalida")
         return
 
-    oferta_seleccionada = ofertas_disponibles[opcion_carrera - 1]
+    oferta_seleccionada = catalogo_ofertas.por_ofa_id(ofa_id)
+    if oferta_seleccionada is None:
+        print("Opcion invalida")
+        return
 
+    disponibles = repositorio_inscripciones.preferencias_disponibles(postulante.id_postulante)
     try:
-        orden_pref = int(input("Ingrese orden de preferencia (1-3): "))
+        orden_pref = int(input(f"Ingrese orden de preferencia {disponibles}: "))
     except ValueError:
         print("Entrada invalida")
         return
 
-    # Inscripcion REAL del sistema (models.Inscripcion)
-    inscripcion = Inscripcion(
-        id_postulante=postulante.id_postulante,
-        carrera_id=oferta_seleccionada.carrera_id,
-        orden_preferencia=orden_pref,
-        sede_id=oferta_seleccionada.sede_id,
-        jornada=oferta_seleccionada.jornada,
-        cedula_postulante=cedula
-    )
+    # Reintento de la misma solicitud (misma clave que ServicioInscripciones):
+    # se muestra la inscripcion ya creada en lugar de rechazar el orden ocupado
+    clave = TablaIdempotencia.clave_inscripcion(cedula, oferta_seleccionada.carrera_id, orden_pref)
+    existente = solicitudes_inscripcion.obtener(clave)
+    if existente is None or existente.estado == "CANCELADA":
+        existente = repositorio_inscripciones.obtener_activa(postulante.id_postulante, orden_pref)
+        if existente is not None and existente.carrera_id != oferta_seleccionada.carrera_id:
+            existente = None
+    if existente is not None:
+        solicitudes_inscripcion.guardar(clave, existente)
+        print("\nLa inscripcion ya estaba registrada:")
+        existente.mostrar_info_completa()
+        return
 
-    inscripciones_creadas.append(inscripcion)
+    # Inscripcion REAL del sistema (models.Inscripcion), validada por el repositorio
+    try:
+        inscripcion = repositorio_inscripciones.crear_inscripcion(
+            id_postulante=postulante.id_postulante,
+            carrera_id=oferta_seleccionada.carrera_id,
+            orden_preferencia=orden_pref,
+            sede_id=oferta_seleccionada.sede_id,
+            jornada=oferta_seleccionada.jornada,
+            cedula_postulante=cedula
+        )
+    except ValueError as e:
+        print(f"\nError: {e}")
+        return
 
-    evaluacion = inscripcion.obtenerEvaluacion()
-    if evaluacion:
-        evaluaciones_creadas.append(evaluacion)
+    registro_postulantes.vincular_inscripcion(inscripcion)
+    solicitudes_inscripcion.guardar(clave, inscripcion)
 
     print("\n" + "=" * 60)
     print("INSCRIPCION CREADA EXITOSAMENTE")
@@ -349,22 +421,58 @@ def crear_inscripcion():
     print("3. Consulte su evaluacion con la opcion 6")
 
 
-# === Las funciones 6, 7, 8, 9 pueden quedarse definidas o eliminarlas.
-#     Las dejamos por si luego las vuelves a activar, pero NO se usan en el menú. ===
+def _solicitar_postulante(titulo):
+    """Pide una cedula y devuelve su Postulante desde el registro (O(1))"""
+    print("\n" + "=" * 60)
+    print(titulo)
+    print("=" * 60)
+
+    cedula = input("\nIngrese numero de cedula: ").strip()
+    postulante = registro_postulantes.obtener_por_cedula(cedula)
+    if not postulante:
+        print(f"\nNo existe un postulante inscrito con cedula {cedula}")
+    return postulante
+
 
 def consultar_evaluacion():
-    """(SIN USO ACTUALMENTE)"""
-    print("Función consultar_evaluacion definida pero no usada en el menú.")
+    """Opcion 6: Consultar evaluaciones por cedula"""
+    postulante = _solicitar_postulante("CONSULTAR EVALUACION")
+    if not postulante:
+        return
+
+    evaluaciones = registro_postulantes.evaluaciones(postulante.cedula)
+    if not evaluaciones:
+        print("\nEl postulante no tiene evaluaciones programadas")
+        return
+    for evaluacion in evaluaciones:
+        evaluacion.mostrar_info()
 
 
 def consultar_asignacion():
-    """(SIN USO ACTUALMENTE)"""
-    print("Función consultar_asignacion definida pero no usada en el menú.")
+    """Opcion 7: Consultar asignacion de cupo por cedula"""
+    postulante = _solicitar_postulante("CONSULTAR ASIGNACION")
+    if not postulante:
+        return
+
+    asignacion = registro_postulantes.asignacion(postulante.cedula)
+    if asignacion is None:
+        print("\nEl postulante aun no tiene asignacion de cupo")
+        return
+    asignacion.mostrar_info()
 
 
 def consultar_puntaje():
-    """(SIN USO ACTUALMENTE)"""
-    print("Función consultar_puntaje definida pero no usada en el menú.")
+    """Opcion 8: Consultar puntaje de postulacion por cedula"""
+    postulante = _solicitar_postulante("CONSULTAR PUNTAJE")
+    if not postulante:
+        return
+
+    puntajes = registro_postulantes.puntajes(postulante.cedula)
+    if not puntajes:
+        print("\nEl postulante aun no tiene puntaje calculado")
+        return
+    for puntaje in puntajes:
+        puntaje.mostrar_info()
 
 
 def simular_proceso_completo():
@@ -565,9 +673,9 @@ def mostrar_menu():
     print("4. Ver Todos los Registros Nacionales")
     print("5. Crear Inscripcion")
     # Opciones en estudio
-    print("6. Consultar Evaluacion por Cedula  (EN PROCESO DE ESTUDIO Y PLANIFICACION)")
-    print("7. Consultar Asignacion por Cedula (EN PROCESO DE ESTUDIO Y PLANIFICACION)")
-    print("8. Consultar Puntaje por Cedula    (EN PROCESO DE ESTUDIO Y PLANIFICACION)")
+    print("6. Consultar Evaluacion por Cedula")
+    print("7. Consultar Asignacion por Cedula")
+    print("8. Consultar Puntaje por Cedula")
     print("9. Simular Proceso Completo (DEMO) (EN PROCESO DE ESTUDIO Y PLANIFICACION)")
     print("-" * 60)
     print("10. DEMO OCP - Postulante (codigo MALO)")
@@ -579,6 +687,8 @@ def mostrar_menu():
 
 
 def main():
+    # Con ULEAM_IDS los IDs continúan entre ejecuciones y no chocan con el servicio HTTP
+    AsignadorIds.configurar_desde_entorno()
     inicializar_sistema()
 
     while True:
@@ -596,8 +706,14 @@ def main():
                 ver_todos_registros()
             elif opcion == '5':
                 crear_inscripcion()
+            elif opcion == '6':
+                consultar_evaluacion()
+            elif opcion == '7':
+                consultar_asignacion()
+            elif opcion == '8':
+                consultar_puntaje()
             # === OPCIONES DESACTIVADAS: SOLO MENSAJE ===
-            elif opcion in ('6', '7', '8', '9'):
+            elif opcion == '9':
                 print("\n⚙️ Esta opción está en PROCESO DE ESTUDIO Y PLANIFICACIÓN.")
                 print("   Próximamente será implementada en el sistema.")
             # ===========================================
@@ -629,6 +745,8 @@ def main():
             print(f"\nError: {str(e)}")
             print("Por favor, revise los imports y que la carpeta 'models' exista.")
 
+    _guardar_instantanea()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,217 @@
+"""
+Módulo: AnalisisItems
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Estadísticas psicométricas de los ítems de cada forma de examen
+    (tipo de Evaluacion 'practico' o 'escrito'):
+      - Dificultad: proporción de aciertos por ítem.
+      - Discriminación: correlación punto-biserial corregida (ítem vs. puntaje
+        total sin ese ítem).
+      - Distractores: frecuencia de cada opción marcada (y en blanco).
+    Todo se calcula en una sola pasada vectorizada por bloques, de modo que la
+    memoria no crece con el número de postulantes. El reporte sale por forma
+    y por sede.
+"""
+
+from typing import Dict, List, Optional
+
+from models.MotorCalificacion import MotorCalificacion, RESPUESTA_EN_BLANCO, ITEM_ANULADO
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional en el resto del sistema
+    np = None
+
+
+class AnalisisItems:
+    """
+    Acumula sumas suficientes por grupo (forma, sede) y al final
+    deriva dificultad, discriminación y distractores.
+    """
+
+    UMBRAL_DISCRIMINACION = 0.20
+    DIFICULTAD_MINIMA = 0.10
+    DIFICULTAD_MAXIMA = 0.95
+
+    def __init__(self, motor: MotorCalificacion, num_opciones: int = 4,
+                 tamano_bloque: int = 65536):
+        if np is None:
+            raise ImportError("El análisis de ítems requiere NumPy (pip install numpy)")
+        self.motor = motor
+        self.num_items = motor.num_items
+        self.num_opciones = num_opciones
+        self.tamano_bloque = tamano_bloque
+
+    def analizar(self, respuestas, tipo: str, formas=None, sedes=None) -> dict:
+        """
+        Analiza una matriz de respuestas en una sola pasada.
+
+        Args:
+            respuestas: Matriz uint8 (postulantes × ítems), puede ser un memmap
+            tipo: Tipo de evaluación ('practico' o 'escrito')
+            formas: Forma de cada fila (None = forma 0)
+            sedes: sede_id de cada fila (None = una sola sede 0)
+
+        Returns:
+            dict: {'por_forma': {forma: reporte},
+                   'por_sede': {(forma, sede_id): reporte}}
+        """
+        tipo = tipo.lower()
+        total = respuestas.shape[0]
+
+        formas = np.zeros(total, dtype=np.intp) if formas is None else np.asarray(formas, dtype=np.intp)
+        sedes = np.zeros(total, dtype=np.int64) if sedes is None else np.asarray(sedes)
+        if formas.shape != (total,) or sedes.shape != (total,):
+            raise ValueError("formas y sedes deben tener una entrada por fila")
+        claves, _ = self.motor.matriz_claves(tipo, np.unique(formas).tolist())
+
+        # Grupo = (forma, sede) codificado como un entero denso
+        ids_sede, indice_sede = np.unique(sedes, return_inverse=True)
+        grupos = formas * len(ids_sede) + indice_sede
+        num_grupos = claves.shape[0] * len(ids_sede)
+
+        acumulado = self._acumular(respuestas, claves, formas, grupos, num_grupos)
+
+        por_sede = {}
+        por_forma = {}
+        for forma in range(claves.shape[0]):
+            rango = slice(forma * len(ids_sede), (forma + 1) * len(ids_sede))
+            if not acumulado['n'][rango].any():
+                continue
+            por_forma[forma] = self._reporte(tipo, forma, None, claves[forma],
+                                             {k: v[rango].sum(axis=0) for k, v in acumulado.items()})
+            for posicion, sede_id in enumerate(ids_sede.tolist()):
+                grupo = rango.start + posicion
+                if acumulado['n'][grupo]:
+                    por_sede[(forma, sede_id)] = self._reporte(
+                        tipo, forma, sede_id, claves[forma],
+                        {k: v[grupo] for k, v in acumulado.items()})
+
+        return {'por_forma': por_forma, 'por_sede': por_sede}
+
+    def _acumular(self, respuestas, claves, formas, grupos, num_grupos) -> Dict[str, 'np.ndarray']:
+        """Una pasada por bloques acumulando sumas por grupo."""
+        num_items = self.num_items
+        columnas_opcion = self.num_opciones + 1  # última columna = en blanco
+
+        n = np.zeros(num_grupos, dtype=np.int64)
+        suma_x = np.zeros((num_grupos, num_items))
+        suma_t = np.zeros(num_grupos)
+        suma_t2 = np.zeros(num_grupos)
+        suma_xt = np.zeros((num_grupos, num_items))
+        opciones = np.zeros((num_grupos, num_items, columnas_opcion))
+
+        for inicio in range(0, respuestas.shape[0], self.tamano_bloque):
+            fin = min(inicio + self.tamano_bloque, respuestas.shape[0])
+            bloque = np.asarray(respuestas[inicio:fin])
+            clave_filas = claves[formas[inicio:fin]]
+
+            aciertos = ((bloque == clave_filas) & (clave_filas != ITEM_ANULADO)).astype(np.float32)
+            puntaje = aciertos.sum(axis=1)
+
+            # Matriz indicadora fila -> grupo: las sumas por grupo son productos matriciales
+            indicadora = np.zeros((fin - inicio, num_grupos), dtype=np.float32)
+            indicadora[np.arange(fin - inicio), grupos[inicio:fin]] = 1.0
+            indicadora_t = indicadora.T
+
+            n += indicadora.sum(axis=0).astype(np.int64)
+            suma_x += indicadora_t @ aciertos
+            suma_t += indicadora_t @ puntaje
+            suma_t2 += indicadora_t @ (puntaje * puntaje)
+            suma_xt += indicadora_t @ (aciertos * puntaje[:, None])
+
+            for opcion in range(self.num_opciones):
+                opciones[:, :, opcion] += indicadora_t @ (bloque == opcion).astype(np.float32)
+            opciones[:, :, -1] += indicadora_t @ (bloque == RESPUESTA_EN_BLANCO).astype(np.float32)
+
+        return {'n': n, 'suma_x': suma_x, 'suma_t': suma_t, 'suma_t2': suma_t2,
+                'suma_xt': suma_xt, 'opciones': opciones}
+
+    def _reporte(self, tipo: str, forma: int, sede_id: Optional[int], clave,
+                 sumas: Dict[str, 'np.ndarray']) -> dict:
+        """Convierte las sumas de un grupo en el reporte compacto."""
+        n = int(sumas['n'])
+        sx = sumas['suma_x']
+        sxt = sumas['suma_xt']
+
+        # Puntaje total corregido: t' = t - x (el ítem no se correlaciona consigo mismo)
+        st = sumas['suma_t'] - sx
+        st2 = sumas['suma_t2'] - 2 * sxt + sx
+        sxt = sxt - sx
+
+        covarianza = n * sxt - sx * st
+        varianza = (n * sx - sx * sx) * (n * st2 - st * st)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            discriminacion = np.where(varianza > 0, covarianza / np.sqrt(varianza), np.nan)
+        dificultad = sx / n
+
+        validos = clave != ITEM_ANULADO
+        revisar = np.flatnonzero(validos & (
+            (dificultad < self.DIFICULTAD_MINIMA) | (dificultad > self.DIFICULTAD_MAXIMA) |
+            ~(discriminacion >= self.UMBRAL_DISCRIMINACION)))
+
+        return {
+            'tipo': tipo,
+            'forma': forma,
+            'sede_id': sede_id,
+            'postulantes': n,
+            'dificultad': _redondear(np.where(validos, dificultad, np.nan)),
+            'discriminacion': _redondear(np.where(validos, discriminacion, np.nan)),
+            'distractores': np.round(sumas['opciones'] / n, 3).tolist(),
+            'items_revisar': (revisar + 1).tolist()
+        }
+
+
+def _redondear(valores) -> List[Optional[float]]:
+    return [None if np.isnan(v) else round(float(v), 3) for v in valores]
+
+
+def mostrar_reporte(reporte: dict, opciones: str = "ABCD") -> None:
+    """Imprime un reporte de ítems de una forma (o forma y sede)."""
+    sede = f" | Sede {reporte['sede_id']}" if reporte['sede_id'] is not None else ""
+    print("\n" + "=" * 70)
+    print(f"ANÁLISIS DE ÍTEMS - {reporte['tipo'].upper()} FORMA {reporte['forma']}{sede}")
+    print(f"Postulantes: {reporte['postulantes']}")
+    print("=" * 70)
+    print(f"{'Ítem':<6}{'Dificultad':>11}{'Discrim.':>10}   Distractores ({opciones} + blanco)")
+    for i, (p, r, d) in enumerate(zip(reporte['dificultad'], reporte['discriminacion'],
+                                      reporte['distractores']), 1):
+        p_txt = '-' if p is None else f"{p:.3f}"
+        r_txt = '-' if r is None else f"{r:.3f}"
+        print(f"{i:<6}{p_txt:>11}{r_txt:>10}   {' '.join(f'{x:.2f}' for x in d)}")
+    print("-" * 70)
+    print(f"Ítems a revisar: {reporte['items_revisar'] or 'ninguno'}")
+    print("=" * 70)
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import time
+    from models.MotorCalificacion import generar_respuestas_simuladas
+
+    print("=" * 70)
+    print("PRUEBA: ANÁLISIS DE ÍTEMS POR FORMA Y SEDE")
+    print("=" * 70)
+
+    NUM_POSTULANTES = 200_000
+    NUM_ITEMS = 120
+
+    generador = np.random.default_rng(11)
+    clave = generador.integers(0, 4, NUM_ITEMS, dtype=np.uint8)
+    motor = MotorCalificacion(num_items=NUM_ITEMS)
+    motor.agregar_clave('escrito', 0, clave)
+
+    respuestas = generar_respuestas_simuladas(NUM_POSTULANTES, NUM_ITEMS, clave)
+    sedes = generador.integers(1, 10, NUM_POSTULANTES)
+
+    inicio = time.perf_counter()
+    resultado = AnalisisItems(motor).analizar(respuestas, 'escrito', sedes=sedes)
+    print(f"\nTiempo de análisis: {time.perf_counter() - inicio:.2f} s")
+
+    reporte = resultado['por_forma'][0]
+    reporte['dificultad'] = reporte['dificultad'][:10]
+    reporte['discriminacion'] = reporte['discriminacion'][:10]
+    reporte['distractores'] = reporte['distractores'][:10]
+    mostrar_reporte(reporte)
+    print(f"Reportes por sede generados: {len(resultado['por_sede'])}")
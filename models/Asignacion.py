@@ -1,4 +1,3 @@
-<<<<<<< HEAD
 """
 Módulo: Asignacion
 Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos.
@@ -11,6 +10,14 @@ from datetime import datetime
 from abc import ABC, abstractmethod
 from typing import Optional
 
+import models.Categorias as Categorias
+from models.AsignadorIds import AsignadorIds
+
+
+# Estados tomados de Categorias.ESTADOS_ASIGNACION (una etiqueta mal escrita falla al importar)
+_PENDIENTE, _CONFIRMADA, _RECHAZADA, _EXPIRADA = map(
+    Categorias.ESTADOS_ASIGNACION.normalizar, ('PENDIENTE', 'CONFIRMADA', 'RECHAZADA', 'EXPIRADA'))
+
 
 class ProcesoAdmision(ABC):
     """
@@ -46,14 +53,23 @@ class Asignacion(ProcesoAdmision):
     """
 
     _contador_asignaciones = 0
-    ESTADOS_VALIDOS = ['PENDIENTE', 'CONFIRMADA', 'RECHAZADA', 'EXPIRADA']
+    ESTADOS_VALIDOS = Categorias.ESTADOS_ASIGNACION
+
+    # Servicio de correo (InterfazEmail) para avisos; None = solo imprimir
+    notificador = None
+    # Bitácora de eventos (BitacoraEventos) de los cambios de estado; None = sin registro
+    bitacora = None
+    # Versiones para lecturas consistentes (VersionesEstado); None = sin versiones
+    versiones = None
+    CAMPOS_VERSIONADOS = ('estado', 'fecha_confirmacion', 'observaciones')
 
-    def _init_(self,
+    def __init__(self,
                  id_postulante: int,
                  carrera_id: int,
                  sede_id: int,
                  puntaje_final: float,
-                 cedula_postulante: str):
+                 cedula_postulante: str,
+                 email_postulante: Optional[str] = None):
         """
         Inicializa una asignación de cupo.
 
@@ -63,19 +79,25 @@ class Asignacion(ProcesoAdmision):
             sede_id: ID de la sede
             puntaje_final: Puntaje final obtenido
             cedula_postulante: Cédula del postulante
+            email_postulante: Correo para el aviso de confirmación (opcional)
         """
         Asignacion._contador_asignaciones += 1
 
-        self.id_asignacion = Asignacion._contador_asignaciones
+        self.id_asignacion = AsignadorIds.predeterminado().siguiente('asignacion')
         self.id_postulante = id_postulante
         self.carrera_id = carrera_id
         self.sede_id = sede_id
         self.puntaje_final = puntaje_final
         self.cedula_postulante = cedula_postulante
+        self.email_postulante = email_postulante
         self.fecha_asignacion = datetime.now()
-        self.estado = 'PENDIENTE'
+        self.estado = _PENDIENTE
         self.fecha_confirmacion = None
         self.observaciones = None
+        if self.versiones is not None:
+            self.versiones.publicar(self, {}, alta=True)
+        if self.bitacora is not None:
+            self.bitacora.registrar('asignacion_creada', self)
 
     # ==============================
     # MÉTODOS POLIMÓRFICOS HEREDADOS
@@ -83,25 +105,31 @@ class Asignacion(ProcesoAdmision):
 
     def confirmar(self) -> None:
         """Confirma la asignación del cupo."""
-        if self.estado == 'CONFIRMADA':
+        if self.estado == _CONFIRMADA:
             print(f"La asignación {self.id_asignacion} ya está confirmada.")
             return
 
-        self.estado = 'CONFIRMADA'
-        self.fecha_confirmacion = datetime.now()
+        self._publicar(estado=_CONFIRMADA, fecha_confirmacion=datetime.now())
+        if self.bitacora is not None:
+            self.bitacora.registrar('asignacion_confirmada', self)
         self._notificar_confirmacion()
         print(f"Asignación {self.id_asignacion} confirmada exitosamente.")
 
     def rechazar(self, motivo: Optional[str] = None) -> None:
         """Rechaza la asignación del cupo con un motivo opcional."""
-        self.estado = 'RECHAZADA'
+        cambios = {'estado': _RECHAZADA}
         if motivo:
-            self.observaciones = f"Rechazada: {motivo}"
+            cambios['observaciones'] = f"Rechazada: {motivo}"
+        self._publicar(**cambios)
+        if self.bitacora is not None:
+            self.bitacora.registrar('asignacion_rechazada', self, motivo)
         print(f"Asignación {self.id_asignacion} rechazada. Motivo: {self.observaciones or 'Ninguno'}")
 
     def expirar(self) -> None:
         """Marca la asignación como expirada por falta de confirmación."""
-        self.estado = 'EXPIRADA'
+        self._publicar(estado=_EXPIRADA)
+        if self.bitacora is not None:
+            self.bitacora.registrar('asignacion_expirada', self)
         print(f"Asignación {self.id_asignacion} expirada.")
 
     def mostrar_info(self) -> None:
@@ -126,153 +154,43 @@ class Asignacion(ProcesoAdmision):
     # MÉTODOS ESPECÍFICOS DE ASIGNACIÓN
     # ==============================
 
-    def _notificar_confirmacion(self) -> None:
-        """Notifica al postulante sobre la confirmación."""
-        print(f"Notificación enviada a postulante {self.id_postulante}.")
-        print(f"Cupo confirmado en carrera {self.carrera_id}.")
-
-    def agregarObservaciones(self, texto: str) -> None:
-        """Agrega observaciones a la asignación."""
-        self.observaciones = texto
-
-    def _str_(self) -> str:
-=======
-"""
-Módulo: Asignacion
-Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos.
-Fecha: Octubre 2025
-Descripción: Clase que gestiona la asignación de cupos a postulantes,
-              con integración de herencia, clases abstractas y polimorfismo básico.
-"""
-
-from datetime import datetime
-from abc import ABC, abstractmethod
-from typing import Optional
-
-
-class ProcesoAdmision(ABC):
-    """
-    Clase base abstracta que define el comportamiento común de un proceso
-    de admisión, como confirmación, rechazo o expiración.
-    """
-
-    @abstractmethod
-    def confirmar(self) -> None:
-        """Confirma el proceso (método abstracto obligatorio)."""
-        pass
-
-    @abstractmethod
-    def rechazar(self, motivo: Optional[str] = None) -> None:
-        """Rechaza el proceso con un motivo."""
-        pass
-
-    @abstractmethod
-    def expirar(self) -> None:
-        """Marca el proceso como expirado."""
-        pass
-
-    @abstractmethod
-    def mostrar_info(self) -> None:
-        """Muestra la información completa del proceso."""
-        pass
-
-
-class Asignacion(ProcesoAdmision):
-    """
-    Representa la asignación definitiva de un cupo a un postulante.
-    Se crea después de que el postulante completa su evaluación.
-    """
-
-    _contador_asignaciones = 0
-    ESTADOS_VALIDOS = ['PENDIENTE', 'CONFIRMADA', 'RECHAZADA', 'EXPIRADA']
-
-    def _init_(self,
-                 id_postulante: int,
-                 carrera_id: int,
-                 sede_id: int,
-                 puntaje_final: float,
-                 cedula_postulante: str):
+    @classmethod
+    def configurar_notificador(cls, notificador) -> None:
         """
-        Inicializa una asignación de cupo.
-
-        Args:
-            id_postulante: ID del postulante
-            carrera_id: ID de la carrera asignada
-            sede_id: ID de la sede
-            puntaje_final: Puntaje final obtenido
-            cedula_postulante: Cédula del postulante
+        Define el servicio de correo de los avisos de confirmación.
+        Con un DespachadorNotificaciones el aviso se encola y confirmar() no espera al correo.
         """
-        Asignacion._contador_asignaciones += 1
+        cls.notificador = notificador
 
-        self.id_asignacion = Asignacion._contador_asignaciones
-        self.id_postulante = id_postulante
-        self.carrera_id = carrera_id
-        self.sede_id = sede_id
-        self.puntaje_final = puntaje_final
-        self.cedula_postulante = cedula_postulante
-        self.fecha_asignacion = datetime.now()
-        self.estado = 'PENDIENTE'
-        self.fecha_confirmacion = None
-        self.observaciones = None
-
-    # ==============================
-    # MÉTODOS POLIMÓRFICOS HEREDADOS
-    # ==============================
-
-    def confirmar(self) -> None:
-        """Confirma la asignación del cupo."""
-        if self.estado == 'CONFIRMADA':
-            print(f"La asignación {self.id_asignacion} ya está confirmada.")
+    def _publicar(self, **cambios) -> None:
+        """Aplica cambios de CAMPOS_VERSIONADOS; con versiones activas publica una versión nueva."""
+        if self.versiones is not None:
+            self.versiones.publicar(self, cambios)
             return
-
-        self.estado = 'CONFIRMADA'
-        self.fecha_confirmacion = datetime.now()
-        self._notificar_confirmacion()
-        print(f"Asignación {self.id_asignacion} confirmada exitosamente.")
-
-    def rechazar(self, motivo: Optional[str] = None) -> None:
-        """Rechaza la asignación del cupo con un motivo opcional."""
-        self.estado = 'RECHAZADA'
-        if motivo:
-            self.observaciones = f"Rechazada: {motivo}"
-        print(f"Asignación {self.id_asignacion} rechazada. Motivo: {self.observaciones or 'Ninguno'}")
-
-    def expirar(self) -> None:
-        """Marca la asignación como expirada por falta de confirmación."""
-        self.estado = 'EXPIRADA'
-        print(f"Asignación {self.id_asignacion} expirada.")
-
-    def mostrar_info(self) -> None:
-        """Muestra la información completa de la asignación."""
-        print("\n" + "=" * 60)
-        print(f"ASIGNACIÓN ID: {self.id_asignacion}")
-        print("=" * 60)
-        print(f"Cédula Postulante: {self.cedula_postulante}")
-        print(f"Postulante ID: {self.id_postulante}")
-        print(f"Carrera ID: {self.carrera_id}")
-        print(f"Sede ID: {self.sede_id}")
-        print(f"Puntaje Final: {self.puntaje_final} puntos")
-        print(f"Fecha Asignación: {self.fecha_asignacion.strftime('%d/%m/%Y %H:%M')}")
-        print(f"Estado: {self.estado}")
-        if self.fecha_confirmacion:
-            print(f"Fecha Confirmación: {self.fecha_confirmacion.strftime('%d/%m/%Y %H:%M')}")
-        if self.observaciones:
-            print(f"Observaciones: {self.observaciones}")
-        print("=" * 60)
-
-    # ==============================
-    # MÉTODOS ESPECÍFICOS DE ASIGNACIÓN
-    # ==============================
+        for nombre, valor in cambios.items():
+            setattr(self, nombre, valor)
 
     def _notificar_confirmacion(self) -> None:
         """Notifica al postulante sobre la confirmación."""
+        if Asignacion.notificador is not None and self.email_postulante:
+            encolado = Asignacion.notificador.enviar_confirmacion(
+                self.email_postulante,
+                f"Su cupo en la carrera {self.carrera_id} (sede {self.sede_id}) ha sido confirmado. "
+                f"Asignación {self.id_asignacion}, puntaje {self.puntaje_final}."
+            )
+            # DespachadorNotificaciones devuelve False con la cola llena: el aviso
+            # no se pierde en silencio, se informa por consola
+            if encolado is False:
+                print(f"No se pudo encolar el correo a {self.email_postulante} (cola de avisos llena).")
+            return
         print(f"Notificación enviada a postulante {self.id_postulante}.")
         print(f"Cupo confirmado en carrera {self.carrera_id}.")
 
     def agregarObservaciones(self, texto: str) -> None:
         """Agrega observaciones a la asignación."""
-        self.observaciones = texto
+        self._publicar(observaciones=texto)
+        if self.bitacora is not None:
+            self.bitacora.registrar('asignacion_observada', self)
 
-    def _str_(self) -> str:
->>>>>>> d4f7eac51555ebae2693ce93b24af2bc4943b607
+    def __str__(self) -> str:
         return f"Asignacion(ID:{self.id_asignacion}, Postulante:{self.id_postulante}, Estado:{self.estado})"
\ No newline at end of file
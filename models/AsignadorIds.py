@@ -0,0 +1,235 @@
+"""
+Módulo: AsignadorIds
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Asignación de IDs por bloques para Postulante, Inscripcion, Evaluacion,
+    OfertaCarrera, Asignacion y PuntajePostulacion.
+      - Cada hilo arrienda un bloque de IDs de una secuencia y los entrega
+        sin candados; solo el arriendo de un bloque nuevo se sincroniza.
+      - Sin ruta el máximo entregado vive en memoria y los IDs empiezan en 1
+        en cada ejecución, como los contadores de clase de antes.
+      - Con ruta el máximo se guarda en SQLite (BEGIN IMMEDIATE), así varios
+        procesos no se pisan y un reinicio continúa después del último bloque.
+        main.py y ServicioInscripciones toman la ruta de ULEAM_IDS.
+    Los IDs de un bloque que no se llegan a usar se pierden: los IDs son
+    únicos y crecientes por hilo, pero no necesariamente consecutivos.
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Dict, Optional
+
+
+class AsignadorIds:
+    """Secuencias con nombre ('inscripcion', 'evaluacion'...) repartidas en bloques."""
+
+    SQL_CREAR = "CREATE TABLE IF NOT EXISTS secuencias (nombre TEXT PRIMARY KEY, maximo INTEGER NOT NULL)"
+    SQL_LEER = "SELECT maximo FROM secuencias WHERE nombre = ?"
+    SQL_GUARDAR = ("INSERT INTO secuencias (nombre, maximo) VALUES (?, ?) "
+                   "ON CONFLICT(nombre) DO UPDATE SET maximo = excluded.maximo")
+
+    VARIABLE_ENTORNO = "ULEAM_IDS"
+
+    _predeterminado: Optional['AsignadorIds'] = None
+
+    def __init__(self, ruta: Optional[str] = None, tamano_bloque: int = 1000,
+                 tiempo_espera: float = 30.0):
+        """
+        Args:
+            ruta: Archivo SQLite con el máximo de cada secuencia (None = solo en memoria)
+            tamano_bloque: IDs que arrienda cada hilo de una vez
+            tiempo_espera: Segundos que se espera si otro proceso tiene el archivo bloqueado
+        """
+        if tamano_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+        self.ruta = ruta
+        self.tamano_bloque = tamano_bloque
+        self.tiempo_espera = tiempo_espera
+        self._candado = threading.Lock()
+        self._maximos: Dict[str, int] = {}
+        self._local = threading.local()
+        self._conexion = self._conectar() if ruta is not None else None
+        _ASIGNADORES.add(self)
+
+    def _conectar(self) -> sqlite3.Connection:
+        conexion = sqlite3.connect(self.ruta, timeout=self.tiempo_espera,
+                                   isolation_level=None, check_same_thread=False)
+        conexion.execute(self.SQL_CREAR)
+        return conexion
+
+    @classmethod
+    def predeterminado(cls) -> 'AsignadorIds':
+        """Asignador que usan los modelos (en memoria salvo que se llame a configurar)."""
+        if cls._predeterminado is None:
+            cls._predeterminado = cls()
+        return cls._predeterminado
+
+    @classmethod
+    def configurar(cls, ruta: Optional[str] = None, tamano_bloque: int = 1000) -> 'AsignadorIds':
+        """Reemplaza el asignador de los modelos (por ejemplo, para persistir en un archivo)."""
+        anterior = cls._predeterminado
+        cls._predeterminado = cls(ruta, tamano_bloque)
+        if anterior is not None:
+            anterior.cerrar()
+        return cls._predeterminado
+
+    @classmethod
+    def configurar_desde_entorno(cls, tamano_bloque: int = 1000) -> 'AsignadorIds':
+        """
+        Persiste los IDs en el archivo de ULEAM_IDS si la variable está definida;
+        si no, o si ya se usa ese archivo, deja el asignador actual.
+        """
+        ruta = os.environ.get(cls.VARIABLE_ENTORNO)
+        actual = cls.predeterminado()
+        if not ruta or actual.ruta == ruta:
+            return actual
+        return cls.configurar(ruta, tamano_bloque)
+
+    # ==============================
+    # ENTREGA DE IDS
+    # ==============================
+
+    def siguiente(self, secuencia: str) -> int:
+        """Siguiente ID de la secuencia para el hilo actual."""
+        bloques = self._bloques()
+        bloque = bloques.get(secuencia)
+        if bloque is not None:
+            numero = next(bloque, None)
+            if numero is not None:
+                return numero
+        inicio = self._arrendar(secuencia, self.tamano_bloque)
+        bloque = bloques[secuencia] = iter(range(inicio + 1, inicio + self.tamano_bloque))
+        return inicio
+
+    def reservar(self, secuencia: str, cantidad: int) -> range:
+        """
+        Rango contiguo de IDs para una carga en lote (independiente de los
+        bloques del hilo).
+        """
+        if cantidad < 1:
+            raise ValueError("La cantidad debe ser al menos 1")
+        inicio = self._arrendar(secuencia, cantidad)
+        return range(inicio, inicio + cantidad)
+
+    def maximo(self, secuencia: str) -> int:
+        """Último ID arrendado de la secuencia (0 si nunca se usó)."""
+        with self._candado:
+            if self._conexion is None:
+                return self._maximos.get(secuencia, 0)
+            fila = self._conexion.execute(self.SQL_LEER, (secuencia,)).fetchone()
+            return fila[0] if fila else 0
+
+    def avanzar(self, secuencia: str, minimo: int) -> None:
+        """
+        Garantiza que los próximos IDs sean mayores que minimo (por ejemplo,
+        tras restaurar datos guardados). Descarta el bloque del hilo actual;
+        conviene llamarlo antes de arrancar otros hilos.
+        """
+        with self._candado:
+            if self._conexion is None:
+                self._maximos[secuencia] = max(self._maximos.get(secuencia, 0), minimo)
+            else:
+                conexion = self._conexion
+                conexion.execute("BEGIN IMMEDIATE")
+                try:
+                    fila = conexion.execute(self.SQL_LEER, (secuencia,)).fetchone()
+                    if (fila[0] if fila else 0) < minimo:
+                        conexion.execute(self.SQL_GUARDAR, (secuencia, minimo))
+                except Exception:
+                    conexion.execute("ROLLBACK")
+                    raise
+                conexion.execute("COMMIT")
+        self._bloques().pop(secuencia, None)
+
+    def _arrendar(self, secuencia: str, cantidad: int) -> int:
+        """Sube el máximo de la secuencia en cantidad y devuelve el primer ID del bloque."""
+        with self._candado:
+            if self._conexion is None:
+                inicio = self._maximos.get(secuencia, 0) + 1
+                self._maximos[secuencia] = inicio + cantidad - 1
+                return inicio
+
+            # BEGIN IMMEDIATE toma el bloqueo de escritura antes de leer: dos
+            # procesos no pueden leer el mismo máximo
+            conexion = self._conexion
+            conexion.execute("BEGIN IMMEDIATE")
+            try:
+                fila = conexion.execute(self.SQL_LEER, (secuencia,)).fetchone()
+                inicio = (fila[0] if fila else 0) + 1
+                conexion.execute(self.SQL_GUARDAR, (secuencia, inicio + cantidad - 1))
+            except Exception:
+                conexion.execute("ROLLBACK")
+                raise
+            conexion.execute("COMMIT")
+            return inicio
+
+    def _bloques(self) -> dict:
+        try:
+            return self._local.bloques
+        except AttributeError:
+            self._local.bloques = {}
+            return self._local.bloques
+
+    def _olvidar_bloques(self) -> None:
+        self._local = threading.local()
+        self._candado = threading.Lock()
+        # La conexión SQLite del padre no se puede usar en el hijo (ni cerrarla:
+        # liberaría sus bloqueos); el hijo abre la suya
+        if self._conexion is not None:
+            self._conexion = self._conectar()
+
+    def cerrar(self) -> None:
+        if self._conexion is not None:
+            self._conexion.close()
+            self._conexion = None
+
+
+# Un proceso hijo no debe seguir entregando los bloques que heredó del padre
+_ASIGNADORES: 'weakref.WeakSet[AsignadorIds]' = weakref.WeakSet()
+
+
+def _olvidar_bloques_heredados() -> None:
+    for asignador in list(_ASIGNADORES):
+        asignador._olvidar_bloques()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_olvidar_bloques_heredados)
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    print("=" * 70)
+    print("PRUEBA: ASIGNACIÓN DE IDS POR BLOQUES")
+    print("=" * 70)
+
+    memoria = AsignadorIds()
+    print(f"\nEn memoria: {[memoria.siguiente('inscripcion') for _ in range(5)]}")
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'ids.sqlite3')
+        asignador = AsignadorIds(ruta, tamano_bloque=5000)
+
+        def ingerir(cantidad: int) -> list:
+            return [asignador.siguiente('inscripcion') for _ in range(cantidad)]
+
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as ejecutor:
+            lotes = list(ejecutor.map(ingerir, [125_000] * 8))
+        duracion = time.perf_counter() - inicio
+        ids = [i for lote in lotes for i in lote]
+        print(f"8 hilos, {len(ids):,} IDs en {duracion * 1000:.0f} ms | únicos: {len(set(ids)) == len(ids)}")
+        print(f"Máximo persistido: {asignador.maximo('inscripcion'):,}")
+        asignador.cerrar()
+
+        reinicio = AsignadorIds(ruta, tamano_bloque=5000)
+        print(f"Tras reiniciar, siguiente ID: {reinicio.siguiente('inscripcion'):,}")
+        reinicio.cerrar()
+    print("=" * 70)
@@ -0,0 +1,321 @@
+"""
+Módulo: BaseDatosSQLite
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Implementación real de InterfazBaseDatos (PRINCIPIOSOLIDD5) sobre DB-API 2.0.
+    Localmente usa sqlite3; para un servidor (MySQL/PostgreSQL) basta con pasar
+    otra fábrica de conexiones y ajustar las sentencias SQL de la clase.
+      - Pool de conexiones reutilizables.
+      - guardar_inscripcion() acumula filas y las escribe en una sola
+        transacción multi-fila cuando se llena el lote o vence el intervalo.
+      - buscar_inscripcion() lee a través de una caché LRU.
+"""
+
+import itertools
+import json
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from models.PRINCIPIOSOLIDD5 import InterfazBaseDatos
+
+
+# ==============================
+# POOL DE CONEXIONES
+# ==============================
+
+class PoolConexiones:
+    """Conjunto fijo de conexiones DB-API que los hilos toman y devuelven."""
+
+    def __init__(self, fabrica: Callable[[], Any], tamano: int = 4):
+        if tamano < 1:
+            raise ValueError("El pool debe tener al menos una conexión")
+        self._libres: 'queue.Queue' = queue.Queue()
+        self._todas = []
+        for _ in range(tamano):
+            conexion = fabrica()
+            self._todas.append(conexion)
+            self._libres.put(conexion)
+
+    @contextmanager
+    def conexion(self, tiempo_espera: Optional[float] = None):
+        conexion = self._libres.get(timeout=tiempo_espera)
+        try:
+            yield conexion
+        finally:
+            self._libres.put(conexion)
+
+    def cerrar(self) -> None:
+        for conexion in self._todas:
+            conexion.close()
+        self._todas = []
+
+
+# ==============================
+# CACHÉ LRU
+# ==============================
+
+class CacheLRU:
+    """Caché de capacidad fija que descarta la entrada usada hace más tiempo."""
+
+    def __init__(self, capacidad: int = 10_000):
+        self.capacidad = capacidad
+        self._datos: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._candado = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        with self._candado:
+            valor = self._datos.get(clave)
+            if valor is None:
+                self.fallos += 1
+                return None
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        if self.capacidad <= 0:
+            return
+        with self._candado:
+            self._datos[clave] = valor
+            self._datos.move_to_end(clave)
+            if len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+
+# ==============================
+# BASE DE DATOS
+# ==============================
+
+class BaseDatosSQLite(InterfazBaseDatos):
+    """
+    Guarda inscripciones (de PRINCIPIOSOLIDD5 o de models.Inscripcion) en una
+    tabla clave-valor: número de inscripción, estado, fecha y sus datos en JSON.
+    """
+
+    SQL_CREAR = ("CREATE TABLE IF NOT EXISTS inscripciones ("
+                 "numero TEXT PRIMARY KEY, estado TEXT, fecha TEXT, datos TEXT NOT NULL)")
+    SQL_GUARDAR = ("INSERT INTO inscripciones (numero, estado, fecha, datos) VALUES (?, ?, ?, ?) "
+                   "ON CONFLICT(numero) DO UPDATE SET estado = excluded.estado, "
+                   "fecha = excluded.fecha, datos = excluded.datos")
+    SQL_BUSCAR = "SELECT datos FROM inscripciones WHERE numero = ?"
+    SQL_CONTAR = "SELECT COUNT(*) FROM inscripciones"
+
+    _memorias = itertools.count(1)
+
+    def __init__(self, ruta: str = ":memory:", tamano_pool: int = 4, tamano_lote: int = 500,
+                 intervalo_vaciado: float = 0.5, capacidad_cache: int = 10_000,
+                 fabrica: Optional[Callable[[], Any]] = None):
+        """
+        Args:
+            ruta: Archivo SQLite (":memory:" = base en memoria compartida por el pool)
+            tamano_pool: Conexiones abiertas
+            tamano_lote: Filas acumuladas que disparan una escritura
+            intervalo_vaciado: Segundos máximos que una fila espera en el búfer (0 = sin hilo)
+            capacidad_cache: Entradas de la caché LRU de lecturas
+            fabrica: Fábrica de conexiones DB-API (reemplaza a sqlite3)
+        """
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser mayor a 0")
+        self.tamano_lote = tamano_lote
+        self.intervalo_vaciado = intervalo_vaciado
+
+        self.pool = PoolConexiones(fabrica or self._fabrica_sqlite(ruta), tamano_pool)
+        self.cache = CacheLRU(capacidad_cache)
+        with self.pool.conexion() as conexion:
+            conexion.execute(self.SQL_CREAR)
+            conexion.commit()
+
+        self._bufer: Dict[str, tuple] = {}
+        self._en_vuelo: Dict[str, tuple] = {}
+        self._candado = threading.Lock()
+        self._candado_escritura = threading.Lock()
+        self.estadisticas = {'guardadas': 0, 'transacciones': 0}
+
+        self._detener = threading.Event()
+        self._hilo = None
+        if intervalo_vaciado > 0:
+            self._hilo = threading.Thread(target=self._vaciar_periodicamente,
+                                          name="bd-vaciado", daemon=True)
+            self._hilo.start()
+
+    @classmethod
+    def _fabrica_sqlite(cls, ruta: str) -> Callable[[], sqlite3.Connection]:
+        if ruta == ":memory:":
+            # Cada conexión a ":memory:" sería otra base; se usa una en memoria compartida
+            ruta = f"file:admision_{id(cls)}_{next(cls._memorias)}?mode=memory&cache=shared"
+            uri = True
+        else:
+            uri = ruta.startswith("file:")
+
+        def fabrica():
+            conexion = sqlite3.connect(ruta, uri=uri, check_same_thread=False)
+            if "mode=memory" in ruta:
+                # Caché compartida: las lecturas no esperan el candado de tabla del escritor
+                conexion.execute("PRAGMA read_uncommitted=1")
+            else:
+                conexion.execute("PRAGMA journal_mode=WAL")
+                conexion.execute("PRAGMA synchronous=NORMAL")
+            return conexion
+        return fabrica
+
+    # ==============================
+    # ESCRITURA POR LOTES
+    # ==============================
+
+    @staticmethod
+    def _numero(inscripcion) -> str:
+        numero = getattr(inscripcion, 'numero_inscripcion', None)
+        if numero is None:
+            numero = getattr(inscripcion, 'id_inscripcion')
+        return str(numero)
+
+    @staticmethod
+    def _serializar(inscripcion) -> Dict[str, Any]:
+        """Atributos públicos de tipo simple (los servicios inyectados se omiten)."""
+        datos = {}
+        for nombre, valor in vars(inscripcion).items():
+            if nombre.startswith('_'):
+                continue
+            if isinstance(valor, (datetime, date)):
+                datos[nombre] = valor.isoformat()
+            elif valor is None or isinstance(valor, (str, int, float, bool)):
+                datos[nombre] = valor
+        return datos
+
+    def guardar_inscripcion(self, inscripcion) -> None:
+        """Deja la inscripción en el búfer; se escribe al completar el lote."""
+        numero = self._numero(inscripcion)
+        datos = self._serializar(inscripcion)
+        fecha = datos.get('fecha_inscripcion')
+        fila = (numero, datos.get('estado'), fecha, json.dumps(datos, ensure_ascii=False))
+
+        with self._candado:
+            self._bufer[numero] = fila  # guardados repetidos se fusionan
+            lleno = len(self._bufer) >= self.tamano_lote
+        self.cache.guardar(numero, datos)
+        if lleno:
+            self.vaciar()
+
+    def vaciar(self) -> int:
+        """Escribe el búfer en una sola transacción. Devuelve las filas escritas."""
+        with self._candado_escritura:
+            with self._candado:
+                if not self._bufer:
+                    return 0
+                self._en_vuelo, self._bufer = self._bufer, {}
+            filas = list(self._en_vuelo.values())
+            try:
+                with self.pool.conexion() as conexion:
+                    try:
+                        conexion.executemany(self.SQL_GUARDAR, filas)
+                        conexion.commit()
+                    except Exception:
+                        conexion.rollback()
+                        with self._candado:
+                            # Se devuelven al búfer sin pisar guardados más recientes
+                            self._bufer = {**self._en_vuelo, **self._bufer}
+                        raise
+            finally:
+                with self._candado:
+                    self._en_vuelo = {}
+            self.estadisticas['guardadas'] += len(filas)
+            self.estadisticas['transacciones'] += 1
+            return len(filas)
+
+    def _vaciar_periodicamente(self) -> None:
+        while not self._detener.wait(self.intervalo_vaciado):
+            try:
+                self.vaciar()
+            except Exception:
+                pass  # el siguiente ciclo (o cerrar()) lo vuelve a intentar
+
+    # ==============================
+    # LECTURA
+    # ==============================
+
+    def buscar_inscripcion(self, numero_inscripcion) -> Optional[Dict[str, Any]]:
+        """Devuelve los datos guardados de la inscripción (o None)."""
+        numero = str(numero_inscripcion)
+        datos = self.cache.obtener(numero)
+        if datos is not None:
+            return datos
+
+        with self._candado:
+            fila = self._bufer.get(numero) or self._en_vuelo.get(numero)
+        if fila is None:
+            with self.pool.conexion() as conexion:
+                fila = conexion.execute(self.SQL_BUSCAR, (numero,)).fetchone()
+            if fila is None:
+                return None
+            texto = fila[0]
+        else:
+            texto = fila[3]
+
+        datos = json.loads(texto)
+        self.cache.guardar(numero, datos)
+        return datos
+
+    def contar(self) -> int:
+        """Inscripciones ya escritas en la base (sin contar el búfer)."""
+        with self.pool.conexion() as conexion:
+            return conexion.execute(self.SQL_CONTAR).fetchone()[0]
+
+    # ==============================
+    # CIERRE
+    # ==============================
+
+    def cerrar(self) -> None:
+        """Escribe lo pendiente y cierra el pool."""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+            self._hilo = None
+        self.vaciar()
+        self.pool.cerrar()
+
+    def __enter__(self) -> 'BaseDatosSQLite':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from models.Inscripcion import Inscripcion
+
+    print("=" * 70)
+    print("PRUEBA: BASE DE DATOS SQLITE CON POOL, LOTES Y CACHÉ")
+    print("=" * 70)
+
+    TOTAL = 50_000
+    inscripciones = [Inscripcion(i, 101, 1, 1, "MATUTINA", cedula_postulante="1316202082",
+                                 evaluacion_diferida=True) for i in range(1, TOTAL + 1)]
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        with BaseDatosSQLite(os.path.join(carpeta, "admision.db")) as bd:
+            inicio = time.perf_counter()
+            for inscripcion in inscripciones:
+                bd.guardar_inscripcion(inscripcion)
+            bd.vaciar()
+            duracion = time.perf_counter() - inicio
+
+            print(f"\nInscripciones guardadas: {bd.contar():,} en {duracion:.2f} s")
+            print(f"Transacciones: {bd.estadisticas['transacciones']}")
+            print(f"Búsqueda: {bd.buscar_inscripcion(inscripciones[0].id_inscripcion)['jornada']}")
+            print(f"Aciertos de caché: {bd.cache.aciertos} | fallos: {bd.cache.fallos}")
+    print("=" * 70)
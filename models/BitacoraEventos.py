@@ -0,0 +1,409 @@
+"""
+Módulo: BitacoraEventos
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Bitácora de eventos de solo agregado para el proceso de admisión.
+      - Cada cambio de estado (reservarCupo, liberarCupo, confirmar/rechazar/
+        expirar una asignación, cancelar una inscripción, registrar una
+        calificación, altas de objetos...) agrega un registro: largo y CRC32
+        (struct '<II') seguidos de secuencia, marca de tiempo, tipo, detalle
+        y el objeto tal como quedó (CodecBinario).
+      - Los registros se acumulan en memoria y se escriben con un solo
+        fsync por lote (tamano_lote eventos o intervalo_vaciado segundos; un
+        hilo vacía el búfer aunque no lleguen más eventos).
+      - reconstruir() parte del último punto de control (una instantánea de
+        EstadoAdmision) y vuelve a aplicar los eventos posteriores, hasta
+        una fecha o secuencia si se pide (auditorías).
+    Los modelos registran eventos por su atributo de clase bitacora (None =
+    sin registro); activar() lo configura. Postulantes, registros nacionales
+    y puntajes no generan eventos: su estado llega en los puntos de control.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from models.Asignacion import Asignacion
+from models.AsignadorIds import AsignadorIds
+from models.CodecBinario import EPOCA, MICROSEGUNDO, CodecBinario, _deszigzag, _zigzag, escribir_varint, leer_varint
+from models.Esquemas import ESQUEMAS, esquema_de
+from models.Evaluacion import Evaluacion
+from models.Inscripcion import Inscripcion
+from models.Instantanea import EstadoAdmision
+from models.ofertaCarrera import OfertaCarrera
+
+
+_CABECERA = struct.Struct('<II')  # largo del registro, CRC32 del registro
+
+# Modelos cuyos cambios se registran (atributo de clase bitacora)
+MODELOS_REGISTRADOS = (OfertaCarrera, Inscripcion, Evaluacion, Asignacion)
+
+
+class Evento(NamedTuple):
+    secuencia: int
+    marca: datetime
+    tipo: str
+    detalle: Optional[str]
+    objeto: object  # copia del objeto después del cambio
+
+
+# ==============================
+# FORMATO DE LOS REGISTROS
+# ==============================
+
+def _escribir_texto(salida: bytearray, texto: Optional[str]) -> None:
+    """Texto con largo varint + 1 (0 = None)."""
+    if texto is None:
+        salida.append(0)
+        return
+    codificado = texto.encode('utf-8')
+    escribir_varint(salida, len(codificado) + 1)
+    salida += codificado
+
+
+def _leer_texto(datos, posicion: int) -> tuple:
+    largo, posicion = leer_varint(datos, posicion)
+    if largo == 0:
+        return None, posicion
+    fin = posicion + largo - 1
+    return str(datos[posicion:fin], 'utf-8'), fin
+
+
+def _leer_registros(datos, posicion: int = 0) -> Iterator[tuple]:
+    """(inicio, fin, cuerpo) de cada registro válido; se detiene en el primero dañado o incompleto."""
+    total = len(datos)
+    while posicion + _CABECERA.size <= total:
+        largo, crc = _CABECERA.unpack_from(datos, posicion)
+        inicio = posicion + _CABECERA.size
+        fin = inicio + largo
+        if fin > total:
+            return
+        cuerpo = datos[inicio:fin]
+        if zlib.crc32(cuerpo) != crc:
+            return
+        yield posicion, fin, cuerpo
+        posicion = fin
+
+
+class _Indice:
+    """Búsqueda por ID sobre una tabla de EstadoAdmision (lista o ColeccionInstantanea)."""
+
+    def __init__(self, tabla, campo_id: str):
+        self.tabla = tabla
+        self.campo_id = campo_id
+        self._por_id: Optional[dict] = None
+
+    def buscar(self, valor):
+        if hasattr(self.tabla, 'por_id'):
+            return self.tabla.por_id(valor)
+        if self._por_id is None:
+            self._por_id = {getattr(o, self.campo_id): o for o in self.tabla}
+        return self._por_id.get(valor)
+
+    def agregar(self, objeto) -> None:
+        self.tabla.append(objeto)
+        if self._por_id is not None:
+            self._por_id[getattr(objeto, self.campo_id)] = objeto
+
+
+# ==============================
+# BITÁCORA
+# ==============================
+
+class BitacoraEventos:
+    """Archivo de eventos de solo agregado con puntos de control."""
+
+    def __init__(self, ruta: str, tamano_lote: int = 256, intervalo_vaciado: float = 0.2,
+                 reloj: Callable[[], datetime] = datetime.now):
+        """
+        Args:
+            ruta: Archivo de la bitácora (se crea si no existe)
+            tamano_lote: Eventos acumulados que disparan la escritura con fsync
+            intervalo_vaciado: Segundos máximos que un evento espera en memoria
+                (0 = fsync por evento)
+            reloj: Fuente de la marca de tiempo de cada evento
+        """
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1")
+        self.ruta = ruta
+        self.ruta_puntos = ruta + '.puntos'
+        self.tamano_lote = tamano_lote
+        self.intervalo_vaciado = intervalo_vaciado
+        self.reloj = reloj
+        self._codec = CodecBinario()
+        self._candado = threading.Lock()
+        self._bufer = bytearray()
+        self._pendientes = 0
+        self._ultimo_vaciado = time.monotonic()  # el plazo no depende de reloj (puede ser simulado)
+
+        self.puntos_control: List[dict] = []
+        if os.path.exists(self.ruta_puntos):
+            with open(self.ruta_puntos, encoding='utf-8') as archivo:
+                self.puntos_control = json.load(archivo)
+
+        # Recupera la última secuencia y descarta un registro final a medias
+        self.secuencia, valido = self._recorrer_final()
+        self._archivo = open(ruta, 'ab')
+        if self._archivo.tell() != valido:
+            self._archivo.truncate(valido)
+            self._archivo.seek(valido)
+
+        # Vaciado por plazo aunque no se registren más eventos (cerrar() lo detiene)
+        self._cerrando = threading.Event()
+        self._vaciador = None
+        if intervalo_vaciado > 0:
+            self._vaciador = threading.Thread(target=self._vaciar_periodicamente,
+                                              name='BitacoraEventos', daemon=True)
+            self._vaciador.start()
+
+    def _recorrer_final(self) -> tuple:
+        """(última secuencia, bytes válidos) leyendo desde el último punto de control."""
+        if not os.path.exists(self.ruta):
+            return 0, 0
+        secuencia = offset = 0
+        if self.puntos_control:
+            secuencia = self.puntos_control[-1]['secuencia']
+            offset = self.puntos_control[-1]['offset']
+        with open(self.ruta, 'rb') as archivo:
+            archivo.seek(offset)
+            datos = archivo.read()
+        valido = offset
+        for _, fin, cuerpo in _leer_registros(datos):
+            secuencia, _ = leer_varint(cuerpo, 0)
+            valido = offset + fin
+        return secuencia, valido
+
+    # ==============================
+    # REGISTRO
+    # ==============================
+
+    def registrar(self, tipo: str, objeto, detalle: Optional[str] = None) -> int:
+        """
+        Agrega un evento con la copia actual del objeto.
+
+        Returns:
+            int: Secuencia del evento
+        """
+        datos = self._codec.codificar(objeto)
+        with self._candado:
+            marca = self.reloj()
+            self.secuencia += 1
+            cuerpo = bytearray()
+            escribir_varint(cuerpo, self.secuencia)
+            escribir_varint(cuerpo, _zigzag((marca - EPOCA) // MICROSEGUNDO))
+            _escribir_texto(cuerpo, tipo)
+            _escribir_texto(cuerpo, detalle)
+            cuerpo += datos
+            self._bufer += _CABECERA.pack(len(cuerpo), zlib.crc32(cuerpo))
+            self._bufer += cuerpo
+            self._pendientes += 1
+            if (self._pendientes >= self.tamano_lote
+                    or time.monotonic() - self._ultimo_vaciado >= self.intervalo_vaciado):
+                self._vaciar()
+            return self.secuencia
+
+    def _vaciar(self) -> None:
+        """Escribe el búfer con un solo fsync (con el candado tomado)."""
+        if self._bufer:
+            self._archivo.write(self._bufer)
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._bufer.clear()
+            self._pendientes = 0
+        self._ultimo_vaciado = time.monotonic()
+
+    def _vaciar_periodicamente(self) -> None:
+        while not self._cerrando.wait(self.intervalo_vaciado):
+            with self._candado:
+                if self._bufer and not self._archivo.closed:
+                    self._vaciar()
+
+    def sincronizar(self) -> None:
+        """Lleva al disco los eventos pendientes."""
+        with self._candado:
+            self._vaciar()
+
+    def activar(self) -> 'BitacoraEventos':
+        """Los modelos registrados empiezan a escribir en esta bitácora."""
+        for clase in MODELOS_REGISTRADOS:
+            clase.bitacora = self
+        return self
+
+    def desactivar(self) -> None:
+        for clase in MODELOS_REGISTRADOS:
+            if clase.bitacora is self:
+                clase.bitacora = None
+
+    def cerrar(self) -> None:
+        self.desactivar()
+        self._cerrando.set()
+        if self._vaciador is not None:
+            self._vaciador.join()
+        with self._candado:
+            if not self._archivo.closed:
+                self._vaciar()
+                self._archivo.close()
+
+    # ==============================
+    # PUNTOS DE CONTROL
+    # ==============================
+
+    def punto_control(self, estado: EstadoAdmision) -> dict:
+        """
+        Guarda una instantánea del estado, que debe reflejar todos los eventos
+        registrados hasta ahora. reconstruir() parte del último punto de
+        control anterior a la fecha pedida en lugar del inicio de la bitácora.
+        """
+        with self._candado:
+            self._vaciar()
+            punto = {'secuencia': self.secuencia, 'marca': self.reloj().isoformat(),
+                     'offset': self._archivo.tell(),
+                     'archivo': f"{os.path.basename(self.ruta)}.{self.secuencia:012d}.snap"}
+            estado.guardar(os.path.join(os.path.dirname(self.ruta), punto['archivo']))
+
+            temporal = self.ruta_puntos + '.tmp'
+            with open(temporal, 'w', encoding='utf-8') as archivo:
+                json.dump(self.puntos_control + [punto], archivo, indent=1)
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            os.replace(temporal, self.ruta_puntos)
+            self.puntos_control.append(punto)
+            return punto
+
+    # ==============================
+    # LECTURA Y REPRODUCCIÓN
+    # ==============================
+
+    def eventos(self, desde_offset: int = 0) -> Iterator[Evento]:
+        """Eventos guardados en disco, en orden (los del búfer no se incluyen)."""
+        with open(self.ruta, 'rb') as archivo:
+            archivo.seek(desde_offset)
+            datos = memoryview(archivo.read())
+        for _, _, cuerpo in _leer_registros(datos):
+            secuencia, posicion = leer_varint(cuerpo, 0)
+            micros, posicion = leer_varint(cuerpo, posicion)
+            tipo, posicion = _leer_texto(cuerpo, posicion)
+            detalle, posicion = _leer_texto(cuerpo, posicion)
+            yield Evento(secuencia, EPOCA + timedelta(microseconds=_deszigzag(micros)), tipo,
+                         detalle, self._codec.decodificar(cuerpo[posicion:]))
+
+    def reconstruir(self, hasta: Optional[datetime] = None,
+                    hasta_secuencia: Optional[int] = None) -> EstadoAdmision:
+        """
+        Estado después del último evento con marca <= hasta y secuencia <=
+        hasta_secuencia (sin límites: el estado actual). Los eventos se
+        aplican copiando los campos guardados, sin llamar a los métodos de
+        los modelos: no se imprime, no se registran eventos nuevos y los IDs
+        de los modelos no avanzan.
+        """
+        self.sincronizar()
+        punto = None
+        for candidato in self.puntos_control:
+            if hasta is not None and datetime.fromisoformat(candidato['marca']) > hasta:
+                break
+            if hasta_secuencia is not None and candidato['secuencia'] > hasta_secuencia:
+                break
+            punto = candidato
+
+        if punto is None:
+            estado, offset = EstadoAdmision(), 0
+        else:
+            ruta = os.path.join(os.path.dirname(self.ruta), punto['archivo'])
+            # Asignador descartable: cargar el pasado no debe mover los IDs en uso
+            estado, offset = EstadoAdmision.cargar(ruta, AsignadorIds()), punto['offset']
+
+        indices = {tabla: _Indice(getattr(estado, tabla), esquema.campo_id)
+                   for tabla, esquema in ESQUEMAS.items()}
+        sin_inscripcion: Dict[int, Evaluacion] = {}
+        for evento in self.eventos(offset):
+            if hasta is not None and evento.marca > hasta:
+                break
+            if hasta_secuencia is not None and evento.secuencia > hasta_secuencia:
+                break
+            self._aplicar(evento.objeto, indices, sin_inscripcion)
+        return estado
+
+    @staticmethod
+    def _aplicar(objeto, indices: Dict[str, _Indice], sin_inscripcion: Dict[int, Evaluacion]) -> None:
+        esquema = esquema_de(objeto)
+        indice = indices[esquema.tabla]
+        existente = indice.buscar(getattr(objeto, esquema.campo_id))
+        if existente is not None:
+            for campo in esquema.campos:
+                setattr(existente, campo.nombre, getattr(objeto, campo.nombre))
+            return
+
+        indice.agregar(objeto)
+        # Enlace Inscripcion._evaluacion (el orden de los eventos puede ser cualquiera)
+        if isinstance(objeto, Evaluacion):
+            inscripcion = indices['inscripciones'].buscar(objeto.id_inscripcion)
+            if inscripcion is None:
+                sin_inscripcion[objeto.id_inscripcion] = objeto
+            elif inscripcion._evaluacion is None:
+                inscripcion._evaluacion = objeto
+        elif isinstance(objeto, Inscripcion):
+            objeto._evaluacion = sin_inscripcion.pop(objeto.id_inscripcion, None)
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import random
+    import tempfile
+    import time
+
+    print("=" * 70)
+    print("PRUEBA: BITÁCORA DE EVENTOS CON REPRODUCCIÓN")
+    print("=" * 70)
+
+    generador = random.Random(49)
+    with tempfile.TemporaryDirectory() as carpeta:
+        bitacora = BitacoraEventos(os.path.join(carpeta, 'admision.log')).activar()
+        with contextlib.redirect_stdout(io.StringIO()):
+            ofertas = [OfertaCarrera(100 + i, f"CARRERA {i}", 1, "MANTA", 5000, "TERCER NIVEL",
+                                     "PRESENCIAL", "MATUTINA", mostrar=False) for i in range(20)]
+            for oferta in ofertas:
+                oferta.configurar_desde_pdf(cupos_nivelacion=5000, mostrar=False)
+            estado = EstadoAdmision(ofertas=ofertas)
+
+            inicio = time.perf_counter()
+            for i in range(20_000):
+                oferta = generador.choice(ofertas)
+                if oferta.reservarCupo('GENERAL'):
+                    asignacion = Asignacion(i, oferta.carrera_id, 1, 800.0, f"13{i:08d}")
+                    estado.asignaciones.append(asignacion)
+                    if generador.random() < 0.8:
+                        asignacion.confirmar()
+                    else:
+                        asignacion.rechazar("No aceptó")
+                        oferta.liberarCupo('GENERAL')
+                if i == 10_000:
+                    bitacora.punto_control(estado)
+                    corte = bitacora.secuencia
+            bitacora.sincronizar()
+            duracion = time.perf_counter() - inicio
+
+        print(f"\n{bitacora.secuencia:,} eventos en {duracion * 1000:.0f} ms | "
+              f"{os.path.getsize(bitacora.ruta) / 1e6:.1f} MB")
+
+        inicio = time.perf_counter()
+        reconstruido = bitacora.reconstruir()
+        duracion = time.perf_counter() - inicio
+        iguales = all(a.cupos_asignados == b.cupos_asignados
+                      for a, b in zip(ofertas, reconstruido.ofertas))
+        print(f"Reconstrucción completa en {duracion * 1000:.0f} ms | cupos iguales: {iguales}")
+
+        pasado = bitacora.reconstruir(hasta_secuencia=corte)
+        print(f"Estado en el evento {corte:,}: {len(pasado.asignaciones):,} asignaciones "
+              f"(hoy {len(estado.asignaciones):,})")
+        reconstruido.cerrar()
+        pasado.cerrar()
+        bitacora.cerrar()
+    print("=" * 70)
@@ -0,0 +1,217 @@
+"""
+Módulo: BuscadorOfertas
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Índice invertido sobre las ofertas (OfertaCarrera) para que el postulante
+    busque carreras escribiendo parte del nombre, sin tildes ni mayúsculas:
+    "ingenieria", "tecnolog", "administracion manta".
+      - Campos indexados: nombre_carrera, nombre_sede, modalidad, jornada.
+      - Cada palabra de la consulta se busca como palabra exacta o prefijo;
+        si no aparece, por similitud de trigramas (tolera errores de tipeo).
+      - Filtros exactos por sede_id, jornada, modalidad y nivel.
+"""
+
+import heapq
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models.Normalizacion import plegar_acentos, tokenizar, trigramas
+
+
+class BuscadorOfertas:
+    """
+    Índice palabra -> ofertas, con vocabulario ordenado para prefijos e
+    índice de trigramas para búsquedas aproximadas.
+    """
+
+    CAMPOS = ('nombre_carrera', 'nombre_sede', 'modalidad', 'jornada')
+    FILTROS = ('sede_id', 'jornada', 'modalidad', 'nivel')
+    SIMILITUD_MINIMA = 0.40
+    LONGITUD_MINIMA_PREFIJO = 3
+
+    def __init__(self, ofertas: Iterable = ()):
+        self._ofertas: List = []
+        self._indice: Dict[str, Set[int]] = defaultdict(set)
+        self._en_nombre: Dict[str, Set[int]] = defaultdict(set)
+        self._trigramas: Dict[str, Set[str]] = defaultdict(set)
+        self._filtros: Dict[Tuple[str, object], Set[int]] = defaultdict(set)
+        self._vocabulario: List[str] = []
+        self._rango_nombre: List[int] = []
+        self._vocabulario_vigente = True
+        for oferta in ofertas:
+            self.agregar(oferta)
+
+    # ==============================
+    # INDEXACIÓN
+    # ==============================
+
+    def agregar(self, oferta) -> None:
+        posicion = len(self._ofertas)
+        self._ofertas.append(oferta)
+        self._vocabulario_vigente = False
+
+        for campo in self.CAMPOS:
+            for palabra in tokenizar(str(getattr(oferta, campo, '') or '')):
+                if palabra not in self._indice:
+                    for trigrama in set(trigramas(palabra)):
+                        self._trigramas[trigrama].add(palabra)
+                self._indice[palabra].add(posicion)
+                if campo == 'nombre_carrera':
+                    self._en_nombre[palabra].add(posicion)
+
+        for campo in self.FILTROS:
+            self._filtros[(campo, self._valor_filtro(getattr(oferta, campo, None)))].add(posicion)
+
+    @staticmethod
+    def _valor_filtro(valor):
+        return plegar_acentos(valor) if isinstance(valor, str) else valor
+
+    def _preparar(self) -> None:
+        """Ordena el vocabulario y el rango alfabético de las ofertas tras nuevas altas."""
+        if not self._vocabulario_vigente:
+            self._vocabulario = sorted(self._indice)
+            self._rango_nombre = [0] * len(self._ofertas)
+            por_nombre = sorted(range(len(self._ofertas)),
+                                key=lambda p: plegar_acentos(self._ofertas[p].nombre_carrera))
+            for rango, posicion in enumerate(por_nombre):
+                self._rango_nombre[posicion] = rango
+            self._vocabulario_vigente = True
+
+    # ==============================
+    # BÚSQUEDA
+    # ==============================
+
+    def _coincidencias(self, termino: str) -> Dict[str, float]:
+        """Palabras del vocabulario que coinciden con un término y su peso."""
+        if termino in self._indice:
+            coincidencias = {termino: 2.0}
+        else:
+            coincidencias = {}
+
+        if len(termino) >= self.LONGITUD_MINIMA_PREFIJO:
+            vocabulario = self._vocabulario
+            i = bisect_left(vocabulario, termino)
+            while i < len(vocabulario) and vocabulario[i].startswith(termino):
+                coincidencias.setdefault(vocabulario[i], 1.0)
+                i += 1
+
+        if not coincidencias:
+            # Aproximada: palabras que comparten suficientes trigramas
+            propios = set(trigramas(termino))
+            conteo: Dict[str, int] = defaultdict(int)
+            for trigrama in propios:
+                for palabra in self._trigramas.get(trigrama, ()):
+                    conteo[palabra] += 1
+            for palabra, comunes in conteo.items():
+                # Jaccard entre conjuntos de trigramas
+                similitud = comunes / (len(propios) + len(set(trigramas(palabra))) - comunes)
+                if similitud >= self.SIMILITUD_MINIMA:
+                    coincidencias[palabra] = similitud
+        return coincidencias
+
+    def buscar(self, consulta: str = "", limite: Optional[int] = 20,
+               sede_id: Optional[int] = None, jornada: Optional[str] = None,
+               modalidad: Optional[str] = None, nivel: Optional[str] = None) -> List:
+        """
+        Busca ofertas cuyo texto contenga TODAS las palabras de la consulta.
+
+        Args:
+            consulta: Texto libre ("ing software", "administracion chone")
+            limite: Máximo de resultados (None = todos)
+            sede_id, jornada, modalidad, nivel: Filtros exactos opcionales
+
+        Returns:
+            List[OfertaCarrera]: Ordenadas por relevancia y luego por nombre
+        """
+        self._preparar()
+        candidatos: Optional[Set[int]] = None
+        for campo, valor in (('sede_id', sede_id), ('jornada', jornada),
+                             ('modalidad', modalidad), ('nivel', nivel)):
+            if valor is None:
+                continue
+            conjunto = self._filtros.get((campo, self._valor_filtro(valor)), set())
+            candidatos = conjunto if candidatos is None else candidatos & conjunto
+            if not candidatos:
+                return []
+
+        puntajes: Dict[int, float] = {}
+        for numero, termino in enumerate(tokenizar(consulta)):
+            encontrados: Dict[int, float] = {}
+            coincidencias = self._coincidencias(termino)
+            # Primero las palabras de mayor peso: cada oferta queda con su mejor coincidencia
+            for palabra in sorted(coincidencias, key=lambda c: -coincidencias[c]):
+                peso = coincidencias[palabra]
+                posiciones = self._indice[palabra]
+                en_nombre = self._en_nombre.get(palabra, ())
+                if candidatos is not None:
+                    posiciones = posiciones & candidatos
+                nuevas = posiciones - encontrados.keys()
+                for posicion in nuevas:
+                    encontrados[posicion] = peso + (0.5 if posicion in en_nombre else 0.0)
+            if numero == 0:
+                puntajes = encontrados
+            else:
+                puntajes = {p: s + encontrados[p] for p, s in puntajes.items() if p in encontrados}
+            if not puntajes:
+                return []
+
+        if not puntajes and not tokenizar(consulta):
+            # Solo filtros
+            posiciones = range(len(self._ofertas)) if candidatos is None else candidatos
+            puntajes = dict.fromkeys(posiciones, 0.0)
+
+        rango = self._rango_nombre
+        clave = lambda p: (-puntajes[p], rango[p])
+        if limite is not None and limite < len(puntajes):
+            orden = heapq.nsmallest(limite, puntajes, key=clave)
+        else:
+            orden = sorted(puntajes, key=clave)
+        return [self._ofertas[p] for p in orden]
+
+    def __len__(self) -> int:
+        return len(self._ofertas)
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import random
+    import time
+    from models.ofertaCarrera import OfertaCarrera
+
+    print("=" * 70)
+    print("PRUEBA: BUSCADOR DE OFERTAS (ÍNDICE INVERTIDO)")
+    print("=" * 70)
+
+    CARRERAS = ["Tecnologías de la Información", "Ingeniería en Software", "Medicina",
+                "Administración de Empresas", "Ingeniería Civil", "Enfermería", "Derecho",
+                "Contabilidad y Auditoría", "Ingeniería Agropecuaria", "Psicología Clínica",
+                "Educación Básica", "Turismo", "Economía", "Odontología", "Arquitectura"]
+    SEDES = ["Matriz - Manta", "Chone", "El Carmen", "Pedernales", "Bahía de Caráquez",
+             "Quito", "Guayaquil", "Cuenca", "Loja", "Ambato"]
+    generador = random.Random(5)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ofertas = [OfertaCarrera(i, f"{generador.choice(CARRERAS)} {i % 40}", i % len(SEDES) + 1,
+                                 generador.choice(SEDES), 40, "TERCER NIVEL",
+                                 generador.choice(OfertaCarrera.MODALIDADES),
+                                 generador.choice(OfertaCarrera.JORNADAS))
+                   for i in range(5000)]
+
+    inicio = time.perf_counter()
+    buscador = BuscadorOfertas(ofertas)
+    print(f"\nÍndice de {len(buscador):,} ofertas en {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    for consulta, filtros in [("ingenieria", {}), ("tecnologias", {}),
+                              ("administracion manta", {}), ("ingenieira softwre", {}),
+                              ("medic", {'jornada': 'nocturna'})]:
+        inicio = time.perf_counter()
+        for _ in range(100):
+            resultados = buscador.buscar(consulta, **filtros)
+        duracion = (time.perf_counter() - inicio) / 100 * 1000
+        primero = resultados[0].nombre_carrera if resultados else '-'
+        print(f"{consulta!r:<26} {duracion:6.3f} ms  {len(resultados):>3} resultados  ej: {primero}")
+    print("=" * 70)
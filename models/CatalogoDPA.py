@@ -0,0 +1,179 @@
+"""
+Módulo: CatalogoDPA
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    División Político Administrativa (DPA) del Ecuador en jerarquía
+    provincia -> cantón -> parroquia, cargada desde models/datos/dpa_ecuador.csv.
+      - Códigos INEC enteros: provincia 13, cantón 1308, parroquia 130850.
+      - Los nombres se buscan sin tildes ni mayúsculas ("manabi" = "MANABÍ")
+        dentro de su padre, así "BOLÍVAR" provincia y "BOLÍVAR" cantón no se cruzan.
+      - Los nombres oficiales se internan (una sola cadena compartida).
+      - a_nivel() sube de parroquia/cantón a cantón/provincia con división
+        entera, válido también sobre arreglos NumPy para agrupar en bloque.
+"""
+
+import csv
+import numbers
+import os
+import sys
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from models.Normalizacion import plegar_acentos
+
+
+RUTA_DPA = os.path.join(os.path.dirname(__file__), 'datos', 'dpa_ecuador.csv')
+
+
+class UbicacionDPA(NamedTuple):
+    """Códigos resueltos de una ubicación (None en el nivel que no se reconoció)."""
+    provincia: Optional[int]
+    canton: Optional[int]
+    parroquia: Optional[int]
+
+
+class CatalogoDPA:
+    """Provincias, cantones y parroquias indexados por código y por nombre plegado."""
+
+    NIVELES = {'provincia': 1, 'canton': 100, 'parroquia': 10_000}
+
+    _predeterminado: Optional['CatalogoDPA'] = None
+
+    def __init__(self, ruta: str = RUTA_DPA):
+        self._nombres: Dict[int, str] = {}
+        # Hijos de cada nodo por nombre plegado (0 = raíz, es decir, las provincias)
+        self._hijos: Dict[int, Dict[str, int]] = {0: {}}
+
+        with open(ruta, encoding='utf-8', newline='') as archivo:
+            for fila in csv.DictReader(archivo):
+                self.agregar(fila['codigo'], fila['nombre'],
+                             [a for a in (fila.get('alias') or '').split('|') if a])
+
+    @classmethod
+    def predeterminado(cls) -> 'CatalogoDPA':
+        """Catálogo del archivo incluido, cargado una sola vez."""
+        if cls._predeterminado is None:
+            cls._predeterminado = cls()
+        return cls._predeterminado
+
+    def agregar(self, codigo: str, nombre: str, alias=()) -> None:
+        """
+        Registra un nodo. El nivel sale de los dígitos del código (2, 4 o 6).
+
+        Raises:
+            ValueError: Si el código no tiene 2, 4 o 6 dígitos o su padre no existe
+        """
+        codigo = codigo.strip()
+        if len(codigo) not in (2, 4, 6) or not codigo.isdigit():
+            raise ValueError(f"Código DPA inválido: {codigo!r}")
+        padre = int(codigo[:-2]) if len(codigo) > 2 else 0
+        if padre not in self._hijos:
+            raise ValueError(f"El código {codigo} no tiene padre registrado")
+
+        numero = int(codigo)
+        self._nombres[numero] = sys.intern(nombre.strip().upper())
+        self._hijos.setdefault(numero, {})
+        for variante in (nombre, *alias):
+            self._hijos[padre].setdefault(plegar_acentos(variante.strip()), numero)
+
+    # ==============================
+    # RESOLUCIÓN DE NOMBRES
+    # ==============================
+
+    def _buscar(self, padre: Optional[int], nombre: Optional[str]) -> Optional[int]:
+        if padre is None or not nombre:
+            return None
+        return self._hijos.get(padre, {}).get(plegar_acentos(nombre.strip()))
+
+    def resolver(self, provincia: Optional[str], canton: Optional[str] = None,
+                 parroquia: Optional[str] = None) -> UbicacionDPA:
+        """
+        Convierte nombres libres en códigos, nivel por nivel.
+
+        Ejemplo:
+            resolver("manabi", "Manta", "MANTA") -> UbicacionDPA(13, 1308, 130850)
+        """
+        codigo_provincia = self._buscar(0, provincia)
+        codigo_canton = self._buscar(codigo_provincia, canton)
+        codigo_parroquia = self._buscar(codigo_canton, parroquia)
+        return UbicacionDPA(codigo_provincia, codigo_canton, codigo_parroquia)
+
+    def nombre(self, codigo: Optional[int]) -> Optional[str]:
+        """Nombre oficial (cadena internada) de un código, o None."""
+        return self._nombres.get(codigo)
+
+    def hijos(self, codigo: int = 0) -> Dict[int, str]:
+        """Cantones de una provincia, parroquias de un cantón o provincias (codigo=0)."""
+        codigos = sorted(set(self._hijos.get(codigo, {}).values()))
+        return {c: self._nombres[c] for c in codigos}
+
+    # ==============================
+    # AGRUPACIÓN POR CÓDIGOS
+    # ==============================
+
+    @classmethod
+    def a_nivel(cls, codigos, nivel: str):
+        """
+        Lleva códigos de cualquier nivel inferior al nivel pedido.
+        Funciona con un entero o con un arreglo NumPy de enteros.
+
+        Ejemplo:
+            a_nivel(130850, 'provincia') -> 13
+        """
+        if nivel not in cls.NIVELES:
+            raise ValueError(f"Nivel inválido. Debe ser: {', '.join(cls.NIVELES)}")
+        divisor = cls.NIVELES[nivel]
+        if isinstance(codigos, numbers.Integral):
+            codigo = int(codigos)
+            while codigo >= divisor * 100:
+                codigo //= 100
+            return codigo
+        # Arreglos: cada código se divide según sus propios dígitos
+        resultado = codigos.copy()
+        for _ in range(2):
+            resultado = resultado // ((resultado >= divisor * 100) * 99 + 1)
+        return resultado
+
+    def __len__(self) -> int:
+        return len(self._nombres)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._nombres)
+
+    def __contains__(self, codigo: int) -> bool:
+        return codigo in self._nombres
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import random
+    import time
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    print("=" * 70)
+    print("PRUEBA: CATÁLOGO DPA DEL ECUADOR")
+    print("=" * 70)
+
+    dpa = CatalogoDPA.predeterminado()
+    print(f"\nNodos cargados: {len(dpa)}")
+    for entrada in [("MANABI", "MANTA", "MANTA"), ("Manabí", "Bolívar", "Calceta"),
+                    ("santo domingo", "Santo Domingo", "Santo Domingo"), ("Bolivar", "Manta", None)]:
+        print(f"{str(entrada):<50} -> {dpa.resolver(*entrada)}")
+
+    generador = random.Random(17)
+    cantones = list(dpa.hijos(13).values())
+    entradas = [("manabi", generador.choice(cantones).lower()) for _ in range(200_000)]
+    inicio = time.perf_counter()
+    codigos = [dpa.resolver(p, c).canton for p, c in entradas]
+    print(f"\n{len(entradas):,} ubicaciones resueltas en {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+    if np is not None:
+        arreglo = np.array(codigos, dtype=np.int32)
+        por_canton = np.unique(arreglo, return_counts=True)
+        provincias = CatalogoDPA.a_nivel(arreglo, 'provincia')
+        print(f"Cantones distintos: {len(por_canton[0])} | provincias: {np.unique(provincias).tolist()}")
+    print("=" * 70)
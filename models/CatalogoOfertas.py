@@ -0,0 +1,217 @@
+"""
+Módulo: CatalogoOfertas
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Catálogo de ofertas (OfertaCarrera) con índices hash:
+      - carrera_id (una carrera puede ofertarse en varias sedes/jornadas),
+      - ofa_id y cus_id (únicos),
+      - índice compuesto sobre (sede_id, jornada, modalidad, nivel) que
+        responde en O(1) cualquier combinación de esos filtros.
+    Incluye una carga masiva desde filas del PDF SENESCYT (mismo formato de
+    OfertaCarrera.crear_desde_pdf_uleam) sin impresiones por oferta.
+"""
+
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import models.Categorias as Categorias
+from models.ofertaCarrera import OfertaCarrera
+
+
+class CatalogoOfertas:
+    """Ofertas del periodo indexadas por identificador y por atributos."""
+
+    CAMPOS_COMPUESTOS = ('sede_id', 'jornada', 'modalidad', 'nivel')
+    # Los filtros de texto se llevan a la etiqueta que guarda OfertaCarrera
+    CATEGORIAS = {'jornada': Categorias.JORNADAS, 'modalidad': Categorias.MODALIDADES,
+                  'nivel': Categorias.NIVELES}
+    CLAVES_CUPOS_PDF = ('CUS_CUPOS_NIVELACION', 'CUS_CUPOS_PRIMER_SEMESTRE', 'CUS_CUPOS_PC')
+
+    def __init__(self, ofertas: Iterable[OfertaCarrera] = ()):
+        self._ofertas: List[OfertaCarrera] = []
+        self._por_carrera: Dict[int, List[OfertaCarrera]] = {}
+        self._por_ofa: Dict[int, OfertaCarrera] = {}
+        self._por_cus: Dict[int, OfertaCarrera] = {}
+        self._compuesto: Dict[Tuple[Tuple[str, ...], tuple], List[OfertaCarrera]] = {}
+        for oferta in ofertas:
+            self.agregar(oferta)
+
+    # ==============================
+    # ALTAS
+    # ==============================
+
+    def agregar(self, oferta: OfertaCarrera) -> None:
+        """
+        Registra una oferta.
+
+        Raises:
+            ValueError: Si el OFA_ID o el CUS_ID ya existen en el catálogo
+        """
+        if oferta.ofa_id in self._por_ofa:
+            raise ValueError(f"OFA_ID duplicado: {oferta.ofa_id}")
+        if oferta.cus_id in self._por_cus:
+            raise ValueError(f"CUS_ID duplicado: {oferta.cus_id}")
+
+        self._ofertas.append(oferta)
+        self._por_carrera.setdefault(oferta.carrera_id, []).append(oferta)
+        self._por_ofa[oferta.ofa_id] = oferta
+        self._por_cus[oferta.cus_id] = oferta
+
+        valores = dict(zip(self.CAMPOS_COMPUESTOS, self._valores(oferta)))
+        for campos in _COMBINACIONES:
+            clave = (campos, tuple(valores[c] for c in campos))
+            self._compuesto.setdefault(clave, []).append(oferta)
+
+    @staticmethod
+    def _valores(oferta: OfertaCarrera) -> tuple:
+        return (oferta.sede_id, oferta.jornada, oferta.modalidad, oferta.nivel)
+
+    def cargar_desde_pdf(self, filas: Iterable[dict]) -> Tuple[List[OfertaCarrera], List[tuple]]:
+        """
+        Carga masiva de filas del PDF ULEAM (claves de crear_desde_pdf_uleam).
+
+        A diferencia de crear_desde_pdf_uleam, no imprime nada y solo aplica
+        configurar_desde_pdf cuando la fila trae el desglose de cupos (si no,
+        se conserva la distribución calculada a partir de CUS_TOTAL_CUPOS).
+
+        Returns:
+            tuple: (ofertas cargadas, rechazos como (posición, fila, motivo))
+        """
+        cargadas = []
+        rechazadas = []
+        for posicion, datos in enumerate(filas):
+            if datos.get('OFA_ID') in self._por_ofa or datos.get('CUS_ID') in self._por_cus:
+                rechazadas.append((posicion, datos, "OFA_ID o CUS_ID duplicado"))
+                continue
+            try:
+                oferta = OfertaCarrera(
+                    carrera_id=datos.get('carrera_id', 0),
+                    nombre_carrera=datos.get('CAR_NOMBRE_CARRERA', 'SIN NOMBRE'),
+                    sede_id=datos.get('sede_id', 0),
+                    nombre_sede=datos.get('PRQ_NOMBRE', 'NO DEFINIDA'),
+                    cupos_total=datos.get('CUS_TOTAL_CUPOS', 0),
+                    nivel=datos.get('NIVEL', 'TERCER NIVEL'),
+                    modalidad=datos.get('MODALIDAD', 'PRESENCIAL'),
+                    jornada=datos.get('JORNADA', 'MATUTINA'),
+                    ofa_id=datos.get('OFA_ID'),
+                    cus_id=datos.get('CUS_ID'),
+                    mostrar=False
+                )
+                if any(clave in datos for clave in self.CLAVES_CUPOS_PDF):
+                    oferta.configurar_desde_pdf(
+                        cupos_nivelacion=datos.get('CUS_CUPOS_NIVELACION', 0),
+                        cupos_primer_semestre=datos.get('CUS_CUPOS_PRIMER_SEMESTRE', 0),
+                        cupos_pc=datos.get('CUS_CUPOS_PC', 0),
+                        tipo_cupo=datos.get('DESCRIPCION_TIPO_CUPO', 'CUPOS_NIVELACION'),
+                        focalizada=datos.get('FOCALIZADA', 'N'),
+                        mostrar=False
+                    )
+                else:
+                    oferta.tipo_cupo = datos.get('DESCRIPCION_TIPO_CUPO', oferta.tipo_cupo)
+                    oferta.focalizada = datos.get('FOCALIZADA', oferta.focalizada)
+                self.agregar(oferta)
+            except (AttributeError, TypeError, ValueError) as error:
+                rechazadas.append((posicion, datos, str(error)))
+                continue
+            cargadas.append(oferta)
+        return cargadas, rechazadas
+
+    # ==============================
+    # CONSULTAS O(1)
+    # ==============================
+
+    def por_carrera(self, carrera_id: int) -> List[OfertaCarrera]:
+        return list(self._por_carrera.get(carrera_id, ()))
+
+    def por_ofa_id(self, ofa_id: int) -> Optional[OfertaCarrera]:
+        return self._por_ofa.get(ofa_id)
+
+    def por_cus_id(self, cus_id: int) -> Optional[OfertaCarrera]:
+        return self._por_cus.get(cus_id)
+
+    def obtener(self, carrera_id: int, sede_id: int,
+                jornada: Optional[str] = None) -> Optional[OfertaCarrera]:
+        """Primera oferta de una carrera en una sede (y jornada, si se indica)."""
+        if jornada is not None:
+            jornada = Categorias.JORNADAS.oficial(jornada)
+            if jornada is None:
+                return None
+        for oferta in self._por_carrera.get(carrera_id, ()):
+            if oferta.sede_id == sede_id and (jornada is None or oferta.jornada == jornada):
+                return oferta
+        return None
+
+    def filtrar(self, sede_id: Optional[int] = None, jornada: Optional[str] = None,
+                modalidad: Optional[str] = None, nivel: Optional[str] = None) -> List[OfertaCarrera]:
+        """
+        Ofertas que cumplen todos los filtros dados (sin filtros = todas).
+        Jornada, modalidad y nivel se aceptan en cualquier escritura
+        ('Híbrida', 'semipresencial'); un valor desconocido no coincide con ninguna.
+        """
+        filtros = {'sede_id': sede_id, 'jornada': jornada, 'modalidad': modalidad, 'nivel': nivel}
+        for campo, categoria in self.CATEGORIAS.items():
+            if filtros[campo]:
+                filtros[campo] = categoria.oficial(filtros[campo])
+                if filtros[campo] is None:
+                    return []
+            else:
+                filtros[campo] = None
+        campos = tuple(c for c in self.CAMPOS_COMPUESTOS if filtros[c] is not None)
+        if not campos:
+            return list(self._ofertas)
+        return list(self._compuesto.get((campos, tuple(filtros[c] for c in campos)), ()))
+
+    def __len__(self) -> int:
+        return len(self._ofertas)
+
+    def __iter__(self) -> Iterator[OfertaCarrera]:
+        return iter(self._ofertas)
+
+    def __getitem__(self, posicion: int) -> OfertaCarrera:
+        return self._ofertas[posicion]
+
+
+# Cada subconjunto no vacío de los campos compuestos tiene su propio índice
+_COMBINACIONES = [combinacion for n in range(1, len(CatalogoOfertas.CAMPOS_COMPUESTOS) + 1)
+                  for combinacion in combinations(CatalogoOfertas.CAMPOS_COMPUESTOS, n)]
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=" * 70)
+    print("PRUEBA: CATÁLOGO DE OFERTAS CON ÍNDICES")
+    print("=" * 70)
+
+    generador = random.Random(3)
+    filas = [{
+        'carrera_id': 100 + i % 300,
+        'CAR_NOMBRE_CARRERA': f"CARRERA {i % 300}",
+        'sede_id': i % 9 + 1,
+        'PRQ_NOMBRE': f"SEDE {i % 9 + 1}",
+        'NIVEL': generador.choice(OfertaCarrera.NIVELES),
+        'MODALIDAD': generador.choice(OfertaCarrera.MODALIDADES),
+        'JORNADA': generador.choice(OfertaCarrera.JORNADAS),
+        'CUS_TOTAL_CUPOS': 40,
+        'CUS_CUPOS_NIVELACION': 38,
+        'CUS_CUPOS_PC': 2,
+        'OFA_ID': 240000 + i,
+        'CUS_ID': 340000 + i,
+    } for i in range(5000)]
+
+    catalogo = CatalogoOfertas()
+    inicio = time.perf_counter()
+    cargadas, rechazadas = catalogo.cargar_desde_pdf(filas)
+    print(f"\nCargadas: {len(cargadas):,} | Rechazadas: {len(rechazadas)} "
+          f"en {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    inicio = time.perf_counter()
+    resultado = catalogo.filtrar(sede_id=1, jornada='matutina', modalidad='presencial')
+    print(f"Sede 1 + matutina + presencial: {len(resultado)} ofertas "
+          f"({(time.perf_counter() - inicio) * 1e6:.0f} µs)")
+    print(f"OFA_ID 240123: {catalogo.por_ofa_id(240123)}")
+    print(f"Ofertas de la carrera 105: {len(catalogo.por_carrera(105))}")
+    print("=" * 70)
@@ -0,0 +1,184 @@
+"""
+Módulo: Categorias
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Capa categórica compartida por los modelos: jornada, modalidad, nivel,
+    tipo de evaluación, estados, sexo/género y segmentos de cupos.
+      - Cada valor tiene un código entero pequeño y una etiqueta internada.
+      - La validación es una búsqueda en dict sobre la forma plegada
+        (sin tildes ni mayúsculas): "Matutina", "MATUTINA" y "matutina" son
+        el mismo valor.
+      - vista() deriva un subconjunto o la escritura en minúsculas sin cambiar
+        los códigos: OfertaCarrera guarda 'MATUTINA' e Inscripcion 'matutina',
+        pero ambas codifican 0.
+"""
+
+import sys
+from collections.abc import Sequence
+from typing import Dict, Iterable, Optional, Tuple
+
+from models.Normalizacion import plegar_acentos
+
+
+class Categoria(Sequence):
+    """
+    Conjunto cerrado de etiquetas. Se comporta como una tupla de etiquetas
+    (iteración, índice, len, 'in') y agrega codificar/etiqueta/normalizar.
+    """
+
+    __slots__ = ('nombre', '_etiquetas', '_codigos', '_por_clave', '_por_texto', '_por_codigo')
+
+    # Escrituras exactas ya vistas que se recuerdan (sin plegar de nuevo)
+    MAX_ESCRITURAS = 1024
+
+    def __init__(self, nombre: str, etiquetas: Iterable[str],
+                 alias: Optional[Dict[str, str]] = None, codigos: Optional[Iterable[int]] = None):
+        """
+        Args:
+            nombre: Nombre para los mensajes de error ("jornada")
+            etiquetas: Valores en su escritura oficial
+            alias: Otras formas aceptadas -> etiqueta oficial
+            codigos: Código de cada etiqueta (por defecto 0, 1, 2...)
+        """
+        self.nombre = nombre
+        self._etiquetas: Tuple[str, ...] = tuple(sys.intern(e) for e in etiquetas)
+        self._codigos: Tuple[int, ...] = (tuple(codigos) if codigos is not None
+                                          else tuple(range(len(self._etiquetas))))
+        if len(self._codigos) != len(self._etiquetas):
+            raise ValueError("Debe haber un código por etiqueta")
+
+        self._por_codigo: Dict[int, str] = dict(zip(self._codigos, self._etiquetas))
+        self._por_clave: Dict[str, int] = {}
+        for codigo, etiqueta in zip(self._codigos, self._etiquetas):
+            self._por_clave[plegar_acentos(etiqueta)] = codigo
+        for variante, etiqueta in (alias or {}).items():
+            clave = plegar_acentos(etiqueta)
+            if clave in self._por_clave:
+                self._por_clave.setdefault(plegar_acentos(variante), self._por_clave[clave])
+        self._por_texto: Dict[str, int] = dict(zip(self._etiquetas, self._codigos))
+
+    # ==============================
+    # CODIFICACIÓN O(1)
+    # ==============================
+
+    def buscar(self, valor) -> Optional[int]:
+        """Código de un valor (texto en cualquier escritura o código), o None."""
+        if isinstance(valor, str):
+            codigo = self._por_texto.get(valor)
+            if codigo is None:
+                codigo = self._por_clave.get(plegar_acentos(valor.strip()))
+                if codigo is not None and len(self._por_texto) < self.MAX_ESCRITURAS:
+                    self._por_texto[valor] = codigo
+            return codigo
+        return valor if valor in self._por_codigo else None
+
+    def codificar(self, valor) -> int:
+        """
+        Código de un valor.
+
+        Raises:
+            ValueError: Si el valor no pertenece a la categoría
+        """
+        codigo = self.buscar(valor)
+        if codigo is None:
+            raise ValueError(f"Valor de {self.nombre} inválido: {valor!r}. "
+                             f"Debe ser: {', '.join(self._etiquetas)}.")
+        return codigo
+
+    def etiqueta(self, codigo: int) -> str:
+        """Etiqueta oficial (internada) de un código."""
+        try:
+            return self._por_codigo[codigo]
+        except KeyError:
+            raise ValueError(f"Código de {self.nombre} inválido: {codigo}") from None
+
+    def oficial(self, valor) -> Optional[str]:
+        """Etiqueta oficial de un valor escrito de cualquier forma, o None (sin error)."""
+        codigo = self.buscar(valor)
+        return None if codigo is None else self._por_codigo[codigo]
+
+    def normalizar(self, valor) -> str:
+        """Etiqueta oficial de un valor escrito de cualquier forma (valida)."""
+        return self._por_codigo[self.codificar(valor)]
+
+    @property
+    def codigos(self) -> Tuple[int, ...]:
+        return self._codigos
+
+    def vista(self, etiquetas: Optional[Iterable[str]] = None, minusculas: bool = False,
+              nombre: Optional[str] = None) -> 'Categoria':
+        """
+        Subconjunto de la categoría (o toda) con los mismos códigos,
+        opcionalmente escrito en minúsculas.
+        """
+        codigos = (self._codigos if etiquetas is None
+                   else tuple(self.codificar(e) for e in etiquetas))
+        textos = [self._por_codigo[c] for c in codigos]
+        if minusculas:
+            textos = [t.lower() for t in textos]
+        return Categoria(nombre or self.nombre, textos, codigos=codigos)
+
+    # ==============================
+    # PROTOCOLO DE SECUENCIA
+    # ==============================
+
+    def __getitem__(self, posicion):
+        return self._etiquetas[posicion]
+
+    def __len__(self) -> int:
+        return len(self._etiquetas)
+
+    def __iter__(self):
+        return iter(self._etiquetas)
+
+    def __contains__(self, valor) -> bool:
+        return self.buscar(valor) is not None
+
+    def __repr__(self) -> str:
+        return f"Categoria({self.nombre!r}, {list(self._etiquetas)})"
+
+
+# ==============================
+# CATEGORÍAS DEL SISTEMA
+# ==============================
+
+JORNADAS = Categoria('jornada', ('MATUTINA', 'VESPERTINA', 'NOCTURNA', 'NO APLICA JORNADA'))
+# Las inscripciones y evaluaciones solo usan jornadas con horario y se escriben en minúsculas
+JORNADAS_EVALUACION = JORNADAS.vista(('MATUTINA', 'VESPERTINA', 'NOCTURNA'), minusculas=True)
+
+MODALIDADES = Categoria('modalidad', ('PRESENCIAL', 'HIBRIDA', 'SEMI-PRESENCIAL', 'DISTANCIA'),
+                        alias={'SEMIPRESENCIAL': 'SEMI-PRESENCIAL', 'EN LINEA': 'DISTANCIA'})
+NIVELES = Categoria('nivel', ('TERCER NIVEL', 'TERCER NIVEL TECNOLÓGICO SUPERIOR'),
+                    alias={'TECNOLOGICO SUPERIOR': 'TERCER NIVEL TECNOLÓGICO SUPERIOR'})
+TIPOS_EVALUACION = Categoria('tipo de evaluación', ('practico', 'escrito'))
+
+ESTADOS_INSCRIPCION = Categoria('estado de inscripción', ('ACTIVA', 'CANCELADA', 'COMPLETADA'))
+ESTADOS_EVALUACION = Categoria('estado de evaluación',
+                               ('PROGRAMADA', 'COMPLETADA', 'REPROGRAMADA', 'CANCELADA'))
+ESTADOS_ASIGNACION = Categoria('estado de asignación', ('PENDIENTE', 'CONFIRMADA', 'RECHAZADA', 'EXPIRADA'))
+ESTADOS_POSTULANTE = Categoria('estado de postulante', ('VERIFICADO', 'PENDIENTE', 'RECHAZADO'))
+
+SEXOS = Categoria('sexo', ('HOMBRE', 'MUJER'))
+GENEROS = Categoria('género', ('MASCULINO', 'FEMENINO'))  # mismo código que SEXOS
+
+SEGMENTOS = Categoria('segmento', ('CUOTAS', 'VULNERABILIDAD', 'MERITO_ACADEMICO', 'RECONOCIMIENTOS',
+                                   'PUEBLOS_NACIONALIDADES', 'BACHILLERES', 'GENERAL'),
+                      alias={'MERITO': 'MERITO_ACADEMICO'})
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    print("=" * 70)
+    print("PRUEBA: CATEGORÍAS CON CÓDIGOS ENTEROS")
+    print("=" * 70)
+
+    for valor in ("Matutina", "NOCTURNA", "vespertina "):
+        print(f"{valor!r:<15} -> código {JORNADAS.codificar(valor)} | oferta "
+              f"{JORNADAS.normalizar(valor)!r} | inscripción {JORNADAS_EVALUACION.normalizar(valor)!r}")
+    print(f"'hibrida' en MODALIDADES: {'hibrida' in MODALIDADES}")
+    print(f"'tecnologico superior' -> {NIVELES.normalizar('tecnologico superior')}")
+
+    etiquetas = [JORNADAS_EVALUACION.normalizar(v) for v in ["Matutina", "MATUTINA", " matutina"] * 1000]
+    print(f"\n3.000 escrituras -> {len({id(e) for e in etiquetas})} objeto(s) en memoria")
+    print("=" * 70)
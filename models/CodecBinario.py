@@ -0,0 +1,307 @@
+"""
+Módulo: CodecBinario
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Codificación binaria compacta de los modelos (según models.Esquemas) para
+    enviarlos entre procesos sin serializar __dict__ completos.
+      - Cada objeto: etiqueta del modelo, mapa de bits de nulos y después solo
+        los campos con valor.
+      - Enteros (IDs incluidos) y fechas como varint zigzag: 1-3 bytes para
+        la mayoría de IDs; decimales como double (struct); textos con largo
+        varint + UTF-8.
+      - En lote los textos se guardan una vez en un diccionario y cada campo
+        lleva solo su código ('NO', 'MANABÍ', 'ACTIVA'... ocupan 1 byte).
+    Las relaciones entre objetos (Inscripcion._evaluacion, listas del
+    Postulante) no viajan: se restauran vacías, igual que en una copia aislada.
+"""
+
+import json
+import struct
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Iterable, List, Optional, Tuple
+
+from models.Esquemas import ESQUEMAS, Esquema
+
+
+VERSION = 1
+EPOCA = datetime(1970, 1, 1)
+MICROSEGUNDO = timedelta(microseconds=1)
+_DOUBLE = struct.Struct('<d')
+
+# Tipos de campo como enteros para no comparar cadenas en cada valor
+_ENTERO, _DECIMAL, _FECHA_HORA, _TEXTO, _JSON = range(5)
+_CODIGOS_TIPO = {'entero': _ENTERO, 'decimal': _DECIMAL, 'fecha_hora': _FECHA_HORA,
+                 'texto': _TEXTO, 'json': _JSON}
+
+
+# ==============================
+# VARINTS
+# ==============================
+
+def escribir_varint(salida: bytearray, numero: int) -> None:
+    """Entero sin signo en grupos de 7 bits (el bit alto indica que sigue otro byte)."""
+    while numero > 0x7F:
+        salida.append((numero & 0x7F) | 0x80)
+        numero >>= 7
+    salida.append(numero)
+
+
+def leer_varint(datos, posicion: int) -> Tuple[int, int]:
+    """Devuelve (numero, posición siguiente)."""
+    numero = desplazamiento = 0
+    while True:
+        byte = datos[posicion]
+        posicion += 1
+        numero |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            return numero, posicion
+        desplazamiento += 7
+
+
+def _zigzag(numero: int) -> int:
+    return numero * 2 if numero >= 0 else -numero * 2 - 1
+
+
+def _deszigzag(numero: int) -> int:
+    return numero >> 1 if not numero & 1 else -(numero >> 1) - 1
+
+
+# ==============================
+# CODEC
+# ==============================
+
+class CodecBinario:
+    """Codificador/decodificador de objetos de los modelos con esquema."""
+
+    def __init__(self):
+        self._esquemas: List[Esquema] = list(ESQUEMAS.values())
+        self._tipos = [tuple(_CODIGOS_TIPO[c.tipo] for c in e.campos) for e in self._esquemas]
+        self._nombres = [tuple(c.nombre for c in e.campos) for e in self._esquemas]
+        self._por_clase = {e.clase: (etiqueta, e, attrgetter(*self._nombres[etiqueta]))
+                           for etiqueta, e in enumerate(self._esquemas)}
+
+    def _esquema_de(self, objeto) -> tuple:
+        datos = self._por_clase.get(type(objeto))
+        if datos is None:
+            raise ValueError(f"No hay esquema para {type(objeto).__name__}")
+        return datos
+
+    # ---------- codificación ----------
+
+    def _escribir_objeto(self, salida: bytearray, objeto, textos: Optional[dict]) -> None:
+        etiqueta, esquema, lector = self._esquema_de(objeto)
+        try:
+            valores = lector(objeto)
+        except AttributeError:
+            valores = tuple(getattr(objeto, c.nombre, None) for c in esquema.campos)
+
+        nulos = 0
+        for posicion, valor in enumerate(valores):
+            if valor is None:
+                nulos |= 1 << posicion
+        escribir_varint(salida, etiqueta)
+        salida += nulos.to_bytes((len(valores) + 7) // 8, 'little')
+
+        for tipo, valor, campo in zip(self._tipos[etiqueta], valores, esquema.campos):
+            if valor is None:
+                continue
+            try:
+                if tipo == _TEXTO or tipo == _JSON:
+                    if tipo == _JSON:
+                        valor = json.dumps(valor, sort_keys=True, separators=(',', ':'))
+                    elif type(valor) is not str:
+                        raise TypeError("se esperaba texto")
+                    if textos is None:
+                        codificado = valor.encode('utf-8')
+                        escribir_varint(salida, len(codificado))
+                        salida += codificado
+                        continue
+                    numero = textos.get(valor)
+                    if numero is None:
+                        numero = textos[valor] = len(textos)
+                elif tipo == _ENTERO:
+                    numero = _zigzag(valor.__index__())
+                elif tipo == _DECIMAL:
+                    salida += _DOUBLE.pack(valor)
+                    continue
+                else:
+                    numero = _zigzag((valor - EPOCA) // MICROSEGUNDO)
+            except (TypeError, AttributeError, struct.error) as error:
+                raise ValueError(f"Valor inválido en {esquema.tabla}.{campo.nombre} "
+                                 f"({campo.tipo}): {error}") from None
+            if numero < 0x80:
+                salida.append(numero)
+            else:
+                escribir_varint(salida, numero)
+
+    def codificar(self, objeto) -> bytes:
+        """Un objeto con sus textos en línea."""
+        salida = bytearray()
+        self._escribir_objeto(salida, objeto, None)
+        return bytes(salida)
+
+    def codificar_lote(self, objetos: Iterable) -> bytes:
+        """
+        Varios objetos (de cualquier modelo) con un diccionario de textos común:
+        versión, cantidad, diccionario y objetos.
+        """
+        cuerpo = bytearray()
+        textos: dict = {}
+        cantidad = 0
+        for objeto in objetos:
+            self._escribir_objeto(cuerpo, objeto, textos)
+            cantidad += 1
+
+        salida = bytearray([VERSION])
+        escribir_varint(salida, cantidad)
+        escribir_varint(salida, len(textos))
+        for texto in textos:
+            codificado = texto.encode('utf-8')
+            escribir_varint(salida, len(codificado))
+            salida += codificado
+        salida += cuerpo
+        return bytes(salida)
+
+    # ---------- decodificación ----------
+
+    def _leer_objeto(self, datos, posicion: int, textos: Optional[list]) -> tuple:
+        etiqueta, posicion = leer_varint(datos, posicion)
+        if etiqueta >= len(self._esquemas):
+            raise ValueError(f"Modelo desconocido en los datos: {etiqueta}")
+        esquema = self._esquemas[etiqueta]
+        largo_mapa = (len(esquema.campos) + 7) // 8
+        nulos = int.from_bytes(datos[posicion:posicion + largo_mapa], 'little')
+        posicion += largo_mapa
+
+        nombres = self._nombres[etiqueta]
+        valores = dict.fromkeys(nombres)
+        for nombre, tipo in zip(nombres, self._tipos[etiqueta]):
+            if nulos & 1:
+                nulos >>= 1
+                continue
+            nulos >>= 1
+            if tipo == _DECIMAL:
+                valores[nombre] = _DOUBLE.unpack_from(datos, posicion)[0]
+                posicion += 8
+                continue
+            numero = datos[posicion]
+            if numero < 0x80:
+                posicion += 1
+            else:
+                numero, posicion = leer_varint(datos, posicion)
+            if tipo == _TEXTO:
+                if textos is None:
+                    valores[nombre] = str(datos[posicion:posicion + numero], 'utf-8')
+                    posicion += numero
+                else:
+                    valores[nombre] = textos[numero]
+            elif tipo == _ENTERO:
+                valores[nombre] = numero >> 1 if not numero & 1 else -(numero >> 1) - 1
+            elif tipo == _FECHA_HORA:
+                valores[nombre] = EPOCA + timedelta(microseconds=_deszigzag(numero))
+            else:
+                if textos is None:
+                    texto = str(datos[posicion:posicion + numero], 'utf-8')
+                    posicion += numero
+                else:
+                    texto = textos[numero]
+                valores[nombre] = json.loads(texto)
+        return esquema.nuevo(valores), posicion
+
+    def decodificar(self, datos: bytes):
+        """
+        Objeto codificado con codificar().
+
+        Raises:
+            ValueError: Si los datos no corresponden a un objeto completo
+        """
+        try:
+            objeto, posicion = self._leer_objeto(datos, 0, None)
+        except (IndexError, struct.error, UnicodeDecodeError) as error:
+            raise ValueError(f"Datos binarios incompletos o dañados: {error}") from None
+        if posicion > len(datos):
+            raise ValueError("Datos binarios incompletos")
+        if posicion < len(datos):
+            raise ValueError("Sobran bytes después del objeto")
+        return objeto
+
+    def decodificar_lote(self, datos: bytes) -> list:
+        """Objetos codificados con codificar_lote(), en el mismo orden."""
+        datos = memoryview(datos)
+        try:
+            if datos[0] != VERSION:
+                raise ValueError(f"Versión de lote no compatible: {datos[0]}")
+            cantidad, posicion = leer_varint(datos, 1)
+            total_textos, posicion = leer_varint(datos, posicion)
+            textos = []
+            for _ in range(total_textos):
+                largo, posicion = leer_varint(datos, posicion)
+                textos.append(str(datos[posicion:posicion + largo], 'utf-8'))
+                posicion += largo
+            objetos = []
+            for _ in range(cantidad):
+                objeto, posicion = self._leer_objeto(datos, posicion, textos)
+                objetos.append(objeto)
+        except (IndexError, struct.error, UnicodeDecodeError) as error:
+            raise ValueError(f"Datos binarios incompletos o dañados: {error}") from None
+        if posicion > len(datos):
+            raise ValueError("Datos binarios incompletos")
+        if posicion < len(datos):
+            raise ValueError("Sobran bytes después del lote")
+        return objetos
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import pickle
+    import random
+    import time
+    from models.Asignacion import Asignacion
+    from models.Inscripcion import Inscripcion
+    from models.RegistroNacional import RegistroNacional
+
+    print("=" * 70)
+    print("PRUEBA: CODEC BINARIO FRENTE A PICKLE Y JSON")
+    print("=" * 70)
+
+    generador = random.Random(3)
+    cantidad = 20_000
+    cohorte = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(cantidad):
+            cedula = f"13{i:08d}"
+            registro = RegistroNacional(cedula, "NOMBRES", "APELLIDOS")
+            registro.completar_datos_personales("2007-05-15", generador.choice(["HOMBRE", "MUJER"]), "MESTIZO")
+            registro.completar_ubicacion("MANABI", generador.choice(["MANTA", "CHONE", "JIPIJAPA"]), "", "", "")
+            registro.completar_datos_academicos("U.E. MANTA", "FISCAL", round(generador.uniform(7, 10), 2), "NO")
+            inscripcion = Inscripcion(i + 1, 101, 1, 1, "matutina", cedula, evaluacion_diferida=True)
+            asignacion = Asignacion(i + 1, 101, 1, round(generador.uniform(600, 1000), 1), cedula)
+            cohorte.extend((registro, inscripcion, asignacion))
+
+    codec = CodecBinario()
+    copias = [{k: v for k, v in vars(o).items() if not k.startswith('_')} for o in cohorte]
+
+    def medir(nombre, codificar, decodificar):
+        inicio = time.perf_counter()
+        datos = codificar()
+        medio = time.perf_counter()
+        decodificar(datos)
+        fin = time.perf_counter()
+        tamano = sum(map(len, datos)) if isinstance(datos, list) else len(datos)
+        print(f"{nombre:<18} {tamano / 1e6:6.2f} MB | codificar {(medio - inicio) * 1000:6.0f} ms "
+              f"| decodificar {(fin - medio) * 1000:6.0f} ms")
+
+    print(f"\nCohorte: {cantidad:,} registros + inscripciones + asignaciones")
+    medir("pickle (objetos)", lambda: pickle.dumps(cohorte, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)
+    medir("json (__dict__)", lambda: json.dumps(copias, default=str).encode(), json.loads)
+    medir("codec por objeto", lambda: [codec.codificar(o) for o in cohorte],
+          lambda partes: [codec.decodificar(p) for p in partes])
+    medir("codec en lote", lambda: codec.codificar_lote(cohorte), codec.decodificar_lote)
+
+    copia = codec.decodificar_lote(codec.codificar_lote(cohorte[:3]))
+    print(f"\nIda y vuelta igual: {all(vars(a) == vars(b) for a, b in zip(cohorte[:3], copia))}")
+    print("=" * 70)
@@ -0,0 +1,381 @@
+"""
+Módulo: DespachadorNotificaciones
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Envío asíncrono de notificaciones (confirmación de inscripción, aviso de
+    asignación) sobre cualquier InterfazEmail de PRINCIPIOSOLIDD5:
+      - Cola de salida acotada: quien notifica nunca espera al servidor de correo.
+      - Lotes: cada trabajador toma hasta 'tamano_lote' mensajes y, si el
+        servicio lo permite (enviar_lote), los manda por una sola conexión.
+      - Varios trabajadores (hilos) en paralelo.
+      - Reintentos con backoff exponencial y jitter; los que agotan los
+        intentos, o reciben un rechazo permanente (5xx), quedan en 'fallidas'.
+    El propio despachador implementa InterfazEmail, así que puede inyectarse
+    donde hoy se inyecta ServicioGmail u otro servicio.
+"""
+
+import heapq
+import queue
+import random
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from typing import List, Optional, Sequence, Tuple
+
+from models.PRINCIPIOSOLIDD5 import InterfazEmail
+
+
+# ==============================
+# SERVICIO SMTP REAL
+# ==============================
+
+def es_error_permanente(error: Exception) -> bool:
+    """True si el servidor rechazó el mensaje con un código 5xx (reintentar no sirve)."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return bool(error.recipients) and all(500 <= codigo < 600
+                                              for codigo, _ in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and 500 <= error.smtp_code < 600
+
+
+class ServicioSMTP(InterfazEmail):
+    """
+    Envía correos con smtplib. Cada hilo mantiene su propia conexión abierta
+    y la reutiliza entre lotes (se reconecta si el servidor la cierra).
+    """
+
+    def __init__(self, host: str = "localhost", puerto: int = 25,
+                 remitente: str = "admision@uleam.edu.ec",
+                 asunto: str = "Sistema de Admision ULEAM",
+                 usuario: Optional[str] = None, clave: Optional[str] = None,
+                 usar_tls: bool = False, tiempo_espera: float = 10.0):
+        self.host = host
+        self.puerto = puerto
+        self.remitente = remitente
+        self.asunto = asunto
+        self.usuario = usuario
+        self.clave = clave
+        self.usar_tls = usar_tls
+        self.tiempo_espera = tiempo_espera
+        self._local = threading.local()
+        self._abiertas: List[smtplib.SMTP] = []
+        self._candado = threading.Lock()
+
+    def _conexion(self) -> smtplib.SMTP:
+        conexion = getattr(self._local, 'conexion', None)
+        if conexion is None:
+            conexion = smtplib.SMTP(self.host, self.puerto, timeout=self.tiempo_espera)
+            if self.usar_tls:
+                conexion.starttls()
+            if self.usuario:
+                conexion.login(self.usuario, self.clave or "")
+            self._local.conexion = conexion
+            with self._candado:
+                self._abiertas.append(conexion)
+        return conexion
+
+    def _descartar_conexion(self) -> None:
+        conexion = getattr(self._local, 'conexion', None)
+        self._local.conexion = None
+        if conexion is not None:
+            with self._candado:
+                self._abiertas.remove(conexion)
+            try:
+                conexion.close()
+            except OSError:
+                pass
+
+    def _mensaje(self, email: str, texto: str) -> EmailMessage:
+        mensaje = EmailMessage()
+        mensaje['From'] = self.remitente
+        mensaje['To'] = email
+        mensaje['Subject'] = self.asunto
+        mensaje.set_content(texto)
+        return mensaje
+
+    def enviar_confirmacion(self, email, mensaje):
+        """Envía un solo correo (lanza la excepción de smtplib si falla)."""
+        fallidos = self.enviar_lote([(email, mensaje)])
+        if fallidos:
+            raise fallidos[0][1]
+
+    def enviar_lote(self, mensajes: Sequence[Tuple[str, str]]) -> List[Tuple[int, Exception]]:
+        """
+        Envía varios correos por la misma conexión.
+
+        Returns:
+            list: (posición, error) de los mensajes que no se pudieron enviar
+        """
+        fallidos = []
+        for posicion, (email, texto) in enumerate(mensajes):
+            try:
+                self._conexion().send_message(self._mensaje(email, texto))
+            except (smtplib.SMTPServerDisconnected, ConnectionError) as error:
+                # Conexión caída: se descarta y el resto del lote usa una nueva
+                self._descartar_conexion()
+                fallidos.append((posicion, error))
+            except smtplib.SMTPException as error:
+                # Respuesta de error del servidor (destinatario rechazado, 4xx/5xx):
+                # la conexión sigue sirviendo (smtplib ya envió RSET)
+                fallidos.append((posicion, error))
+            except OSError as error:
+                # Tiempo agotado u otro error de red: el estado de la sesión es incierto
+                self._descartar_conexion()
+                fallidos.append((posicion, error))
+        return fallidos
+
+    def cerrar(self) -> None:
+        """Cierra las conexiones abiertas por todos los hilos."""
+        with self._candado:
+            abiertas, self._abiertas = self._abiertas, []
+        self._local = threading.local()
+        for conexion in abiertas:
+            try:
+                conexion.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+
+# ==============================
+# DESPACHADOR
+# ==============================
+
+class Notificacion:
+    """Mensaje pendiente en la cola de salida."""
+
+    __slots__ = ('email', 'mensaje', 'intentos')
+
+    def __init__(self, email: str, mensaje: str):
+        self.email = email
+        self.mensaje = mensaje
+        self.intentos = 0
+
+
+class DespachadorNotificaciones(InterfazEmail):
+    """
+    Cola de salida con trabajadores, lotes y reintentos.
+
+    Uso:
+        despachador = DespachadorNotificaciones(ServicioSMTP("smtp.uleam.edu.ec"))
+        despachador.iniciar()
+        despachador.enviar_confirmacion(email, mensaje)   # no bloquea
+        despachador.detener()                             # espera a vaciar la cola
+    """
+
+    def __init__(self, servicio_email: InterfazEmail, tamano_cola: int = 100_000,
+                 tamano_lote: int = 100, trabajadores: int = 4, max_intentos: int = 5,
+                 espera_base: float = 0.5, espera_maxima: float = 60.0,
+                 espera_encolar: float = 0.0):
+        if tamano_lote < 1 or trabajadores < 1 or max_intentos < 1:
+            raise ValueError("tamano_lote, trabajadores y max_intentos deben ser mayores a 0")
+
+        self.servicio_email = servicio_email
+        self.tamano_lote = tamano_lote
+        self.num_trabajadores = trabajadores
+        self.max_intentos = max_intentos
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+        self.espera_encolar = espera_encolar
+
+        self._cola: 'queue.Queue[Optional[Notificacion]]' = queue.Queue(maxsize=tamano_cola)
+        self._reintentos: List[tuple] = []  # heap de (momento, secuencia, notificacion)
+        self._secuencia = 0
+        self._condicion = threading.Condition()
+        self._pendientes = 0
+        self._activo = False
+        self._hilos: List[threading.Thread] = []
+
+        self.fallidas: List[Tuple[Notificacion, Exception]] = []
+        self.estadisticas = {'encoladas': 0, 'enviadas': 0, 'reintentos': 0,
+                             'fallidas': 0, 'rechazadas': 0, 'lotes': 0}
+
+    # ==============================
+    # CICLO DE VIDA
+    # ==============================
+
+    def iniciar(self) -> 'DespachadorNotificaciones':
+        if self._activo:
+            return self
+        self._activo = True
+        self._hilos = [threading.Thread(target=self._trabajador, name=f"notificador-{i}", daemon=True)
+                       for i in range(self.num_trabajadores)]
+        self._hilos.append(threading.Thread(target=self._programador, name="notificador-reintentos",
+                                            daemon=True))
+        for hilo in self._hilos:
+            hilo.start()
+        return self
+
+    def esperar_vaciado(self, tiempo_maximo: Optional[float] = None) -> bool:
+        """Espera a que se envíen (o fallen definitivamente) todos los mensajes."""
+        with self._condicion:
+            return self._condicion.wait_for(lambda: self._pendientes == 0, tiempo_maximo)
+
+    def detener(self, esperar: bool = True, tiempo_maximo: Optional[float] = None) -> None:
+        """Detiene los trabajadores; por defecto antes vacía la cola."""
+        if not self._activo:
+            return
+        if esperar:
+            self.esperar_vaciado(tiempo_maximo)
+        self._activo = False
+        with self._condicion:
+            self._condicion.notify_all()
+        for _ in range(self.num_trabajadores):
+            self._cola.put(None)
+        for hilo in self._hilos:
+            hilo.join()
+        self._hilos = []
+        cerrar = getattr(self.servicio_email, 'cerrar', None)
+        if cerrar:
+            cerrar()
+
+    # ==============================
+    # ENCOLAR (InterfazEmail)
+    # ==============================
+
+    def enviar_confirmacion(self, email, mensaje) -> bool:
+        """
+        Encola el mensaje y regresa de inmediato.
+
+        Returns:
+            bool: False si la cola está llena (el mensaje no se encoló)
+        """
+        notificacion = Notificacion(email, mensaje)
+        with self._condicion:
+            self._pendientes += 1
+            self.estadisticas['encoladas'] += 1
+        try:
+            if self.espera_encolar > 0:
+                self._cola.put(notificacion, timeout=self.espera_encolar)
+            else:
+                self._cola.put_nowait(notificacion)
+        except queue.Full:
+            self._terminar(1, encoladas=-1, rechazadas=1)
+            return False
+        return True
+
+    enviar = enviar_confirmacion
+
+    # ==============================
+    # TRABAJADORES
+    # ==============================
+
+    def _tomar_lote(self) -> Optional[List[Notificacion]]:
+        primera = self._cola.get()
+        if primera is None:
+            return None
+        lote = [primera]
+        while len(lote) < self.tamano_lote:
+            try:
+                siguiente = self._cola.get_nowait()
+            except queue.Empty:
+                break
+            if siguiente is None:
+                self._cola.put(None)  # la señal de parada es para otro trabajador
+                break
+            lote.append(siguiente)
+        return lote
+
+    def _trabajador(self) -> None:
+        enviar_lote = getattr(self.servicio_email, 'enviar_lote', None)
+        while True:
+            lote = self._tomar_lote()
+            if lote is None:
+                return
+
+            if enviar_lote is not None:
+                try:
+                    fallidos = enviar_lote([(n.email, n.mensaje) for n in lote])
+                except Exception as error:
+                    fallidos = [(posicion, error) for posicion in range(len(lote))]
+            else:
+                fallidos = []
+                for posicion, notificacion in enumerate(lote):
+                    try:
+                        self.servicio_email.enviar_confirmacion(notificacion.email, notificacion.mensaje)
+                    except Exception as error:
+                        fallidos.append((posicion, error))
+
+            for posicion, error in fallidos:
+                self._reintentar(lote[posicion], error)
+            enviadas = len(lote) - len(fallidos)
+            self._terminar(enviadas, lotes=1, enviadas=enviadas)
+
+    def _reintentar(self, notificacion: Notificacion, error: Exception) -> None:
+        notificacion.intentos += 1
+        if notificacion.intentos >= self.max_intentos or es_error_permanente(error):
+            self.fallidas.append((notificacion, error))
+            self._terminar(1, fallidas=1)
+            return
+
+        # Backoff exponencial con jitter completo
+        espera = min(self.espera_maxima, self.espera_base * (2 ** (notificacion.intentos - 1)))
+        momento = time.monotonic() + random.uniform(0, espera)
+        with self._condicion:
+            self._secuencia += 1
+            heapq.heappush(self._reintentos, (momento, self._secuencia, notificacion))
+            self.estadisticas['reintentos'] += 1
+            self._condicion.notify_all()
+
+    def _programador(self) -> None:
+        """Devuelve a la cola los mensajes cuyo backoff ya venció."""
+        while True:
+            with self._condicion:
+                while self._activo:
+                    ahora = time.monotonic()
+                    if self._reintentos and self._reintentos[0][0] <= ahora:
+                        break
+                    espera = self._reintentos[0][0] - ahora if self._reintentos else None
+                    self._condicion.wait(espera)
+                if not self._activo:
+                    return
+                _, _, notificacion = heapq.heappop(self._reintentos)
+            self._cola.put(notificacion)
+
+    def _terminar(self, cantidad: int, **estadisticas) -> None:
+        """Descuenta mensajes resueltos y actualiza estadísticas bajo el mismo candado."""
+        with self._condicion:
+            for clave, valor in estadisticas.items():
+                self.estadisticas[clave] += valor
+            self._pendientes -= cantidad
+            if cantidad and self._pendientes == 0:
+                self._condicion.notify_all()
+
+    @property
+    def pendientes(self) -> int:
+        return self._pendientes
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    print("=" * 70)
+    print("PRUEBA: DESPACHADOR DE NOTIFICACIONES")
+    print("=" * 70)
+
+    class ServicioSimulado(InterfazEmail):
+        """Servidor de correo simulado: 1 ms por lote y 1% de fallos."""
+
+        def enviar_confirmacion(self, email, mensaje):
+            self.enviar_lote([(email, mensaje)])
+
+        def enviar_lote(self, mensajes):
+            time.sleep(0.001)
+            return [(i, ConnectionError("rechazado")) for i in range(len(mensajes))
+                    if random.random() < 0.01]
+
+    TOTAL = 1_000_000
+    despachador = DespachadorNotificaciones(ServicioSimulado(), tamano_cola=TOTAL,
+                                            tamano_lote=500, espera_base=0.01).iniciar()
+
+    inicio = time.perf_counter()
+    for i in range(TOTAL):
+        despachador.enviar_confirmacion(f"postulante{i}@mail.com", f"Cupo asignado #{i}")
+    encolado = time.perf_counter() - inicio
+    despachador.detener()
+    total = time.perf_counter() - inicio
+
+    print(f"\nNotificaciones: {TOTAL:,}")
+    print(f"Tiempo para encolar: {encolado:.2f} s")
+    print(f"Tiempo hasta vaciar la cola: {total:.2f} s")
+    print(f"Estadísticas: {despachador.estadisticas}")
+    print("=" * 70)
@@ -0,0 +1,219 @@
+"""
+Módulo: DistanciasSedes
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Matriz precalculada cantón × sede con la distancia (km) y el tiempo
+    estimado de viaje (min) desde el centroide de cada cantón hasta cada sede
+    ULEAM, para sugerir sedes y ofertas cercanas al postulante.
+      - Centroides: models/datos/centroides_cantones.csv (cantones de Manabí
+        y Santo Domingo, con su código DPA).
+      - Distancia en línea recta (haversine) multiplicada por un factor de
+        ruta; tiempo con una velocidad media por carretera.
+      - Matrices float32 y orden de sedes por cantón calculados una sola vez:
+        las consultas por RegistroNacional.canton_reside son O(1).
+      - anotar_cohorte() marca una cohorte completa con NumPy.
+"""
+
+import csv
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.Normalizacion import plegar_acentos
+from models.SedeCampus import DatosSede, SedeCampus
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional en el resto del sistema
+    np = None
+
+
+RUTA_CENTROIDES = os.path.join(os.path.dirname(__file__), 'datos', 'centroides_cantones.csv')
+RADIO_TIERRA_KM = 6371.0
+
+
+class DistanciasSedes:
+    """Distancias y tiempos cantón -> sede con el orden de cercanía precalculado."""
+
+    FACTOR_RUTA = 1.3       # las carreteras no van en línea recta
+    VELOCIDAD_KMH = 60.0
+
+    def __init__(self, ruta_centroides: str = RUTA_CENTROIDES):
+        if np is None:
+            raise ImportError("La matriz de distancias requiere NumPy (pip install numpy)")
+
+        self.cantones: List[dict] = []
+        self._por_canton: Dict[str, int] = {}
+        self._por_codigo: Dict[int, int] = {}
+        with open(ruta_centroides, encoding='utf-8', newline='') as archivo:
+            for fila in csv.DictReader(archivo):
+                posicion = len(self.cantones)
+                canton = {'codigo_dpa': int(fila['codigo_dpa']), 'provincia': fila['provincia'],
+                          'canton': fila['canton'], 'cabecera': fila['cabecera'],
+                          'latitud': float(fila['latitud']), 'longitud': float(fila['longitud'])}
+                self.cantones.append(canton)
+                self._por_canton[plegar_acentos(canton['canton'])] = posicion
+                self._por_codigo[canton['codigo_dpa']] = posicion
+
+        # Cada sede se ubica en el centroide de su cantón
+        self.sedes: Tuple[DatosSede, ...] = tuple(
+            SedeCampus.obtener(sede_id) for sede_id in sorted(SedeCampus.SEDES_ULEAM)
+            if plegar_acentos(SedeCampus.obtener(sede_id).canton) in self._por_canton
+        )
+        self._columna = {sede.sede_id: j for j, sede in enumerate(self.sedes)}
+
+        coordenadas = np.radians(np.array([(c['latitud'], c['longitud']) for c in self.cantones]))
+        destinos = coordenadas[[self._por_canton[plegar_acentos(s.canton)] for s in self.sedes]]
+        self.distancias_km = (self._haversine(coordenadas, destinos) * self.FACTOR_RUTA).astype(np.float32)
+        self.tiempos_min = (self.distancias_km / np.float32(self.VELOCIDAD_KMH / 60)).astype(np.float32)
+
+        # Sedes de cada cantón de la más cercana a la más lejana (listas listas para devolver)
+        orden = np.argsort(self.distancias_km, axis=1, kind='stable')
+        self._cercanas: List[List[Tuple[DatosSede, float, float]]] = [
+            [(self.sedes[j], float(self.distancias_km[i, j]), float(self.tiempos_min[i, j]))
+             for j in fila] for i, fila in enumerate(orden.tolist())
+        ]
+        self._mas_cercana = orden[:, 0].astype(np.int8)
+
+    @staticmethod
+    def _haversine(origenes: 'np.ndarray', destinos: 'np.ndarray') -> 'np.ndarray':
+        """Distancias en km entre cada origen y cada destino (coordenadas en radianes)."""
+        lat1, lon1 = origenes[:, 0:1], origenes[:, 1:2]
+        lat2, lon2 = destinos[None, :, 0], destinos[None, :, 1]
+        a = (np.sin((lat2 - lat1) / 2) ** 2
+             + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+        return 2 * RADIO_TIERRA_KM * np.arcsin(np.sqrt(a))
+
+    # ==============================
+    # CONSULTAS O(1)
+    # ==============================
+
+    def indice_canton(self, canton) -> Optional[int]:
+        """Fila del cantón por nombre (sin tildes ni mayúsculas) o por código DPA."""
+        if isinstance(canton, int):
+            return self._por_codigo.get(canton)
+        if not canton:
+            return None
+        return self._por_canton.get(plegar_acentos(canton.strip()))
+
+    def distancia(self, canton, sede_id: int) -> Optional[float]:
+        """Kilómetros estimados por carretera (None si el cantón o la sede no existen)."""
+        fila = self.indice_canton(canton)
+        columna = self._columna.get(sede_id)
+        if fila is None or columna is None:
+            return None
+        return float(self.distancias_km[fila, columna])
+
+    def tiempo_estimado(self, canton, sede_id: int) -> Optional[float]:
+        """Minutos estimados de viaje (None si el cantón o la sede no existen)."""
+        fila = self.indice_canton(canton)
+        columna = self._columna.get(sede_id)
+        if fila is None or columna is None:
+            return None
+        return float(self.tiempos_min[fila, columna])
+
+    def sedes_cercanas(self, canton, limite: Optional[int] = 3) -> List[Tuple[DatosSede, float, float]]:
+        """
+        Sedes ordenadas por cercanía al cantón.
+
+        Returns:
+            list: (DatosSede, km, minutos); vacía si el cantón no está en el archivo
+        """
+        fila = self.indice_canton(canton)
+        if fila is None:
+            return []
+        return self._cercanas[fila][:limite]
+
+    def sedes_cercanas_registro(self, registro, limite: Optional[int] = 3) -> List[Tuple[DatosSede, float, float]]:
+        """Sedes cercanas al cantón donde reside un RegistroNacional (por código DPA si lo tiene)."""
+        return self.sedes_cercanas(getattr(registro, 'codigo_canton', None) or registro.canton_reside, limite)
+
+    def ofertas_cercanas(self, canton, catalogo, limite: Optional[int] = 10,
+                         radio_km: Optional[float] = None, **filtros) -> List[tuple]:
+        """
+        Ofertas de un CatalogoOfertas ordenadas por la distancia de su sede.
+
+        Args:
+            canton: Nombre o código DPA del cantón del postulante
+            catalogo: CatalogoOfertas
+            limite: Máximo de ofertas (None = todas)
+            radio_km: Descarta sedes más lejanas
+            **filtros: jornada, modalidad o nivel (ver CatalogoOfertas.filtrar)
+
+        Returns:
+            list: (OfertaCarrera, km)
+        """
+        resultado = []
+        for sede, km, _ in self.sedes_cercanas(canton, limite=None):
+            if radio_km is not None and km > radio_km:
+                break
+            resultado.extend((oferta, km) for oferta in catalogo.filtrar(sede_id=sede.sede_id, **filtros))
+            if limite is not None and len(resultado) >= limite:
+                return resultado[:limite]
+        return resultado
+
+    # ==============================
+    # COHORTES
+    # ==============================
+
+    def anotar_cohorte(self, registros: Iterable) -> Dict[str, 'np.ndarray']:
+        """
+        Sede más cercana, distancia y tiempo para cada registro de una cohorte.
+
+        Returns:
+            dict: arreglos alineados con los registros: 'sede_id' (0 = cantón
+                  desconocido), 'distancia_km' y 'tiempo_min' (NaN si se desconoce)
+        """
+        filas = np.fromiter((-1 if (i := self.indice_canton(getattr(r, 'codigo_canton', None)
+                                                           or r.canton_reside)) is None else i
+                             for r in registros), dtype=np.int32)
+        conocidas = filas >= 0
+        filas = np.where(conocidas, filas, 0)
+        columnas = self._mas_cercana[filas]
+
+        ids_sede = np.array([s.sede_id for s in self.sedes], dtype=np.int16)
+        sede_id = np.where(conocidas, ids_sede[columnas], 0).astype(np.int16)
+        distancia = np.where(conocidas, self.distancias_km[filas, columnas], np.nan)
+        tiempo = np.where(conocidas, self.tiempos_min[filas, columnas], np.nan)
+        return {'sede_id': sede_id,
+                'distancia_km': distancia.astype(np.float32),
+                'tiempo_min': tiempo.astype(np.float32)}
+
+    @staticmethod
+    def conteo_por_sede(anotacion: Dict[str, 'np.ndarray']) -> Dict[int, int]:
+        """Postulantes de la cohorte por sede más cercana (0 = cantón desconocido)."""
+        conteo = np.bincount(anotacion['sede_id'])
+        return {sede_id: int(total) for sede_id, total in enumerate(conteo) if total}
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import random
+    import time
+    from types import SimpleNamespace
+
+    print("=" * 70)
+    print("PRUEBA: MATRIZ DE DISTANCIAS CANTÓN × SEDE")
+    print("=" * 70)
+
+    distancias = DistanciasSedes()
+    print(f"\nMatriz: {distancias.distancias_km.shape[0]} cantones × "
+          f"{distancias.distancias_km.shape[1]} sedes ({distancias.distancias_km.nbytes} bytes)")
+
+    for canton in ("Jipijapa", "PEDERNALES", "Puerto López"):
+        cercanas = ", ".join(f"{s.nombre} {km:.0f} km/{minutos:.0f} min"
+                             for s, km, minutos in distancias.sedes_cercanas(canton))
+        print(f"{canton:<14} -> {cercanas}")
+
+    generador = random.Random(13)
+    cantones = [c['canton'] for c in distancias.cantones] + ["DESCONOCIDO"]
+    cohorte = [SimpleNamespace(canton_reside=generador.choice(cantones)) for _ in range(300_000)]
+    inicio = time.perf_counter()
+    anotacion = distancias.anotar_cohorte(cohorte)
+    duracion = time.perf_counter() - inicio
+    print(f"\nCohorte de {len(cohorte):,} anotada en {duracion * 1000:.0f} ms")
+    print(f"Distancia media a la sede más cercana: {np.nanmean(anotacion['distancia_km']):.1f} km")
+    print(f"Por sede más cercana: {distancias.conteo_por_sede(anotacion)}")
+    print(f"Manta -> sede Chone: {distancias.distancia('Manta', 2):.1f} km, "
+          f"{distancias.tiempo_estimado('Manta', 2):.0f} min")
+    print("=" * 70)
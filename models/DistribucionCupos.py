@@ -0,0 +1,191 @@
+"""
+Módulo: DistribucionCupos
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Reparto de cupos por segmento para todas las ofertas a la vez con NumPy.
+      - CUOTAS: porcentaje mínimo de la política (5%, al menos 1 cupo).
+      - El resto se divide entre VULNERABILIDAD, MERITO_ACADEMICO, GENERAL
+        (20/30/50 por defecto) y, si la política lo indica, los demás segmentos.
+      - Método del resto mayor: los cupos que sobran al truncar se entregan a
+        los segmentos con mayor fracción, así la suma por oferta es exacta.
+    Cambiar la política y volver a repartir es una sola llamada a aplicar().
+"""
+
+from typing import Dict, Optional, Sequence
+
+import models.Categorias as Categorias
+from models.ofertaCarrera import OfertaCarrera
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional en el resto del sistema
+    np = None
+
+
+class DistribucionCupos:
+    """
+    Política de reparto (porcentaje de cuotas y pesos por segmento) aplicada
+    como matriz ofertas × segmentos.
+    """
+
+    SEGMENTOS = tuple(Categorias.SEGMENTOS)
+    PESOS_POR_DEFECTO = {'VULNERABILIDAD': 0.20, 'MERITO_ACADEMICO': 0.30, 'GENERAL': 0.50}
+
+    # Porcentaje y pesos se llevan a enteros para que el reparto no dependa del redondeo flotante
+    _ESCALA = 1_000_000
+
+    def __init__(self, porcentaje_cuotas: float = OfertaCarrera.PORCENTAJE_MINIMO_CUOTAS,
+                 minimo_cuotas: int = 1, pesos: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            porcentaje_cuotas: Fracción del total reservada a CUOTAS (se trunca)
+            minimo_cuotas: Cupos de CUOTAS aunque el porcentaje dé menos
+            pesos: Peso de cada segmento sobre los cupos restantes
+                   (los segmentos que no aparecen reciben 0)
+        """
+        if np is None:
+            raise ImportError("La distribución de cupos requiere NumPy (pip install numpy)")
+        if not 0 <= porcentaje_cuotas <= 1:
+            raise ValueError("El porcentaje de cuotas debe estar entre 0 y 1")
+        if minimo_cuotas < 0:
+            raise ValueError("El mínimo de cuotas no puede ser negativo")
+
+        pesos = dict(self.PESOS_POR_DEFECTO if pesos is None else pesos)
+        invalidos = set(pesos) - set(self.SEGMENTOS[1:])
+        if invalidos:
+            raise ValueError(f"Segmentos inválidos: {', '.join(sorted(invalidos))}")
+        if any(peso < 0 for peso in pesos.values()) or sum(pesos.values()) <= 0:
+            raise ValueError("Los pesos deben ser no negativos y sumar más de 0")
+
+        self.porcentaje_cuotas = porcentaje_cuotas
+        self._cuotas = round(porcentaje_cuotas * self._ESCALA)
+        self.minimo_cuotas = minimo_cuotas
+        self.pesos = pesos
+        self._pesos = np.array([round(pesos.get(s, 0) * self._ESCALA) for s in self.SEGMENTOS[1:]],
+                               dtype=np.int64)
+        # Ante fracciones iguales gana el segmento de mayor peso (y luego el primero)
+        self._prioridad = np.lexsort((np.arange(len(self._pesos)), -self._pesos))
+
+    # ==============================
+    # REPARTO VECTORIZADO
+    # ==============================
+
+    def repartir(self, totales: Sequence[int]) -> 'np.ndarray':
+        """
+        Reparte los cupos totales de cada oferta entre los segmentos.
+
+        Args:
+            totales: Cupos totales por oferta
+
+        Returns:
+            np.ndarray: Matriz (ofertas × SEGMENTOS) de enteros; cada fila suma su total
+        """
+        totales = np.asarray(totales, dtype=np.int64)
+        if totales.ndim != 1:
+            raise ValueError("Los totales deben ser un vector")
+        if np.any(totales < 0):
+            raise ValueError("Los cupos totales no pueden ser negativos")
+
+        # 100 * 0.29 da 28.999... en flotante; 100 * 290000 // 1000000 da 29
+        cuotas = totales * self._cuotas // self._ESCALA
+        cuotas = np.minimum(np.maximum(cuotas, self.minimo_cuotas), totales)
+        restantes = totales - cuotas
+
+        # Cuota exacta = restantes * peso / suma_pesos, separada en entero y resto
+        numeradores = restantes[:, None] * self._pesos[None, :]
+        enteros, restos = np.divmod(numeradores, self._pesos.sum())
+        faltantes = restantes - enteros.sum(axis=1)
+
+        # Orden por resto descendente (estable sobre la prioridad de segmentos)
+        orden = self._prioridad[np.argsort(-restos[:, self._prioridad], axis=1, kind='stable')]
+        extra = np.arange(len(self._pesos))[None, :] < faltantes[:, None]
+        np.put_along_axis(enteros, orden, np.take_along_axis(enteros, orden, axis=1) + extra, axis=1)
+
+        return np.column_stack((cuotas, enteros))
+
+    def aplicar(self, ofertas: Sequence[OfertaCarrera]) -> 'np.ndarray':
+        """
+        Reparte y escribe el resultado en cada oferta (cupos_pc, cupos_nivelacion,
+        cupos_vulnerabilidad, cupos_merito, cupos_general y cupos_adicionales).
+
+        Returns:
+            np.ndarray: La matriz de repartir()
+
+        Raises:
+            ValueError: Si algún segmento quedaría con menos cupos que los ya
+                asignados (no se modifica ninguna oferta)
+        """
+        ofertas = list(ofertas)
+        matriz = self.repartir([oferta.cupos_total for oferta in ofertas])
+        adicionales = [(j, s) for j, s in enumerate(self.SEGMENTOS)
+                       if s in ('RECONOCIMIENTOS', 'PUEBLOS_NACIONALIDADES', 'BACHILLERES')
+                       and self.pesos.get(s, 0) > 0]
+        columnas = {s: j for j, s in enumerate(self.SEGMENTOS)}
+
+        # Límite de cada segmento como en OfertaCarrera.calcularCuposDisponibles
+        # (un segmento adicional sin columna usa el de GENERAL)
+        for oferta, fila in zip(ofertas, matriz.tolist()):
+            limites = {s: fila[columnas[s]] for s in ('CUOTAS', 'VULNERABILIDAD', 'MERITO_ACADEMICO', 'GENERAL')}
+            limites.update((s, fila[j]) for j, s in adicionales)
+            excedidos = [f"{s} ({asignados} > {limites.get(s, limites['GENERAL'])})"
+                         for s, asignados in oferta.cupos_asignados.items()
+                         if asignados > limites.get(s, limites['GENERAL'])]
+            if excedidos:
+                raise ValueError(f"La carrera {oferta.carrera_id} (sede {oferta.sede_id}) ya tiene más "
+                                 f"cupos asignados que el nuevo reparto en: {', '.join(excedidos)}")
+
+        for oferta, fila in zip(ofertas, matriz.tolist()):
+            oferta.cupos_pc = fila[columnas['CUOTAS']]
+            oferta.cupos_nivelacion = oferta.cupos_total - oferta.cupos_pc
+            oferta.cupos_vulnerabilidad = fila[columnas['VULNERABILIDAD']]
+            oferta.cupos_merito = fila[columnas['MERITO_ACADEMICO']]
+            oferta.cupos_general = fila[columnas['GENERAL']]
+            oferta.cupos_adicionales = {s: fila[j] for j, s in adicionales}
+            if oferta.bitacora is not None:
+                oferta.bitacora.registrar('cupos_redistribuidos', oferta)
+        return matriz
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=" * 70)
+    print("PRUEBA: DISTRIBUCIÓN DE CUPOS POR RESTO MAYOR")
+    print("=" * 70)
+
+    generador = random.Random(11)
+    ofertas = [OfertaCarrera(100 + i, f"CARRERA {i}", i % 9 + 1, f"SEDE {i % 9 + 1}",
+                             generador.randint(15, 300), "TERCER NIVEL", "PRESENCIAL",
+                             "MATUTINA", mostrar=False) for i in range(50_000)]
+
+    inicio = time.perf_counter()
+    for oferta in ofertas:
+        oferta._calcular_distribucion_cupos()
+    tiempo_uno_a_uno = time.perf_counter() - inicio
+
+    politica = DistribucionCupos()
+    inicio = time.perf_counter()
+    matriz = politica.repartir([o.cupos_total for o in ofertas])
+    tiempo_matriz = time.perf_counter() - inicio
+    coinciden = all(fila[1] == o.cupos_vulnerabilidad and fila[2] == o.cupos_merito
+                    and fila[6] == o.cupos_general for o, fila in zip(ofertas, matriz.tolist()))
+
+    print(f"\nOfertas: {len(ofertas):,}")
+    print(f"Una a una:   {tiempo_uno_a_uno * 1000:7.1f} ms")
+    print(f"Vectorizado: {tiempo_matriz * 1000:7.1f} ms (coincide: {coinciden})")
+    print(f"Cupos totales: {sum(o.cupos_total for o in ofertas):,} | repartidos: {int(matriz.sum()):,}")
+
+    # Cambio de política: 8% de cuotas y cupos para pueblos y nacionalidades
+    nueva = DistribucionCupos(0.08, pesos={'VULNERABILIDAD': 0.2, 'MERITO_ACADEMICO': 0.25,
+                                           'PUEBLOS_NACIONALIDADES': 0.05, 'GENERAL': 0.5})
+    inicio = time.perf_counter()
+    nueva.aplicar(ofertas)
+    print(f"Nueva política aplicada en {(time.perf_counter() - inicio) * 1000:.1f} ms")
+    ejemplo = ofertas[0]
+    print(f"Ejemplo ({ejemplo.cupos_total} cupos): CUOTAS {ejemplo.cupos_pc} | "
+          f"VULN {ejemplo.cupos_vulnerabilidad} | MÉRITO {ejemplo.cupos_merito} | "
+          f"PUEBLOS {ejemplo.cupos_adicionales['PUEBLOS_NACIONALIDADES']} | GENERAL {ejemplo.cupos_general}")
+    print("=" * 70)
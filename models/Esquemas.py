@@ -0,0 +1,221 @@
+"""
+Módulo: Esquemas
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Descripción declarativa de los atributos de cada modelo del proceso de
+    admisión: nombre y tipo de cada campo y relaciones entre modelos.
+      - Tipos: 'entero', 'decimal', 'texto', 'fecha_hora' y 'json'
+        (dict/list pequeños como cupos_asignados). Todos admiten None.
+      - Relaciones: atributos que apuntan a objetos de otra tabla
+        (Inscripcion._evaluacion, Postulante._inscripciones...).
+      - nuevo() crea un objeto vacío sin pasar por el constructor (sin
+        imprimir, sin validar y sin consumir IDs) para restaurarlo campo a campo.
+    Las tablas están en orden: las relaciones solo apuntan a tablas posteriores.
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from models.Asignacion import Asignacion
+from models.Evaluacion import Evaluacion
+from models.Inscripcion import Inscripcion
+from models.ofertaCarrera import OfertaCarrera
+from models.Postulante import Postulante, VistaSoloLectura
+from models.PuntajePostulacion import PuntajePostulacion
+from models.RegistroNacional import RegistroNacional
+
+
+TIPOS = ('entero', 'decimal', 'texto', 'fecha_hora', 'json')
+
+
+class Campo(NamedTuple):
+    nombre: str
+    tipo: str
+
+
+class Relacion(NamedTuple):
+    """Atributo que guarda un objeto (o una lista si multiple) de la tabla destino."""
+    nombre: str
+    destino: str
+    multiple: bool = False
+
+
+class Esquema:
+    """Campos, relaciones e identificador de un modelo."""
+
+    __slots__ = ('tabla', 'clase', 'campos', 'relaciones', 'campo_id', 'secuencia', 'desfase',
+                 '_restaurar')
+
+    def __init__(self, tabla: str, clase: type, campos: Tuple[Campo, ...],
+                 relaciones: Tuple[Relacion, ...] = (), campo_id: Optional[str] = None,
+                 secuencia: Optional[str] = None, restaurar: Optional[Callable] = None,
+                 desfase: int = 0):
+        """
+        Args:
+            tabla: Nombre de la colección en EstadoAdmision ('inscripciones')
+            clase: Modelo descrito
+            campos: Atributos guardados, en orden
+            relaciones: Atributos que enlazan con otras tablas
+            campo_id: Atributo identificador
+            secuencia: Secuencia de AsignadorIds que genera campo_id
+            restaurar: Completa los atributos derivados de un objeto restaurado
+            desfase: Valor sumado al número de la secuencia (campo_id = desfase + número)
+        """
+        invalidos = [c.nombre for c in campos if c.tipo not in TIPOS]
+        if invalidos:
+            raise ValueError(f"Tipo de campo inválido en {tabla}: {', '.join(invalidos)}")
+        self.tabla = tabla
+        self.clase = clase
+        self.campos = campos
+        self.relaciones = relaciones
+        self.campo_id = campo_id
+        self.secuencia = secuencia
+        self.desfase = desfase
+        self._restaurar = restaurar
+
+    def nuevo(self, valores: Dict[str, object]):
+        """Objeto de la clase con los valores dados, sin llamar a __init__."""
+        objeto = self.clase.__new__(self.clase)
+        if hasattr(objeto, '__dict__'):
+            objeto.__dict__.update(valores)
+        else:
+            for nombre, valor in valores.items():
+                setattr(objeto, nombre, valor)
+        if self._restaurar is not None:
+            self._restaurar(objeto)
+        return objeto
+
+    def __repr__(self) -> str:
+        return f"Esquema({self.tabla!r}, {self.clase.__name__}, {len(self.campos)} campos)"
+
+
+def _campos(tipo: str, *nombres: str) -> Tuple[Campo, ...]:
+    return tuple(Campo(nombre, tipo) for nombre in nombres)
+
+
+def _restaurar_postulante(postulante: Postulante) -> None:
+    postulante._inscripciones = getattr(postulante, '_inscripciones', [])
+    postulante._puntajes = getattr(postulante, '_puntajes', [])
+    postulante._asignacion = getattr(postulante, '_asignacion', None)
+    postulante._vista_inscripciones = VistaSoloLectura(postulante._inscripciones)
+    postulante._vista_puntajes = VistaSoloLectura(postulante._puntajes)
+
+
+def _restaurar_oferta(oferta: OfertaCarrera) -> None:
+    oferta._observadores = []
+
+
+def _restaurar_inscripcion(inscripcion: Inscripcion) -> None:
+    if not hasattr(inscripcion, '_evaluacion'):
+        inscripcion._evaluacion = None
+
+
+# ==============================
+# ESQUEMAS DE LOS MODELOS
+# ==============================
+
+REGISTROS = Esquema('registros', RegistroNacional, (
+    _campos('texto', 'identificacion', 'nombres', 'apellidos', 'tipo_documento', 'nacionalidad')
+    + _campos('entero', 'codigo_nacionalidad')
+    + _campos('texto', 'fecha_nacimiento', 'estado_civil', 'sexo', 'genero',
+              'autoidentificacion', 'pueblo_indigena')
+    + _campos('entero', 'edad')
+    + _campos('texto', 'carnet_discapacidad', 'tipo_discapacidad')
+    + _campos('decimal', 'porcentaje_discapacidad')
+    + _campos('texto', 'requiere_apoyo', 'identificacion_apoyo', 'nombres_apoyo', 'correo_apoyo',
+              'pais_reside', 'provincia_reside', 'canton_reside', 'parroquia_reside')
+    + _campos('entero', 'codigo_provincia', 'codigo_canton', 'codigo_parroquia')
+    + _campos('texto', 'barrio_sector', 'calle_principal', 'celular', 'correo',
+              'internet_domicilio', 'computadora_domicilio', 'camara_web',
+              'tipo_doc_rep_legal', 'numero_doc_rep_legal', 'nombre_rep_legal',
+              'celular_rep_legal', 'email_rep_legal', 'titulo_homologado',
+              'unidad_educativa', 'tipo_unidad_educativa')
+    + _campos('decimal', 'calificacion')
+    + _campos('texto', 'cuadro_honor', 'ubicacion_cuadro_honor', 'distincion_cuadro_honor',
+              'titulo_tercer_nivel', 'titulo_cuarto_nivel')
+    + _campos('fecha_hora', 'fecha_registro_nacional')
+    + _campos('texto', 'estado', 'tipo_poblacion', 'ppl', 'nombre_centro_ppl',
+              'acepta_cupo_anterior', 'estado_registro_nacional', 'observacion_estado',
+              'observacion_poblacion', 'observacion_acepta_cupo')
+), campo_id='identificacion')
+
+POSTULANTES = Esquema('postulantes', Postulante, (
+    _campos('entero', 'id_postulante')
+    + _campos('texto', 'cedula', 'nombre_completo', 'email', 'telefono',
+              'fecha_nacimiento', 'estado_registro')
+    + _campos('fecha_hora', 'fecha_registro')
+), relaciones=(Relacion('_inscripciones', 'inscripciones', multiple=True),
+               Relacion('_puntajes', 'puntajes', multiple=True),
+               Relacion('_asignacion', 'asignaciones')),
+    campo_id='id_postulante', secuencia='postulante', restaurar=_restaurar_postulante)
+
+OFERTAS = Esquema('ofertas', OfertaCarrera, (
+    _campos('entero', 'carrera_id', 'ofa_id', 'cus_id')
+    + _campos('texto', 'nombre_carrera')
+    + _campos('entero', 'sede_id')
+    + _campos('texto', 'nombre_sede', 'nivel', 'modalidad', 'jornada')
+    + _campos('entero', 'cupos_total', 'cupos_nivelacion', 'cupos_primer_semestre', 'cupos_pc')
+    + _campos('texto', 'tipo_cupo', 'focalizada')
+    + _campos('entero', 'cupos_vulnerabilidad', 'cupos_merito', 'cupos_general')
+    + _campos('json', 'cupos_adicionales', 'cupos_asignados')
+), campo_id='ofa_id', secuencia='oferta', desfase=OfertaCarrera.BASE_OFA_ID,
+    restaurar=_restaurar_oferta)
+
+INSCRIPCIONES = Esquema('inscripciones', Inscripcion, (
+    _campos('entero', 'id_inscripcion', 'id_postulante', 'carrera_id', 'orden_preferencia', 'sede_id')
+    + _campos('texto', 'jornada')
+    + _campos('entero', 'laboratorio_id')
+    + _campos('texto', 'cedula_postulante')
+    + _campos('fecha_hora', 'fecha_inscripcion')
+    + _campos('texto', 'comprobante_pdf_url', 'estado')
+), relaciones=(Relacion('_evaluacion', 'evaluaciones'),),
+    campo_id='id_inscripcion', secuencia='inscripcion', restaurar=_restaurar_inscripcion)
+
+EVALUACIONES = Esquema('evaluaciones', Evaluacion, (
+    _campos('entero', 'id_evaluacion', 'id_referencia', 'id_inscripcion')
+    + _campos('texto', 'tipo')
+    + _campos('decimal', 'calificacion')
+    + _campos('texto', 'estado')
+    + _campos('entero', 'sede_id')
+    + _campos('texto', 'jornada')
+    + _campos('entero', 'laboratorio_id')
+    + _campos('fecha_hora', 'fecha_programada')
+    + _campos('texto', 'hora_inicio', 'hora_fin', 'observaciones')
+), campo_id='id_evaluacion', secuencia='evaluacion')
+
+PUNTAJES = Esquema('puntajes', PuntajePostulacion, (
+    _campos('entero', 'id_puntaje', 'id_postulante')
+    + _campos('texto', 'cedula_postulante')
+    + _campos('decimal', '_nota_grado', '_puntaje_evaluacion', '_puntaje_meritos')
+    + _campos('fecha_hora', 'fecha_calculo')
+    + _campos('decimal', '_puntaje_final')
+    + _campos('texto', 'observaciones')
+), campo_id='id_puntaje', secuencia='puntaje')
+
+ASIGNACIONES = Esquema('asignaciones', Asignacion, (
+    _campos('entero', 'id_asignacion', 'id_postulante', 'carrera_id', 'sede_id')
+    + _campos('decimal', 'puntaje_final')
+    + _campos('texto', 'cedula_postulante', 'email_postulante')
+    + _campos('fecha_hora', 'fecha_asignacion')
+    + _campos('texto', 'estado')
+    + _campos('fecha_hora', 'fecha_confirmacion')
+    + _campos('texto', 'observaciones')
+), campo_id='id_asignacion', secuencia='asignacion')
+
+# En orden: cada relación apunta a una tabla posterior
+ESQUEMAS: Dict[str, Esquema] = {e.tabla: e for e in (REGISTROS, POSTULANTES, OFERTAS, INSCRIPCIONES,
+                                                     EVALUACIONES, PUNTAJES, ASIGNACIONES)}
+POR_CLASE: Dict[type, Esquema] = {e.clase: e for e in ESQUEMAS.values()}
+
+
+def esquema_de(objeto) -> Esquema:
+    """
+    Esquema del modelo de un objeto.
+
+    Raises:
+        ValueError: Si la clase no tiene esquema
+    """
+    esquema = POR_CLASE.get(type(objeto))
+    if esquema is None:
+        raise ValueError(f"No hay esquema para {type(objeto).__name__}")
+    return esquema
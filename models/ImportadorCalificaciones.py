@@ -0,0 +1,325 @@
+"""
+Módulo: ImportadorCalificaciones
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Carga masiva de calificaciones desde archivos exportados por el escáner
+    (CSV con cientos de miles de filas). Lee el archivo por bloques, valida el
+    rango 0-1000 de forma vectorizada, resuelve cada fila a su Evaluacion por
+    id_inscripcion o cédula y guarda los rechazos en un archivo de errores.
+    El proceso puede reanudarse si se interrumpe. Las calificaciones viven en
+    los objetos Evaluacion en memoria: si se reanuda en otro proceso, las filas
+    ya contadas se vuelven a aplicar (sin contarlas ni repetir sus rechazos).
+"""
+
+import csv
+import json
+import math
+import os
+from typing import Dict, Iterable, List, Optional
+
+from models.Evaluacion import Evaluacion
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: se valida con Python puro
+    np = None
+
+
+# Identifica a este proceso en el archivo de progreso (ver importar)
+_EJECUCION = os.urandom(8).hex()
+
+
+# ==============================
+# ÍNDICE DE EVALUACIONES
+# ==============================
+
+class IndiceEvaluaciones:
+    """
+    Índice en memoria para ubicar evaluaciones en O(1)
+    por id_inscripcion o por cédula del postulante.
+    """
+
+    def __init__(self):
+        self.por_inscripcion: Dict[int, Evaluacion] = {}
+        self.por_cedula: Dict[str, List[Evaluacion]] = {}
+
+    def agregar(self, evaluacion: Evaluacion, cedula: Optional[str] = None) -> None:
+        """Indexa una evaluación (y su cédula si se conoce)."""
+        self.por_inscripcion[evaluacion.id_inscripcion] = evaluacion
+        if cedula:
+            self.por_cedula.setdefault(cedula, []).append(evaluacion)
+
+    @classmethod
+    def desde_inscripciones(cls, inscripciones: Iterable) -> 'IndiceEvaluaciones':
+        """Construye el índice a partir de objetos Inscripcion."""
+        indice = cls()
+        for inscripcion in inscripciones:
+            evaluacion = inscripcion.obtenerEvaluacion()
+            if evaluacion is not None:
+                indice.agregar(evaluacion, inscripcion.cedula_postulante)
+        return indice
+
+    def resolver(self, id_inscripcion: str, cedula: str):
+        """
+        Devuelve (evaluacion, motivo). Si no se puede resolver,
+        evaluacion es None y motivo explica el rechazo.
+        """
+        if id_inscripcion:
+            try:
+                evaluacion = self.por_inscripcion.get(int(id_inscripcion))
+            except ValueError:
+                return None, "id_inscripcion no numerico"
+            if evaluacion is None:
+                return None, "inscripcion no encontrada"
+            return evaluacion, None
+
+        if cedula:
+            candidatas = [e for e in self.por_cedula.get(cedula, ())
+                          if e.estado != 'CANCELADA']
+            if not candidatas:
+                return None, "cedula sin evaluacion activa"
+            if len(candidatas) > 1:
+                return None, "cedula con varias evaluaciones, use id_inscripcion"
+            return candidatas[0], None
+
+        return None, "fila sin id_inscripcion ni cedula"
+
+    def __len__(self) -> int:
+        return len(self.por_inscripcion)
+
+
+# ==============================
+# IMPORTADOR POR BLOQUES
+# ==============================
+
+class ImportadorCalificaciones:
+    """
+    Importa calificaciones de un archivo CSV por bloques.
+
+    El archivo debe tener encabezado con la columna 'calificacion' y al menos
+    una de 'id_inscripcion' o 'cedula'. Se admite ',' o ';' como separador.
+    """
+
+    COLUMNAS_ERROR = ['fila', 'id_inscripcion', 'cedula', 'calificacion', 'motivo']
+
+    def __init__(self, indice: IndiceEvaluaciones, tamano_bloque: int = 50000):
+        if tamano_bloque <= 0:
+            raise ValueError("El tamaño de bloque debe ser mayor a 0")
+        self.indice = indice
+        self.tamano_bloque = tamano_bloque
+        self.filas_procesadas = 0
+        self.aplicadas = 0
+        self.rechazadas = 0
+
+    # ---------- validación vectorizada ----------
+
+    @staticmethod
+    def _validar_rango(textos: List[str]) -> List[Optional[float]]:
+        """
+        Convierte y valida un bloque de calificaciones.
+        Devuelve el valor o None si no es un número dentro de 0-1000.
+        """
+        if np is not None:
+            try:
+                valores = np.asarray(textos, dtype=np.float64)
+            except ValueError:
+                valores = np.asarray([_a_numero(t) for t in textos], dtype=np.float64)
+            validos = np.isfinite(valores) & (valores >= 0) & (valores <= 1000)
+            return [v if ok else None for v, ok in zip(valores.tolist(), validos.tolist())]
+
+        resultado = []
+        for texto in textos:
+            valor = _a_numero(texto)
+            resultado.append(valor if 0 <= valor <= 1000 else None)
+        return resultado
+
+    # ---------- progreso (reanudación) ----------
+
+    @staticmethod
+    def _ruta_progreso(ruta_archivo: str) -> str:
+        return ruta_archivo + ".progreso"
+
+    def _leer_progreso(self, ruta_archivo: str) -> dict:
+        ruta = self._ruta_progreso(ruta_archivo)
+        if not os.path.exists(ruta):
+            return {}
+        with open(ruta, encoding='utf-8') as archivo:
+            return json.load(archivo)
+
+    def _guardar_progreso(self, ruta_archivo: str, bytes_errores: int) -> None:
+        ruta = self._ruta_progreso(ruta_archivo)
+        temporal = ruta + ".tmp"
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump({
+                'filas_procesadas': self.filas_procesadas,
+                'aplicadas': self.aplicadas,
+                'rechazadas': self.rechazadas,
+                'bytes_errores': bytes_errores,
+                'ejecucion': _EJECUCION
+            }, archivo)
+        os.replace(temporal, ruta)
+
+    # ---------- proceso principal ----------
+
+    def importar(self, ruta_archivo: str, ruta_errores: Optional[str] = None,
+                 reanudar: bool = True) -> dict:
+        """
+        Importa el archivo completo y devuelve un resumen.
+
+        Args:
+            ruta_archivo: CSV con las calificaciones
+            ruta_errores: CSV donde se guardan las filas rechazadas
+                          (por defecto <ruta_archivo>.errores.csv)
+            reanudar: Si existe progreso previo, continúa desde esa fila. Si el
+                      progreso es de otro proceso, antes se vuelven a aplicar
+                      las filas ya procesadas a las evaluaciones de este índice
+
+        Returns:
+            dict: filas procesadas, aplicadas y rechazadas
+        """
+        ruta_errores = ruta_errores or ruta_archivo + ".errores.csv"
+        progreso = self._leer_progreso(ruta_archivo) if reanudar else {}
+
+        self.filas_procesadas = progreso.get('filas_procesadas', 0)
+        self.aplicadas = progreso.get('aplicadas', 0)
+        self.rechazadas = progreso.get('rechazadas', 0)
+        filas_a_saltar = self.filas_procesadas
+        # Otro proceso: sus calificaciones se perdieron con su memoria
+        reaplicar = bool(progreso) and progreso.get('ejecucion') != _EJECUCION
+
+        with open(ruta_archivo, newline='', encoding='utf-8-sig') as entrada, \
+                open(ruta_errores, 'a+' if progreso else 'w', newline='',
+                     encoding='utf-8') as errores:
+            if progreso:
+                # Descarta rechazos escritos después del último bloque confirmado
+                errores.truncate(progreso.get('bytes_errores', 0))
+                errores.seek(0, os.SEEK_END)
+            escritor_errores = csv.writer(errores)
+            if not progreso:
+                escritor_errores.writerow(self.COLUMNAS_ERROR)
+
+            lector = self._crear_lector(entrada)
+            bloque = []
+            for fila in lector:
+                if filas_a_saltar:
+                    filas_a_saltar -= 1
+                    if reaplicar:
+                        bloque.append(fila)
+                        if len(bloque) >= self.tamano_bloque or not filas_a_saltar:
+                            self._procesar_bloque(bloque, None)
+                            bloque = []
+                    continue
+                bloque.append(fila)
+                if len(bloque) >= self.tamano_bloque:
+                    self._procesar_bloque(bloque, escritor_errores)
+                    errores.flush()
+                    self._guardar_progreso(ruta_archivo, errores.tell())
+                    bloque = []
+
+            if bloque:
+                self._procesar_bloque(bloque, escritor_errores)
+                errores.flush()
+                self._guardar_progreso(ruta_archivo, errores.tell())
+
+        # Importación terminada: el progreso ya no es necesario
+        ruta_progreso = self._ruta_progreso(ruta_archivo)
+        if os.path.exists(ruta_progreso):
+            os.remove(ruta_progreso)
+
+        return {
+            'filas_procesadas': self.filas_procesadas,
+            'aplicadas': self.aplicadas,
+            'rechazadas': self.rechazadas,
+            'archivo_errores': ruta_errores
+        }
+
+    def _crear_lector(self, entrada):
+        muestra = entrada.readline()
+        separador = ';' if muestra.count(';') > muestra.count(',') else ','
+        columnas = [c.strip().lower() for c in muestra.strip().split(separador)]
+
+        if 'calificacion' not in columnas:
+            raise ValueError("El archivo debe tener la columna 'calificacion'")
+        if 'id_inscripcion' not in columnas and 'cedula' not in columnas:
+            raise ValueError("El archivo debe tener 'id_inscripcion' o 'cedula'")
+
+        self._pos_id = columnas.index('id_inscripcion') if 'id_inscripcion' in columnas else None
+        self._pos_cedula = columnas.index('cedula') if 'cedula' in columnas else None
+        self._pos_nota = columnas.index('calificacion')
+        return csv.reader(entrada, delimiter=separador)
+
+    def _procesar_bloque(self, bloque: List[List[str]], escritor_errores) -> None:
+        """
+        Valida, resuelve y aplica un bloque de filas. Sin escritor_errores solo
+        vuelve a aplicar filas ya contadas (reanudación en otro proceso).
+        """
+        primera_fila = self.filas_procesadas + 1
+        ids = [_columna(f, self._pos_id) for f in bloque]
+        cedulas = [_columna(f, self._pos_cedula) for f in bloque]
+        notas_texto = [_columna(f, self._pos_nota) for f in bloque]
+        notas = self._validar_rango(notas_texto)
+
+        evaluaciones = []
+        calificaciones = []
+        for i, nota in enumerate(notas):
+            if nota is None:
+                if math.isnan(_a_numero(notas_texto[i])):
+                    motivo = "calificacion no numerica"
+                else:
+                    motivo = "calificacion fuera de rango 0-1000"
+            else:
+                evaluacion, motivo = self.indice.resolver(ids[i], cedulas[i])
+                if evaluacion is not None and evaluacion.estado == 'CANCELADA':
+                    motivo = "evaluacion cancelada"
+                if motivo is None:
+                    evaluaciones.append(evaluacion)
+                    calificaciones.append(nota)
+                    continue
+            if escritor_errores is not None:
+                escritor_errores.writerow([primera_fila + i, ids[i], cedulas[i],
+                                           notas_texto[i], motivo])
+                self.rechazadas += 1
+
+        aplicadas = Evaluacion.registrar_calificaciones_lote(evaluaciones, calificaciones)
+        if escritor_errores is not None:
+            self.aplicadas += aplicadas
+            self.filas_procesadas += len(bloque)
+
+
+def _columna(fila: List[str], posicion: Optional[int]) -> str:
+    if posicion is None or posicion >= len(fila):
+        return ''
+    return fila[posicion].strip()
+
+
+def _a_numero(texto: str) -> float:
+    try:
+        return float(texto.replace(',', '.'))
+    except (ValueError, AttributeError):
+        return math.nan
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import tempfile
+
+    print("=" * 70)
+    print("PRUEBA: IMPORTACIÓN MASIVA DE CALIFICACIONES")
+    print("=" * 70)
+
+    indice = IndiceEvaluaciones()
+    for id_inscripcion in range(1, 6):
+        evaluacion = Evaluacion(id_inscripcion=id_inscripcion, tipo='escrito', sede_id=1)
+        indice.agregar(evaluacion, cedula=f"13162020{id_inscripcion:02d}")
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "resultados.csv")
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write("id_inscripcion;cedula;calificacion\n")
+            archivo.write("1;;850\n2;;1200\n;1316202003;730,5\n99;;500\n5;;abc\n")
+
+        resumen = ImportadorCalificaciones(indice, tamano_bloque=2).importar(ruta)
+        print(f"\nResumen: {resumen}")
+        with open(resumen['archivo_errores'], encoding='utf-8') as archivo:
+            print(archivo.read())
@@ -0,0 +1,184 @@
+"""
+Módulo: InscripcionAsync
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Variante asíncrona (asyncio) de la Inscripcion con inyección de
+    dependencias de PRINCIPIOSOLIDD5:
+      - InterfazBaseDatosAsync / InterfazEmailAsync: las mismas abstracciones
+        con métodos 'async'.
+      - Adaptadores que envuelven cualquier implementación síncrona
+        (BaseDatosMySQL, BaseDatosSQLite, ServicioGmail...) con asyncio.to_thread.
+      - InscripcionAsync.procesar_inscripcion guarda y notifica a la vez.
+      - procesar_lote: muchas inscripciones en vuelo con un límite de concurrencia.
+"""
+
+import asyncio
+from typing import List, Optional, Sequence
+
+from models.PRINCIPIOSOLIDD5 import Inscripcion, InterfazBaseDatos, InterfazEmail
+
+
+# ==================== ABSTRACCIONES ASÍNCRONAS ====================
+class InterfazBaseDatosAsync:
+    """Abstracción asíncrona de la base de datos"""
+
+    async def guardar_inscripcion(self, inscripcion):
+        raise NotImplementedError("Debes implementar guardar_inscripcion()")
+
+    async def buscar_inscripcion(self, numero_inscripcion):
+        raise NotImplementedError("Debes implementar buscar_inscripcion()")
+
+
+class InterfazEmailAsync:
+    """Abstracción asíncrona del servicio de email"""
+
+    async def enviar_confirmacion(self, email, mensaje):
+        raise NotImplementedError("Debes implementar enviar_confirmacion()")
+
+
+# ==================== ADAPTADORES SÍNCRONO -> ASÍNCRONO ====================
+class BaseDatosAsyncAdaptador(InterfazBaseDatosAsync):
+    """Ejecuta una InterfazBaseDatos síncrona en un hilo sin bloquear el loop"""
+
+    def __init__(self, base_datos: InterfazBaseDatos):
+        self.base_datos = base_datos
+
+    async def guardar_inscripcion(self, inscripcion):
+        return await asyncio.to_thread(self.base_datos.guardar_inscripcion, inscripcion)
+
+    async def buscar_inscripcion(self, numero_inscripcion):
+        return await asyncio.to_thread(self.base_datos.buscar_inscripcion, numero_inscripcion)
+
+
+class EmailAsyncAdaptador(InterfazEmailAsync):
+    """Ejecuta una InterfazEmail síncrona en un hilo sin bloquear el loop"""
+
+    def __init__(self, servicio_email: InterfazEmail):
+        self.servicio_email = servicio_email
+
+    async def enviar_confirmacion(self, email, mensaje):
+        return await asyncio.to_thread(self.servicio_email.enviar_confirmacion, email, mensaje)
+
+
+def como_async_bd(base_datos) -> InterfazBaseDatosAsync:
+    if isinstance(base_datos, InterfazBaseDatosAsync):
+        return base_datos
+    return BaseDatosAsyncAdaptador(base_datos)
+
+
+def como_async_email(servicio_email) -> InterfazEmailAsync:
+    if isinstance(servicio_email, InterfazEmailAsync):
+        return servicio_email
+    return EmailAsyncAdaptador(servicio_email)
+
+
+# ==================== INSCRIPCION ASÍNCRONA ====================
+class InscripcionAsync(Inscripcion):
+    """
+    Misma Inscripcion de PRINCIPIOSOLIDD5, pero acepta dependencias síncronas
+    o asíncronas y las procesa de forma concurrente.
+    """
+
+    def __init__(self, postulante, carrera, periodo, base_datos, servicio_email):
+        super().__init__(postulante, carrera, periodo,
+                         base_datos=como_async_bd(base_datos),
+                         servicio_email=como_async_email(servicio_email))
+
+    async def procesar_inscripcion(self, email: str = "postulante@mail.com",
+                                   mostrar: bool = True):
+        """
+        Guarda y envía el email al mismo tiempo. El estado pasa a CONFIRMADA
+        solo si ambas operaciones terminan bien; si alguna falla, se propaga
+        el error y la inscripción queda PENDIENTE.
+        """
+        if mostrar:
+            print(f"\n Procesando inscripción {self.numero_inscripcion} (async)...")
+
+        mensaje = f"Tu inscripción {self.numero_inscripcion} ha sido confirmada para {self.carrera}"
+        await asyncio.gather(
+            self.base_datos.guardar_inscripcion(self),
+            self.servicio_email.enviar_confirmacion(email, mensaje)
+        )
+        self.estado = 'CONFIRMADA'
+
+        if mostrar:
+            print(f"Inscripción {self.numero_inscripcion} procesada exitosamente\n")
+
+
+async def procesar_lote(inscripciones: Sequence[InscripcionAsync], concurrencia: int = 100,
+                        mostrar: bool = False) -> List[Optional[BaseException]]:
+    """
+    Procesa muchas inscripciones con a lo sumo 'concurrencia' en vuelo.
+
+    Returns:
+        list: None por cada inscripción procesada o la excepción que la detuvo
+    """
+    if concurrencia < 1:
+        raise ValueError("La concurrencia debe ser mayor a 0")
+    semaforo = asyncio.Semaphore(concurrencia)
+
+    async def procesar(inscripcion):
+        async with semaforo:
+            await inscripcion.procesar_inscripcion(mostrar=mostrar)
+
+    return await asyncio.gather(*(procesar(i) for i in inscripciones), return_exceptions=True)
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+
+    LATENCIA_BD = 0.005
+    LATENCIA_EMAIL = 0.020
+    TOTAL = 500
+
+    class BaseDatosLenta(InterfazBaseDatos):
+        def guardar_inscripcion(self, inscripcion):
+            time.sleep(LATENCIA_BD)
+
+    class EmailLento(InterfazEmail):
+        def enviar_confirmacion(self, email, mensaje):
+            time.sleep(LATENCIA_EMAIL)
+
+    class BaseDatosLentaAsync(InterfazBaseDatosAsync):
+        async def guardar_inscripcion(self, inscripcion):
+            await asyncio.sleep(LATENCIA_BD)
+
+    class EmailLentoAsync(InterfazEmailAsync):
+        async def enviar_confirmacion(self, email, mensaje):
+            await asyncio.sleep(LATENCIA_EMAIL)
+
+    print("=" * 70)
+    print("PRUEBA: INSCRIPCION ASÍNCRONA (DIP + asyncio)")
+    print("=" * 70)
+
+    # Camino síncrono original (una inscripción tras otra)
+    bd, email = BaseDatosLenta(), EmailLento()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(TOTAL):
+            Inscripcion(f"Postulante {i}", "Medicina", "2025-1", bd, email).procesar_inscripcion()
+    tiempo_sync = time.perf_counter() - inicio
+
+    # Adaptadores sobre los mismos servicios síncronos (hilos)
+    lote = [InscripcionAsync(f"Postulante {i}", "Medicina", "2025-1", bd, email)
+            for i in range(TOTAL)]
+    inicio = time.perf_counter()
+    asyncio.run(procesar_lote(lote, concurrencia=32))
+    tiempo_adaptado = time.perf_counter() - inicio
+
+    # Servicios nativamente asíncronos
+    lote = [InscripcionAsync(f"Postulante {i}", "Medicina", "2025-1",
+                             BaseDatosLentaAsync(), EmailLentoAsync()) for i in range(TOTAL)]
+    inicio = time.perf_counter()
+    asyncio.run(procesar_lote(lote, concurrencia=200))
+    tiempo_async = time.perf_counter() - inicio
+
+    print(f"\nInscripciones: {TOTAL} (BD {LATENCIA_BD * 1000:.0f} ms, email {LATENCIA_EMAIL * 1000:.0f} ms)")
+    print(f"Síncrono:                 {tiempo_sync:.2f} s")
+    print(f"Async con adaptadores:    {tiempo_adaptado:.2f} s")
+    print(f"Async nativo:             {tiempo_async:.2f} s")
+    print("=" * 70)
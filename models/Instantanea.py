@@ -0,0 +1,481 @@
+"""
+Módulo: Instantanea
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Instantánea binaria de todo el estado de admisión (registros, postulantes,
+    ofertas con cupos_asignados, inscripciones, evaluaciones, puntajes y
+    asignaciones) para arrancar sin repetir millones de constructores.
+      - Formato por columnas según models.Esquemas: enteros y fechas en int64,
+        decimales en float64 y textos como códigos int32 de un diccionario
+        de cadenas (cada texto repetido se guarda una sola vez).
+      - Las relaciones se guardan como números de fila de la tabla destino.
+      - cargar() abre el archivo con mmap y solo lee la cabecera; cada objeto
+        se construye la primera vez que se pide (sin llamar a __init__) y se
+        conserva, así los cambios posteriores se ven en las siguientes lecturas.
+"""
+
+import json
+import math
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
+
+from models.AsignadorIds import AsignadorIds
+from models.Esquemas import ESQUEMAS, Esquema
+
+
+MAGICO = b'ULEAMSN1'
+VERSION = 1
+EPOCA = datetime(1970, 1, 1)
+MICROSEGUNDO = timedelta(microseconds=1)
+
+def _alinear(posicion: int, multiplo: int = 8) -> int:
+    return -(-posicion // multiplo) * multiplo
+
+
+def nulo_de(formato: str) -> int:
+    """Valor reservado para None en una columna entera de ese formato (su mínimo)."""
+    return -(1 << (array(formato).itemsize * 8 - 1))
+
+
+def _array_entero(valores: List[Optional[int]]) -> array:
+    """Enteros en el formato más angosto (int8..int64) que los contiene, con None = mínimo."""
+    presentes = [v for v in valores if v is not None]
+    menor, mayor = (min(presentes), max(presentes)) if presentes else (0, 0)
+    for formato in 'bhiq':
+        nulo = nulo_de(formato)
+        if nulo < menor and mayor < -nulo:
+            return array(formato, [nulo if v is None else v for v in valores])
+    raise OverflowError("entero fuera del rango de 64 bits")
+
+
+# ==============================
+# ESCRITURA
+# ==============================
+
+class _Escritor:
+    """Convierte las tablas en segmentos (arrays) y los escribe con su cabecera."""
+
+    def __init__(self):
+        self.textos: Dict[str, int] = {}
+        self.segmentos: Dict[str, array] = {}
+
+    def codigo_texto(self, valor: Optional[str]) -> int:
+        if valor is None:
+            return -1
+        codigo = self.textos.get(valor)
+        if codigo is None:
+            codigo = self.textos[valor] = len(self.textos)
+        return codigo
+
+    def columna(self, tabla: str, nombre: str, tipo: str, valores: List) -> None:
+        try:
+            if tipo == 'entero':
+                datos = _array_entero(valores)
+            elif tipo == 'decimal':
+                datos = array('d', [math.nan if v is None else v for v in valores])
+            elif tipo == 'fecha_hora':
+                datos = _array_entero([None if v is None else (v - EPOCA) // MICROSEGUNDO for v in valores])
+            elif tipo == 'json':
+                datos = _array_entero([self.codigo_texto(None if v is None else
+                                                         json.dumps(v, sort_keys=True, separators=(',', ':')))
+                                       for v in valores])
+            else:
+                # Se revisan y registran solo los textos distintos, en orden de aparición
+                textos = self.textos
+                for valor in dict.fromkeys(valores):
+                    if valor is not None and valor not in textos:
+                        if type(valor) is not str:
+                            raise TypeError("se esperaba texto")
+                        textos[valor] = len(textos)
+                datos = _array_entero([-1 if v is None else textos[v] for v in valores])
+        except (TypeError, OverflowError) as error:
+            raise ValueError(f"Valor inválido en {tabla}.{nombre} ({tipo}): {error}") from None
+        self.segmentos[f"{tabla}.{nombre}"] = datos
+
+    def escribir(self, ruta: str, tablas: Dict[str, dict]) -> int:
+        """Escribe el archivo (primero a un temporal) y devuelve su tamaño en bytes."""
+        blob = bytearray()
+        inicios = [0]
+        for texto in self.textos:
+            blob += texto.encode('utf-8')
+            inicios.append(len(blob))
+        self.segmentos['textos#inicios'] = _array_entero(inicios)
+        self.segmentos['textos'] = array('B', blob)
+
+        cabecera = {'version': VERSION, 'orden_bytes': sys.byteorder,
+                    'textos': len(self.textos), 'tablas': tablas, 'segmentos': {}}
+        posicion = 0
+        for nombre, datos in self.segmentos.items():
+            cabecera['segmentos'][nombre] = [posicion, datos.typecode, len(datos)]
+            posicion = _alinear(posicion + len(datos) * datos.itemsize)
+        codificada = json.dumps(cabecera).encode('utf-8')
+        inicio_datos = _alinear(len(MAGICO) + 8 + len(codificada))
+
+        temporal = ruta + ".tmp"
+        with open(temporal, 'wb') as archivo:
+            archivo.write(MAGICO)
+            archivo.write(len(codificada).to_bytes(8, 'little'))
+            archivo.write(codificada)
+            for nombre, datos in self.segmentos.items():
+                archivo.seek(inicio_datos + cabecera['segmentos'][nombre][0])
+                datos.tofile(archivo)
+            archivo.truncate(inicio_datos + posicion)
+            tamano = archivo.tell()
+        os.replace(temporal, ruta)
+        return tamano
+
+
+def _leer_columnas(objetos: List, esquema: Esquema) -> List[tuple]:
+    """Valores de cada campo para todos los objetos (None si un objeto no tiene el atributo)."""
+    nombres = [campo.nombre for campo in esquema.campos]
+    if not objetos:
+        return [() for _ in nombres]
+    try:
+        return list(zip(*map(attrgetter(*nombres), objetos)))
+    except AttributeError:
+        return [tuple(getattr(o, nombre, None) for o in objetos) for nombre in nombres]
+
+
+def guardar_instantanea(ruta: str, tablas: Dict[str, Iterable]) -> dict:
+    """
+    Escribe una instantánea de las tablas dadas (nombres de models.Esquemas).
+    Los objetos relacionados que no estén en su tabla se agregan a ella.
+
+    Returns:
+        dict: filas por tabla y bytes escritos
+    """
+    desconocidas = set(tablas) - set(ESQUEMAS)
+    if desconocidas:
+        raise ValueError(f"Tablas desconocidas: {', '.join(sorted(desconocidas))}")
+    filas = {tabla: list(tablas.get(tabla, ())) for tabla in ESQUEMAS}
+    posiciones = {tabla: {id(o): i for i, o in enumerate(objetos)} for tabla, objetos in filas.items()}
+
+    def fila_de(destino: str, objeto) -> int:
+        posicion = posiciones[destino].get(id(objeto))
+        if posicion is None:
+            posicion = posiciones[destino][id(objeto)] = len(filas[destino])
+            filas[destino].append(objeto)
+        return posicion
+
+    escritor = _Escritor()
+    resumen = {}
+    for tabla, esquema in ESQUEMAS.items():
+        objetos = filas[tabla]
+        for campo, valores in zip(esquema.campos, _leer_columnas(objetos, esquema)):
+            escritor.columna(tabla, campo.nombre, campo.tipo, valores)
+
+        for relacion in esquema.relaciones:
+            destino = relacion.destino
+            if relacion.multiple:
+                inicios, planas = [0], []
+                for objeto in objetos:
+                    planas.extend(fila_de(destino, r) for r in getattr(objeto, relacion.nombre, None) or ())
+                    inicios.append(len(planas))
+                escritor.segmentos[f"{tabla}.{relacion.nombre}#inicios"] = _array_entero(inicios)
+                escritor.segmentos[f"{tabla}.{relacion.nombre}"] = _array_entero(planas)
+            else:
+                escritor.segmentos[f"{tabla}.{relacion.nombre}"] = _array_entero([
+                    -1 if (r := getattr(o, relacion.nombre, None)) is None else fila_de(destino, r)
+                    for o in objetos])
+
+        ids = [getattr(o, esquema.campo_id, None) for o in objetos] if esquema.secuencia else []
+        resumen[tabla] = {'filas': len(objetos),
+                          'maximo_id': max((i for i in ids if i is not None), default=0)}
+
+    tamano = escritor.escribir(ruta, resumen)
+    return {**{tabla: datos['filas'] for tabla, datos in resumen.items()}, 'bytes': tamano}
+
+
+# ==============================
+# LECTURA PEREZOSA
+# ==============================
+
+class Instantanea:
+    """Archivo de instantánea mapeado en memoria; entrega segmentos sin copiarlos."""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._archivo = open(ruta, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._archivo.close()
+            raise ValueError(f"La instantánea {ruta} está vacía") from None
+        self._vista = memoryview(self._mapa)
+        self._vistas: List[memoryview] = []
+
+        if bytes(self._vista[:len(MAGICO)]) != MAGICO:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es una instantánea del sistema de admisión")
+        largo = int.from_bytes(self._vista[len(MAGICO):len(MAGICO) + 8], 'little')
+        inicio = len(MAGICO) + 8
+        self.cabecera = json.loads(bytes(self._vista[inicio:inicio + largo]))
+        if self.cabecera['version'] != VERSION or self.cabecera['orden_bytes'] != sys.byteorder:
+            self.cerrar()
+            raise ValueError("Versión u orden de bytes de la instantánea no compatible")
+        self._inicio_datos = _alinear(inicio + largo)
+
+        self._textos: List[Optional[str]] = [None] * self.cabecera['textos']
+        self._inicios_texto = self.segmento('textos#inicios')
+        self._blob = self.segmento('textos')
+
+    def segmento(self, nombre: str) -> memoryview:
+        """Vista tipada (sin copia) de un segmento: 'inscripciones.sede_id'..."""
+        posicion, formato, cantidad = self.cabecera['segmentos'][nombre]
+        inicio = self._inicio_datos + posicion
+        vista = self._vista[inicio:inicio + cantidad * array(formato).itemsize].cast(formato)
+        self._vistas.append(vista)
+        return vista
+
+    def texto(self, codigo: int) -> Optional[str]:
+        """Texto del diccionario; cada código se decodifica una vez y se comparte."""
+        if codigo < 0:
+            return None
+        texto = self._textos[codigo]
+        if texto is None:
+            texto = self._textos[codigo] = str(
+                self._blob[self._inicios_texto[codigo]:self._inicios_texto[codigo + 1]], 'utf-8')
+        return texto
+
+    def filas(self, tabla: str) -> int:
+        return self.cabecera['tablas'][tabla]['filas']
+
+    def cerrar(self) -> None:
+        for vista in self._vistas:
+            vista.release()
+        self._vistas = []
+        self._vista.release()
+        self._mapa.close()
+        self._archivo.close()
+
+
+class ColeccionInstantanea(Sequence):
+    """
+    Tabla restaurada: se comporta como una lista de objetos, pero cada uno se
+    construye al pedirlo. append() agrega objetos nuevos al final.
+    """
+
+    def __init__(self, instantanea: Instantanea, esquema: Esquema, estado: 'EstadoAdmision'):
+        self.esquema = esquema
+        self._instantanea = instantanea
+        self._estado = estado
+        self._total = instantanea.filas(esquema.tabla)
+        self._objetos: List = [None] * self._total
+        self._nuevos: List = []
+        self._indice: Optional[Dict] = None
+        tabla = esquema.tabla
+        self._columnas = []
+        for campo in esquema.campos:
+            columna = instantanea.segmento(f"{tabla}.{campo.nombre}")
+            nulo = nulo_de(columna.format) if campo.tipo != 'decimal' else None
+            self._columnas.append((campo.nombre, campo.tipo, columna, nulo))
+        self._relaciones = [
+            (r, instantanea.segmento(f"{tabla}.{r.nombre}"),
+             instantanea.segmento(f"{tabla}.{r.nombre}#inicios") if r.multiple else None)
+            for r in esquema.relaciones
+        ]
+
+    def _decodificar(self, tipo: str, valor, nulo: Optional[int]):
+        if tipo == 'entero':
+            return None if valor == nulo else valor
+        if tipo == 'decimal':
+            return None if valor != valor else valor
+        if tipo == 'texto':
+            return self._instantanea.texto(valor)
+        if tipo == 'fecha_hora':
+            return None if valor == nulo else EPOCA + timedelta(microseconds=valor)
+        return None if valor < 0 else json.loads(self._instantanea.texto(valor))
+
+    def _materializar(self, fila: int):
+        valores = {nombre: self._decodificar(tipo, columna[fila], nulo)
+                   for nombre, tipo, columna, nulo in self._columnas}
+        for relacion, filas, inicios in self._relaciones:
+            destino = getattr(self._estado, relacion.destino)
+            if relacion.multiple:
+                valores[relacion.nombre] = [destino[j] for j in filas[inicios[fila]:inicios[fila + 1]]]
+            else:
+                valores[relacion.nombre] = destino[filas[fila]] if filas[fila] >= 0 else None
+        objeto = self._objetos[fila] = self.esquema.nuevo(valores)
+        return objeto
+
+    def __getitem__(self, posicion):
+        if isinstance(posicion, slice):
+            return [self[i] for i in range(*posicion.indices(len(self)))]
+        if posicion < 0:
+            posicion += len(self)
+        if not 0 <= posicion < len(self):
+            raise IndexError("Fila fuera de rango")
+        if posicion >= self._total:
+            return self._nuevos[posicion - self._total]
+        objeto = self._objetos[posicion]
+        return objeto if objeto is not None else self._materializar(posicion)
+
+    def __len__(self) -> int:
+        return self._total + len(self._nuevos)
+
+    def append(self, objeto) -> None:
+        self._nuevos.append(objeto)
+        if self._indice is not None:
+            self._indice[getattr(objeto, self.esquema.campo_id)] = len(self) - 1
+
+    # ---------- consultas sin construir objetos ----------
+
+    def _columna(self, nombre: str) -> tuple:
+        for columna in self._columnas:
+            if columna[0] == nombre:
+                return columna
+        raise ValueError(f"{self.esquema.tabla} no tiene la columna {nombre}")
+
+    def columna(self, nombre: str) -> memoryview:
+        """
+        Valores crudos de una columna tal como se guardaron: códigos en las de
+        texto y el mínimo del formato en lugar de None en las enteras.
+        """
+        return self._columna(nombre)[2]
+
+    def valores(self, nombre: str) -> list:
+        """Valores decodificados de una columna (objetos nuevos incluidos)."""
+        _, tipo, columna, nulo = self._columna(nombre)
+        guardados = [self._decodificar(tipo, v, nulo) if o is None else getattr(o, nombre)
+                     for v, o in zip(columna, self._objetos)]
+        return guardados + [getattr(o, nombre) for o in self._nuevos]
+
+    def por_id(self, valor):
+        """Objeto por su campo_id (el índice se arma en la primera consulta), o None."""
+        if self._indice is None:
+            self._indice = {v: i for i, v in enumerate(self.valores(self.esquema.campo_id))}
+        posicion = self._indice.get(valor)
+        return None if posicion is None else self[posicion]
+
+    @property
+    def materializados(self) -> int:
+        """Objetos de la instantánea ya construidos."""
+        return self._total - self._objetos.count(None)
+
+
+# ==============================
+# CONTENEDOR DEL ESTADO
+# ==============================
+
+class EstadoAdmision:
+    """Todas las tablas del proceso de admisión (listas o colecciones restauradas)."""
+
+    TABLAS = tuple(ESQUEMAS)
+
+    def __init__(self, **tablas):
+        desconocidas = set(tablas) - set(self.TABLAS)
+        if desconocidas:
+            raise ValueError(f"Tablas desconocidas: {', '.join(sorted(desconocidas))}")
+        for tabla in self.TABLAS:
+            setattr(self, tabla, list(tablas.get(tabla, ())))
+        self._instantanea: Optional[Instantanea] = None
+
+    def guardar(self, ruta: str) -> dict:
+        """Escribe la instantánea del estado (ver guardar_instantanea)."""
+        return guardar_instantanea(ruta, {tabla: getattr(self, tabla) for tabla in self.TABLAS})
+
+    @classmethod
+    def cargar(cls, ruta: str, asignador: Optional[AsignadorIds] = None) -> 'EstadoAdmision':
+        """
+        Restaura un estado sin construir objetos. Los IDs que entregue el
+        asignador (por defecto el de los modelos) continúan después de los
+        guardados, para que los objetos nuevos no repitan IDs.
+        """
+        instantanea = Instantanea(ruta)
+        estado = cls.__new__(cls)
+        estado._instantanea = instantanea
+        for tabla, esquema in ESQUEMAS.items():
+            setattr(estado, tabla, ColeccionInstantanea(instantanea, esquema, estado))
+
+        asignador = asignador or AsignadorIds.predeterminado()
+        for tabla, esquema in ESQUEMAS.items():
+            if esquema.secuencia:
+                asignador.avanzar(esquema.secuencia,
+                                  instantanea.cabecera['tablas'][tabla]['maximo_id'] - esquema.desfase)
+        return estado
+
+    def resumen(self) -> Dict[str, int]:
+        return {tabla: len(getattr(self, tabla)) for tabla in self.TABLAS}
+
+    def cerrar(self) -> None:
+        """Libera el archivo mapeado (los objetos ya construidos siguen siendo válidos)."""
+        if self._instantanea is not None:
+            self._instantanea.cerrar()
+            self._instantanea = None
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import random
+    import tempfile
+    import time
+    from models.Evaluacion import Evaluacion
+    from models.Inscripcion import Inscripcion
+    from models.ofertaCarrera import OfertaCarrera
+    from models.Postulante import Postulante
+    from models.RegistroNacional import RegistroNacional
+
+    print("=" * 70)
+    print("PRUEBA: INSTANTÁNEA BINARIA DEL ESTADO DE ADMISIÓN")
+    print("=" * 70)
+
+    generador = random.Random(5)
+    cantidad = 200_000
+    ofertas = [OfertaCarrera(100 + i, f"CARRERA {i}", i % 9 + 1, None, 120, "TERCER NIVEL",
+                             "PRESENCIAL", OfertaCarrera.JORNADAS[i % 3], mostrar=False) for i in range(300)]
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        registros, postulantes, inscripciones = [], [], []
+        programacion = Evaluacion.calcular_programacion('matutina')
+        for i in range(cantidad):
+            cedula = f"13{i:08d}"
+            registro = RegistroNacional(cedula, "NOMBRE", "APELLIDO")
+            registro.completar_ubicacion("MANABI", generador.choice(["MANTA", "CHONE", "JIPIJAPA"]),
+                                         "", "", "")
+            registros.append(registro)
+            postulante = Postulante(cedula, "NOMBRE APELLIDO", f"p{i}@correo.com", "0999999999",
+                                    "2007-01-01", mostrar=False)
+            postulantes.append(postulante)
+            oferta = generador.choice(ofertas)
+            inscripcion = Inscripcion(postulante.id_postulante, oferta.carrera_id, 1, oferta.sede_id,
+                                      oferta.jornada.lower(), cedula, evaluacion_diferida=True)
+            postulante.agregarInscripcion(inscripcion, mostrar=False)
+            inscripciones.append(inscripcion)
+        for inscripcion in inscripciones[::2]:
+            inscripcion._evaluacion = Evaluacion(inscripcion.id_inscripcion, 'practico',
+                                                 inscripcion.sede_id, auto_programar=False)
+            inscripcion._evaluacion.aplicar_programacion(programacion)
+    print(f"\nConstrucción de {cantidad:,} postulantes: {time.perf_counter() - inicio:.1f} s")
+
+    estado = EstadoAdmision(registros=registros, postulantes=postulantes, ofertas=ofertas,
+                            inscripciones=inscripciones)
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'admision.snap')
+        inicio = time.perf_counter()
+        resumen = estado.guardar(ruta)
+        print(f"Guardado en {time.perf_counter() - inicio:.1f} s: {resumen['bytes'] / 1e6:.1f} MB "
+              f"({resumen['evaluaciones']:,} evaluaciones incluidas por relación)")
+
+        inicio = time.perf_counter()
+        restaurado = EstadoAdmision.cargar(ruta)
+        print(f"Restaurado en {(time.perf_counter() - inicio) * 1000:.1f} ms: {restaurado.resumen()}")
+
+        inicio = time.perf_counter()
+        postulante = restaurado.postulantes.por_id(postulantes[12345].id_postulante)
+        inscripcion = postulante.obtenerInscripciones()[0]
+        print(f"Postulante {postulante.cedula}: inscripción {inscripcion.id_inscripcion} ({inscripcion.jornada}), "
+              f"con evaluación: {inscripcion._evaluacion is not None} "
+              f"({(time.perf_counter() - inicio) * 1000:.0f} ms incluido el índice)")
+        print(f"Objetos construidos: {restaurado.postulantes.materializados} postulante(s), "
+              f"{restaurado.registros.materializados} registros")
+        restaurado.cerrar()
+    print("=" * 70)
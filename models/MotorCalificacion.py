@@ -0,0 +1,233 @@
+"""
+Módulo: MotorCalificacion
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Motor opcional de calificación de hojas de respuesta. Recibe la matriz de
+    respuestas (postulantes × ítems, un byte por respuesta) y las claves de cada
+    forma de examen para los tipos 'practico' y 'escrito', calcula el puntaje
+    bruto y el escalado (0-1000) con NumPy y lo registra en cada Evaluacion.
+
+    Codificación de respuestas: 0 = A, 1 = B, 2 = C, ... y 255 = en blanco.
+    En una clave, 255 marca un ítem anulado (no cuenta para nadie).
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import models.Categorias as Categorias
+from models.Evaluacion import Evaluacion
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional en el resto del sistema
+    np = None
+
+
+RESPUESTA_EN_BLANCO = 255
+ITEM_ANULADO = 255
+
+
+class MotorCalificacion:
+    """
+    Califica matrices de respuestas por bloques usando broadcasting.
+    Las claves se registran por tipo de evaluación y número de forma.
+    """
+
+    TIPOS_EVALUACION = Categorias.TIPOS_EVALUACION
+
+    def __init__(self, num_items: int, puntaje_maximo: float = 1000,
+                 tamano_bloque: int = 131072):
+        if np is None:
+            raise ImportError("El motor de calificación requiere NumPy (pip install numpy)")
+        if num_items <= 0:
+            raise ValueError("El número de ítems debe ser mayor a 0")
+
+        self.num_items = num_items
+        self.puntaje_maximo = puntaje_maximo
+        self.tamano_bloque = tamano_bloque
+        self._claves: Dict[str, Dict[int, 'np.ndarray']] = {}
+
+    # ==============================
+    # CLAVES DE RESPUESTAS
+    # ==============================
+
+    def agregar_clave(self, tipo: str, forma: int, clave: Sequence[int]) -> None:
+        """
+        Registra la clave de una forma de examen.
+
+        Args:
+            tipo: 'practico' o 'escrito' (ver Inscripcion._determinar_tipo_evaluacion)
+            forma: Número de forma (0, 1, 2...)
+            clave: Opción correcta por ítem (255 = ítem anulado)
+        """
+        tipo = self.TIPOS_EVALUACION.normalizar(tipo)
+
+        clave = np.asarray(clave, dtype=np.uint8)
+        if clave.shape != (self.num_items,):
+            raise ValueError(f"La clave debe tener {self.num_items} ítems")
+        if np.all(clave == ITEM_ANULADO):
+            raise ValueError("La clave no puede tener todos los ítems anulados")
+
+        self._claves.setdefault(tipo, {})[forma] = clave
+
+    def matriz_claves(self, tipo: str, formas_usadas: Iterable[int] = (0,)):
+        """
+        Claves de todas las formas de un tipo (también la usa AnalisisItems).
+
+        Args:
+            formas_usadas: Formas presentes en el lote; todas deben tener clave
+                (una forma sin clave dejaría a sus postulantes con 0)
+
+        Returns:
+            tuple: (matriz uint8 formas × ítems, con 255 en las formas sin clave;
+                    puntaje por acierto de cada forma)
+        """
+        tipo = self.TIPOS_EVALUACION.normalizar(tipo)
+        formas = self._claves.get(tipo)
+        if not formas:
+            raise ValueError(f"No hay claves registradas para el tipo '{tipo}'")
+        sin_clave = set(formas_usadas) - set(formas)
+        if sin_clave:
+            raise ValueError(f"Hay filas con formas sin clave registrada para '{tipo}': {sorted(sin_clave)}")
+
+        num_formas = max(formas) + 1
+        claves = np.full((num_formas, self.num_items), ITEM_ANULADO, dtype=np.uint8)
+        for forma, clave in formas.items():
+            claves[forma] = clave
+
+        items_validos = (claves != ITEM_ANULADO).sum(axis=1)
+        valor_item = np.where(items_validos > 0,
+                              self.puntaje_maximo / np.maximum(items_validos, 1), 0.0)
+        return claves, valor_item
+
+    # ==============================
+    # LECTURA DE MATRICES
+    # ==============================
+
+    def abrir_respuestas(self, ruta: str):
+        """Abre un archivo binario de respuestas con memory mapping (sin copiarlo)."""
+        return np.memmap(ruta, dtype=np.uint8, mode='r').reshape(-1, self.num_items)
+
+    # ==============================
+    # CALIFICACIÓN
+    # ==============================
+
+    def puntuar(self, respuestas, tipo: str, formas=None):
+        """
+        Calcula puntajes brutos y escalados.
+
+        Args:
+            respuestas: Matriz uint8 (postulantes × ítems), puede ser un memmap
+            tipo: Tipo de evaluación de todas las filas
+            formas: Forma de cada fila (None = todas usan la forma 0)
+
+        Returns:
+            tuple: (brutos como uint16, escalados como float64)
+        """
+        total = respuestas.shape[0]
+        if respuestas.shape[1] != self.num_items:
+            raise ValueError(f"La matriz debe tener {self.num_items} columnas")
+
+        if formas is None:
+            formas = np.zeros(total, dtype=np.intp)
+            usadas = (0,) if total else ()
+        else:
+            formas = np.asarray(formas, dtype=np.intp)
+            if formas.shape != (total,):
+                raise ValueError("Debe indicarse una forma por cada fila")
+            usadas = np.unique(formas).tolist()
+        claves, valor_item = self.matriz_claves(tipo, usadas)
+
+        brutos = np.empty(total, dtype=np.uint16)
+        una_forma = claves.shape[0] == 1
+        for inicio in range(0, total, self.tamano_bloque):
+            fin = min(inicio + self.tamano_bloque, total)
+            bloque = np.asarray(respuestas[inicio:fin])
+            # Broadcasting: (filas × ítems) contra la clave de cada fila
+            clave_filas = claves[0] if una_forma else claves[formas[inicio:fin]]
+            aciertos = (bloque == clave_filas) & (clave_filas != ITEM_ANULADO)
+            aciertos.sum(axis=1, dtype=np.uint16, out=brutos[inicio:fin])
+
+        escalados = np.round(brutos * valor_item[formas], 2)
+        np.minimum(escalados, self.puntaje_maximo, out=escalados)
+        return brutos, escalados
+
+    def calificar_evaluaciones(self, evaluaciones: List[Evaluacion], respuestas,
+                               formas=None) -> dict:
+        """
+        Califica y registra el resultado en cada Evaluacion.
+        La fila i de la matriz corresponde a evaluaciones[i]; el tipo
+        de clave se toma de evaluacion.tipo.
+
+        Returns:
+            dict: Evaluaciones calificadas por tipo
+        """
+        if len(evaluaciones) != respuestas.shape[0]:
+            raise ValueError("Debe existir una fila de respuestas por evaluación")
+
+        formas = None if formas is None else np.asarray(formas, dtype=np.intp)
+        tipos = np.array([e.tipo for e in evaluaciones])
+        resumen = {}
+
+        for tipo in np.unique(tipos).tolist():
+            filas = np.flatnonzero(tipos == tipo)
+            _, escalados = self.puntuar(respuestas[filas], tipo,
+                                        None if formas is None else formas[filas])
+            seleccion = [evaluaciones[i] for i in filas.tolist()]
+            resumen[tipo] = Evaluacion.registrar_calificaciones_lote(seleccion, escalados.tolist())
+
+        return resumen
+
+
+def generar_respuestas_simuladas(num_postulantes: int, num_items: int,
+                                 clave: Optional[Sequence[int]] = None,
+                                 opciones: int = 4, semilla: int = 2025):
+    """Genera una matriz de respuestas aleatoria (útil para pruebas y benchmarks)."""
+    generador = np.random.default_rng(semilla)
+    respuestas = generador.integers(0, opciones, size=(num_postulantes, num_items), dtype=np.uint8)
+    if clave is not None:
+        # Cada postulante acierta con una probabilidad distinta
+        habilidad = generador.random(num_postulantes)[:, None]
+        aciertos = generador.random((num_postulantes, num_items)) < habilidad
+        respuestas = np.where(aciertos, np.asarray(clave, dtype=np.uint8), respuestas)
+    return respuestas
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    print("=" * 70)
+    print("PRUEBA: MOTOR DE CALIFICACIÓN VECTORIZADO")
+    print("=" * 70)
+
+    NUM_POSTULANTES = 500_000
+    NUM_ITEMS = 120
+
+    motor = MotorCalificacion(num_items=NUM_ITEMS)
+    generador = np.random.default_rng(7)
+    clave_a = generador.integers(0, 4, NUM_ITEMS, dtype=np.uint8)
+    clave_b = generador.integers(0, 4, NUM_ITEMS, dtype=np.uint8)
+    motor.agregar_clave('escrito', 0, clave_a)
+    motor.agregar_clave('escrito', 1, clave_b)
+
+    respuestas = generar_respuestas_simuladas(NUM_POSTULANTES, NUM_ITEMS, clave_a)
+    formas = generador.integers(0, 2, NUM_POSTULANTES)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "respuestas.bin")
+        respuestas.tofile(ruta)
+        matriz = motor.abrir_respuestas(ruta)
+
+        inicio = time.perf_counter()
+        brutos, escalados = motor.puntuar(matriz, 'escrito', formas)
+        duracion = time.perf_counter() - inicio
+        del matriz
+
+    print(f"\nPostulantes: {NUM_POSTULANTES:,} | Ítems: {NUM_ITEMS}")
+    print(f"Tiempo de calificación: {duracion:.2f} s")
+    print(f"Puntaje escalado promedio: {escalados.mean():.2f}")
+    print(f"Puntaje bruto máximo: {brutos.max()}")
+    print("=" * 70)
@@ -0,0 +1,61 @@
+"""
+Módulo: Normalizacion
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Funciones de normalización de texto en español para búsquedas y
+    comparaciones: quitar tildes y diéresis, pasar a minúsculas y separar
+    en palabras. "Tecnologías", "TECNOLOGIAS" y "tecnologias" quedan iguales.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List
+
+# Palabras que no ayudan a distinguir una carrera de otra
+PALABRAS_VACIAS = frozenset({
+    'a', 'al', 'de', 'del', 'el', 'en', 'la', 'las', 'lo', 'los', 'o', 'para',
+    'por', 'u', 'un', 'una', 'y', 'e', 'con'
+})
+
+_PATRON_PALABRA = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=65536)
+def plegar_acentos(texto: str) -> str:
+    """
+    Quita tildes/diéresis y pasa a minúsculas. La 'ñ' se conserva.
+
+    Ejemplo:
+        plegar_acentos("Administración de Empresas") -> "administracion de empresas"
+    """
+    descompuesto = unicodedata.normalize('NFD', texto.lower())
+    # La ñ se descompone en n + virgulilla: se recompone antes de filtrar
+    descompuesto = descompuesto.replace('n\u0303', '\u00f1')
+    return ''.join(c for c in descompuesto if unicodedata.category(c) != 'Mn')
+
+
+def tokenizar(texto: str, quitar_vacias: bool = True) -> List[str]:
+    """Separa un texto plegado en palabras (sin palabras vacías por defecto)."""
+    palabras = _PATRON_PALABRA.findall(plegar_acentos(texto).replace('ñ', 'n'))
+    if quitar_vacias:
+        return [p for p in palabras if p not in PALABRAS_VACIAS]
+    return palabras
+
+
+def trigramas(palabra: str) -> List[str]:
+    """Trigramas de una palabra con bordes: 'sede' -> ['  s', ' se', 'sed', 'ede', 'de ']."""
+    relleno = f"  {palabra} "
+    return [relleno[i:i + 3] for i in range(len(relleno) - 2)]
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    print("=" * 70)
+    print("PRUEBA: NORMALIZACIÓN DE TEXTO")
+    print("=" * 70)
+    for texto in ["TECNOLOGÍAS DE LA INFORMACIÓN", "Ingeniería en Software",
+                  "Administración de Empresas", "Peña Güemes"]:
+        print(f"{texto:<35} -> {plegar_acentos(texto):<35} {tokenizar(texto)}")
+    print("=" * 70)
@@ -0,0 +1,147 @@
+"""
+Módulo: RegistroPostulantes
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Registro en memoria de postulantes con índices hash por cédula y por
+    id_postulante. Vincula a cada Postulante sus inscripciones, puntajes y
+    asignación, de modo que las consultas por cédula (evaluación, asignación,
+    puntaje) se resuelven en O(1) sin recorrer listas globales.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from models.Postulante import Postulante
+
+
+class RegistroPostulantes:
+    """
+    Un solo Postulante por cédula. Las inscripciones, puntajes y asignaciones
+    se enlazan al postulante dueño usando su id_postulante.
+    """
+
+    def __init__(self):
+        self._por_cedula: Dict[str, Postulante] = {}
+        self._por_id: Dict[int, Postulante] = {}
+
+    # ==============================
+    # ALTAS
+    # ==============================
+
+    def agregar(self, postulante: Postulante) -> None:
+        """
+        Registra un postulante ya creado.
+
+        Raises:
+            ValueError: Si la cédula ya está registrada
+        """
+        if postulante.cedula in self._por_cedula:
+            raise ValueError(f"Ya existe un postulante con cedula {postulante.cedula}")
+        self._por_cedula[postulante.cedula] = postulante
+        self._por_id[postulante.id_postulante] = postulante
+
+    def obtener_o_crear(self, cedula: str, nombre_completo: str, email: str,
+                        telefono: str, fecha_nacimiento: str,
+                        mostrar: bool = True) -> Tuple[Postulante, bool]:
+        """
+        Devuelve el postulante de la cédula o lo crea si no existe.
+
+        Returns:
+            tuple: (postulante, True si se creó)
+        """
+        postulante = self._por_cedula.get(cedula.strip())
+        if postulante is not None:
+            return postulante, False
+
+        postulante = Postulante(cedula=cedula, nombre_completo=nombre_completo, email=email,
+                                telefono=telefono, fecha_nacimiento=fecha_nacimiento,
+                                mostrar=mostrar)
+        self.agregar(postulante)
+        return postulante, True
+
+    # ==============================
+    # VÍNCULOS INVERSOS
+    # ==============================
+
+    def _dueno(self, id_postulante: int) -> Postulante:
+        postulante = self._por_id.get(id_postulante)
+        if postulante is None:
+            raise ValueError(f"No existe el postulante {id_postulante}")
+        return postulante
+
+    def vincular_inscripcion(self, inscripcion) -> None:
+        """Enlaza una Inscripcion (y por ella su Evaluacion) a su postulante."""
+        self._dueno(inscripcion.id_postulante).agregarInscripcion(inscripcion, mostrar=False)
+
+    def vincular_puntaje(self, puntaje) -> None:
+        """Enlaza un PuntajePostulacion a su postulante."""
+        self._dueno(puntaje.id_postulante).agregarPuntaje(puntaje)
+
+    def vincular_asignacion(self, asignacion) -> None:
+        """Enlaza la Asignacion de cupo a su postulante."""
+        self._dueno(asignacion.id_postulante).establecerAsignacion(asignacion)
+
+    # ==============================
+    # CONSULTAS O(1)
+    # ==============================
+
+    def obtener_por_cedula(self, cedula: str) -> Optional[Postulante]:
+        return self._por_cedula.get(cedula.strip())
+
+    def obtener_por_id(self, id_postulante: int) -> Optional[Postulante]:
+        return self._por_id.get(id_postulante)
+
+    def inscripciones(self, cedula: str) -> Sequence:
+        postulante = self.obtener_por_cedula(cedula)
+        return postulante.obtenerInscripciones() if postulante else ()
+
+    def evaluaciones(self, cedula: str) -> List:
+        """Evaluaciones de las inscripciones no canceladas del postulante."""
+        return [evaluacion for evaluacion in
+                (i.obtenerEvaluacion() for i in self.inscripciones(cedula) if i.estado != 'CANCELADA')
+                if evaluacion is not None]
+
+    def puntajes(self, cedula: str) -> Sequence:
+        postulante = self.obtener_por_cedula(cedula)
+        return postulante.obtenerPuntajes() if postulante else ()
+
+    def asignacion(self, cedula: str):
+        postulante = self.obtener_por_cedula(cedula)
+        return postulante.obtenerAsignacion() if postulante else None
+
+    def __len__(self) -> int:
+        return len(self._por_id)
+
+    def __iter__(self) -> Iterator[Postulante]:
+        return iter(self._por_id.values())
+
+    def __contains__(self, cedula: str) -> bool:
+        return cedula.strip() in self._por_cedula
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    from models.Inscripcion import Inscripcion
+    from models.PuntajePostulacion import PuntajePostulacion
+
+    print("=" * 70)
+    print("PRUEBA: REGISTRO DE POSTULANTES")
+    print("=" * 70)
+
+    registro = RegistroPostulantes()
+    postulante, creado = registro.obtener_o_crear("1316202082", "Jean Pierre Flores Piloso",
+                                                  "jean@uleam.edu.ec", "0979421538", "2007-03-01")
+    _, creado_otra_vez = registro.obtener_o_crear("1316202082", "Jean Pierre Flores Piloso",
+                                                  "jean@uleam.edu.ec", "0979421538", "2007-03-01")
+    print(f"\nCreado: {creado} | Creado al repetir: {creado_otra_vez}")
+
+    inscripcion = Inscripcion(postulante.id_postulante, 101, 1, 1, "MATUTINA",
+                              cedula_postulante=postulante.cedula, evaluacion_diferida=True)
+    registro.vincular_inscripcion(inscripcion)
+    registro.vincular_puntaje(PuntajePostulacion(postulante.id_postulante, 9.5, 850,
+                                                 postulante.cedula, 700))
+
+    print(f"Inscripciones: {len(registro.inscripciones('1316202082'))}")
+    print(f"Evaluaciones: {len(registro.evaluaciones('1316202082'))}")
+    print(f"Puntaje final: {registro.puntajes('1316202082')[0].puntaje_final}")
+    print("=" * 70)
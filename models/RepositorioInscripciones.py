@@ -0,0 +1,243 @@
+"""
+Módulo: RepositorioInscripciones
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Repositorio en memoria de inscripciones con índices hash por postulante,
+    cédula, carrera y sede. Valida en O(1) por fila que cada postulante no
+    supere MAX_PREFERENCIAS, no repita un orden de preferencia ni una carrera,
+    y mantiene contadores de demanda por oferta sin recorrer la lista.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.Inscripcion import Inscripcion
+
+
+class RepositorioInscripciones:
+    """
+    Guarda las inscripciones del periodo y sus índices.
+    Solo las inscripciones no canceladas ocupan preferencia y cuentan en la demanda.
+    """
+
+    def __init__(self):
+        self._por_id: Dict[int, Inscripcion] = {}
+        self._por_postulante: Dict[int, List[Inscripcion]] = {}
+        self._por_cedula: Dict[str, List[Inscripcion]] = {}
+        self._por_carrera: Dict[int, List[Inscripcion]] = {}
+        self._por_sede: Dict[int, List[Inscripcion]] = {}
+
+        # Preferencias activas de cada postulante
+        self._ordenes_activos: Dict[int, Dict[int, Inscripcion]] = {}
+        self._carreras_activas: Dict[int, Dict[int, Inscripcion]] = {}
+
+        # Demanda activa por carrera, por (carrera, sede) y por oferta (carrera, sede, jornada)
+        self._demanda_carrera = Counter()
+        self._demanda_sede = Counter()
+        self._demanda_oferta = Counter()
+
+        # Observadores de la demanda (p. ej. ResumenSedes)
+        self._observadores = []
+
+    # ==============================
+    # VALIDACIÓN O(1)
+    # ==============================
+
+    def _motivo_rechazo(self, id_postulante: int, carrera_id: int,
+                        orden_preferencia: int) -> Optional[str]:
+        """Devuelve el motivo por el que no se puede inscribir, o None."""
+        ordenes = self._ordenes_activos.get(id_postulante, {})
+        if len(ordenes) >= Inscripcion.MAX_PREFERENCIAS:
+            return f"El postulante ya tiene {Inscripcion.MAX_PREFERENCIAS} preferencias activas"
+        if orden_preferencia in ordenes:
+            return f"El orden de preferencia {orden_preferencia} ya está ocupado"
+        if carrera_id in self._carreras_activas.get(id_postulante, {}):
+            return f"El postulante ya está inscrito en la carrera {carrera_id}"
+        return None
+
+    # ==============================
+    # ALTAS
+    # ==============================
+
+    def agregar(self, inscripcion: Inscripcion) -> None:
+        """Registra una inscripción ya creada (valida unicidad)."""
+        if inscripcion.id_inscripcion in self._por_id:
+            raise ValueError(f"La inscripción {inscripcion.id_inscripcion} ya está registrada")
+        if inscripcion.estado != 'CANCELADA':
+            motivo = self._motivo_rechazo(inscripcion.id_postulante, inscripcion.carrera_id,
+                                          inscripcion.orden_preferencia)
+            if motivo:
+                raise ValueError(motivo)
+        self._indexar(inscripcion)
+
+    def crear_inscripcion(self, **datos) -> Inscripcion:
+        """
+        Valida y crea una inscripción con los mismos argumentos de Inscripcion.
+
+        Raises:
+            ValueError: Si viola MAX_PREFERENCIAS o la unicidad de orden/carrera
+        """
+        motivo = self._motivo_rechazo(datos['id_postulante'], datos['carrera_id'],
+                                      datos['orden_preferencia'])
+        if motivo:
+            raise ValueError(motivo)
+        inscripcion = Inscripcion(**datos)
+        self._indexar(inscripcion)
+        return inscripcion
+
+    def crear_inscripciones(self, filas: Iterable[dict],
+                            crear_evaluaciones: bool = True) -> Tuple[List[Inscripcion], List[tuple]]:
+        """
+        Crea inscripciones en bloque.
+
+        Cada fila es un dict con los argumentos de Inscripcion. Las evaluaciones
+        se crean al final en un solo lote (o al primer acceso si
+        crear_evaluaciones=False).
+
+        Returns:
+            tuple: (inscripciones creadas, rechazos como (posición, fila, motivo))
+        """
+        creadas = []
+        rechazadas = []
+
+        for posicion, fila in enumerate(filas):
+            try:
+                motivo = self._motivo_rechazo(fila['id_postulante'], fila['carrera_id'],
+                                              fila['orden_preferencia'])
+                if motivo is None:
+                    inscripcion = Inscripcion(**fila, evaluacion_diferida=True)
+            except (KeyError, TypeError) as error:
+                motivo = f"Fila incompleta: {error}"
+            except ValueError as error:
+                motivo = str(error)
+
+            if motivo:
+                rechazadas.append((posicion, fila, motivo))
+                continue
+
+            self._indexar(inscripcion)
+            creadas.append(inscripcion)
+
+        if crear_evaluaciones:
+            Inscripcion.crear_evaluaciones_lote(creadas)
+
+        return creadas, rechazadas
+
+    def _indexar(self, inscripcion: Inscripcion) -> None:
+        self._por_id[inscripcion.id_inscripcion] = inscripcion
+        self._por_postulante.setdefault(inscripcion.id_postulante, []).append(inscripcion)
+        self._por_cedula.setdefault(inscripcion.cedula_postulante, []).append(inscripcion)
+        self._por_carrera.setdefault(inscripcion.carrera_id, []).append(inscripcion)
+        self._por_sede.setdefault(inscripcion.sede_id, []).append(inscripcion)
+
+        if inscripcion.estado != 'CANCELADA':
+            self._activar(inscripcion, 1)
+
+    def _activar(self, inscripcion: Inscripcion, delta: int) -> None:
+        """Suma (delta=1) o resta (delta=-1) la inscripción de preferencias y demanda."""
+        id_postulante = inscripcion.id_postulante
+        if delta > 0:
+            self._ordenes_activos.setdefault(id_postulante, {})[inscripcion.orden_preferencia] = inscripcion
+            self._carreras_activas.setdefault(id_postulante, {})[inscripcion.carrera_id] = inscripcion
+        else:
+            self._ordenes_activos[id_postulante].pop(inscripcion.orden_preferencia, None)
+            self._carreras_activas[id_postulante].pop(inscripcion.carrera_id, None)
+
+        self._demanda_carrera[inscripcion.carrera_id] += delta
+        self._demanda_sede[(inscripcion.carrera_id, inscripcion.sede_id)] += delta
+        self._demanda_oferta[(inscripcion.carrera_id, inscripcion.sede_id, inscripcion.jornada)] += delta
+        for observador in self._observadores:
+            observador.demanda_cambiada(inscripcion, delta)
+
+    def suscribir(self, observador) -> None:
+        """Registra un observador que recibe demanda_cambiada(inscripcion, delta)."""
+        if observador not in self._observadores:
+            self._observadores.append(observador)
+
+    # ==============================
+    # BAJAS
+    # ==============================
+
+    def cancelar(self, id_inscripcion: int) -> None:
+        """Cancela una inscripción y libera su preferencia."""
+        inscripcion = self.obtener(id_inscripcion)
+        if inscripcion is None:
+            raise ValueError(f"No existe la inscripción {id_inscripcion}")
+        if inscripcion.estado == 'CANCELADA':
+            return
+        inscripcion.cancelar()
+        self._activar(inscripcion, -1)
+
+    # ==============================
+    # CONSULTAS
+    # ==============================
+
+    def obtener(self, id_inscripcion: int) -> Optional[Inscripcion]:
+        return self._por_id.get(id_inscripcion)
+
+    def obtener_activa(self, id_postulante: int, orden_preferencia: int) -> Optional[Inscripcion]:
+        """Inscripción activa que ocupa un orden de preferencia del postulante."""
+        return self._ordenes_activos.get(id_postulante, {}).get(orden_preferencia)
+
+    def buscar_por_postulante(self, id_postulante: int) -> List[Inscripcion]:
+        return list(self._por_postulante.get(id_postulante, ()))
+
+    def buscar_por_cedula(self, cedula: str) -> List[Inscripcion]:
+        return list(self._por_cedula.get(cedula, ()))
+
+    def buscar_por_carrera(self, carrera_id: int) -> List[Inscripcion]:
+        return list(self._por_carrera.get(carrera_id, ()))
+
+    def buscar_por_sede(self, sede_id: int) -> List[Inscripcion]:
+        return list(self._por_sede.get(sede_id, ()))
+
+    def demanda(self, carrera_id: int, sede_id: Optional[int] = None,
+                jornada: Optional[str] = None) -> int:
+        """
+        Número de inscripciones activas para una carrera, carrera+sede
+        u oferta (carrera+sede+jornada), sin recorrer inscripciones.
+        """
+        if sede_id is None:
+            return self._demanda_carrera[carrera_id]
+        if jornada is None:
+            return self._demanda_sede[(carrera_id, sede_id)]
+        return self._demanda_oferta[(carrera_id, sede_id, jornada.lower())]
+
+    def preferencias_disponibles(self, id_postulante: int) -> List[int]:
+        """Órdenes de preferencia que el postulante aún puede usar."""
+        ocupados = self._ordenes_activos.get(id_postulante, {})
+        return [orden for orden in range(1, Inscripcion.MAX_PREFERENCIAS + 1)
+                if orden not in ocupados]
+
+    def __len__(self) -> int:
+        return len(self._por_id)
+
+    def __iter__(self):
+        return iter(self._por_id.values())
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    print("=" * 70)
+    print("PRUEBA: REPOSITORIO DE INSCRIPCIONES")
+    print("=" * 70)
+
+    repositorio = RepositorioInscripciones()
+    filas = [
+        {'id_postulante': 1, 'carrera_id': 101, 'orden_preferencia': 1, 'sede_id': 1,
+         'jornada': 'MATUTINA', 'cedula_postulante': '1316202082'},
+        {'id_postulante': 1, 'carrera_id': 102, 'orden_preferencia': 1, 'sede_id': 1,
+         'jornada': 'VESPERTINA', 'cedula_postulante': '1316202082'},
+        {'id_postulante': 1, 'carrera_id': 101, 'orden_preferencia': 2, 'sede_id': 1,
+         'jornada': 'MATUTINA', 'cedula_postulante': '1316202082'},
+        {'id_postulante': 2, 'carrera_id': 101, 'orden_preferencia': 1, 'sede_id': 1,
+         'jornada': 'MATUTINA', 'cedula_postulante': '1350432058'},
+    ]
+
+    creadas, rechazadas = repositorio.crear_inscripciones(filas)
+    print(f"\nCreadas: {len(creadas)} | Rechazadas: {len(rechazadas)}")
+    for posicion, _, motivo in rechazadas:
+        print(f"  Fila {posicion + 1}: {motivo}")
+    print(f"Demanda TI Manta matutina: {repositorio.demanda(101, 1, 'matutina')}")
+    print("=" * 70)
@@ -0,0 +1,230 @@
+"""
+Módulo: ResumenSedes
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Totales por sede, jornada y modalidad que se mantienen al día sin
+    recorrer ofertas: cupos totales, cupos asignados por segmento e
+    inscripciones por orden de preferencia.
+      - Observa cada OfertaCarrera (reservarCupo / liberarCupo /
+        configurar_desde_pdf) y el RepositorioInscripciones (altas y
+        cancelaciones); cada evento actualiza un número fijo de acumulados.
+      - Cualquier combinación de sede_id, jornada y modalidad se consulta en O(1).
+      - Opcionalmente mantiene total_carreras y total_cupos de cada SedeCampus.
+"""
+
+from collections import Counter
+from itertools import combinations
+from typing import Dict, Iterable, Optional, Tuple
+
+import models.Categorias as Categorias
+
+
+class Acumulado:
+    """Totales de un grupo de ofertas."""
+
+    __slots__ = ('ofertas', 'cupos_total', 'asignados', 'inscripciones')
+
+    def __init__(self):
+        self.ofertas = 0
+        self.cupos_total = 0
+        self.asignados: Counter = Counter()        # segmento -> cupos asignados
+        self.inscripciones: Counter = Counter()    # orden de preferencia -> inscripciones activas
+
+    @property
+    def total_asignados(self) -> int:
+        return sum(self.asignados.values())
+
+    @property
+    def total_inscripciones(self) -> int:
+        return sum(self.inscripciones.values())
+
+    def a_dict(self) -> dict:
+        ocupacion = self.total_asignados / self.cupos_total * 100 if self.cupos_total > 0 else 0
+        return {
+            'ofertas': self.ofertas,
+            'total_cupos': self.cupos_total,
+            'asignados': self.total_asignados,
+            'disponibles': self.cupos_total - self.total_asignados,
+            'ocupacion_%': round(ocupacion, 2),
+            'segmentos': dict(self.asignados),
+            'inscripciones': self.total_inscripciones,
+            'por_preferencia': dict(sorted(self.inscripciones.items()))
+        }
+
+
+def _etiqueta(categoria, valor: Optional[str]) -> Optional[str]:
+    """
+    Etiqueta oficial (la que guarda OfertaCarrera) de un valor en cualquier
+    escritura: 'matutina' de una inscripción y 'MATUTINA' de una oferta
+    caen en el mismo acumulado. Los valores desconocidos van en mayúsculas.
+    """
+    if not valor:
+        return None
+    oficial = categoria.oficial(valor)
+    return oficial if oficial is not None else valor.upper()
+
+
+class ResumenSedes:
+    """
+    Acumulados por cada subconjunto de (sede_id, jornada, modalidad),
+    incluido el total general (subconjunto vacío).
+    """
+
+    CAMPOS = ('sede_id', 'jornada', 'modalidad')
+
+    def __init__(self, ofertas: Iterable = (), repositorio=None):
+        self._acumulados: Dict[Tuple[Tuple[str, ...], tuple], Acumulado] = {}
+        self._ofertas: Dict[int, object] = {}
+        self._por_carrera_sede: Dict[Tuple[int, int, str], object] = {}
+        self._sedes: Dict[int, object] = {}
+        for oferta in ofertas:
+            self.registrar_oferta(oferta)
+        if repositorio is not None:
+            self.observar_repositorio(repositorio)
+
+    # ==============================
+    # REGISTRO
+    # ==============================
+
+    def registrar_sede(self, sede) -> None:
+        """Mantiene total_carreras y total_cupos de la SedeCampus con las ofertas registradas."""
+        self._sedes[sede.sede_id] = sede
+        acumulado = self._acumulados.get((('sede_id',), (sede.sede_id,)))
+        sede.total_carreras = acumulado.ofertas if acumulado else 0
+        sede.total_cupos = acumulado.cupos_total if acumulado else 0
+
+    def registrar_oferta(self, oferta) -> None:
+        """Suma la oferta a los acumulados y se suscribe a sus cambios de cupos."""
+        if id(oferta) in self._ofertas:
+            return
+        self._ofertas[id(oferta)] = oferta
+        clave = (oferta.carrera_id, oferta.sede_id, _etiqueta(Categorias.JORNADAS, oferta.jornada))
+        self._por_carrera_sede[clave] = oferta
+
+        for acumulado in self._acumulados_de(oferta.sede_id, oferta.jornada, oferta.modalidad):
+            acumulado.ofertas += 1
+            acumulado.cupos_total += oferta.cupos_total
+            acumulado.asignados.update(oferta.cupos_asignados)
+        self._actualizar_sede(oferta.sede_id, carreras=1, cupos=oferta.cupos_total)
+        oferta.suscribir(self)
+
+    def observar_repositorio(self, repositorio) -> None:
+        """Suma las inscripciones activas ya registradas y se suscribe a las nuevas."""
+        for inscripcion in repositorio:
+            if inscripcion.estado != 'CANCELADA':
+                self.demanda_cambiada(inscripcion, 1)
+        repositorio.suscribir(self)
+
+    def _acumulados_de(self, sede_id: int, jornada: str, modalidad: Optional[str]):
+        """Los acumulados (uno por subconjunto de CAMPOS) que incluyen esta oferta."""
+        valores = {'sede_id': sede_id, 'jornada': _etiqueta(Categorias.JORNADAS, jornada),
+                   'modalidad': _etiqueta(Categorias.MODALIDADES, modalidad)}
+        for campos in _SUBCONJUNTOS:
+            clave = (campos, tuple(valores[c] for c in campos))
+            acumulado = self._acumulados.get(clave)
+            if acumulado is None:
+                acumulado = self._acumulados[clave] = Acumulado()
+            yield acumulado
+
+    def _actualizar_sede(self, sede_id: int, carreras: int = 0, cupos: int = 0) -> None:
+        sede = self._sedes.get(sede_id)
+        if sede is not None:
+            sede.total_carreras += carreras
+            sede.total_cupos += cupos
+
+    # ==============================
+    # EVENTOS (O(1) cada uno)
+    # ==============================
+
+    def cupo_reservado(self, oferta, segmento: str) -> None:
+        for acumulado in self._acumulados_de(oferta.sede_id, oferta.jornada, oferta.modalidad):
+            acumulado.asignados[segmento] += 1
+
+    def cupo_liberado(self, oferta, segmento: str) -> None:
+        for acumulado in self._acumulados_de(oferta.sede_id, oferta.jornada, oferta.modalidad):
+            acumulado.asignados[segmento] -= 1
+
+    def cupos_total_cambiado(self, oferta, anterior: int) -> None:
+        diferencia = oferta.cupos_total - anterior
+        for acumulado in self._acumulados_de(oferta.sede_id, oferta.jornada, oferta.modalidad):
+            acumulado.cupos_total += diferencia
+        self._actualizar_sede(oferta.sede_id, cupos=diferencia)
+
+    def demanda_cambiada(self, inscripcion, delta: int) -> None:
+        """Alta (delta=1) o cancelación (delta=-1) de una inscripción."""
+        jornada = _etiqueta(Categorias.JORNADAS, inscripcion.jornada)
+        oferta = self._por_carrera_sede.get((inscripcion.carrera_id, inscripcion.sede_id, jornada))
+        modalidad = oferta.modalidad if oferta is not None else None
+        for acumulado in self._acumulados_de(inscripcion.sede_id, jornada, modalidad):
+            acumulado.inscripciones[inscripcion.orden_preferencia] += delta
+
+    # ==============================
+    # CONSULTAS
+    # ==============================
+
+    def resumen(self, sede_id: Optional[int] = None, jornada: Optional[str] = None,
+                modalidad: Optional[str] = None) -> dict:
+        """Totales del grupo indicado (sin filtros = toda la oferta)."""
+        filtros = {'sede_id': sede_id,
+                   'jornada': _etiqueta(Categorias.JORNADAS, jornada),
+                   'modalidad': _etiqueta(Categorias.MODALIDADES, modalidad)}
+        campos = tuple(c for c in self.CAMPOS if filtros[c] is not None)
+        acumulado = self._acumulados.get((campos, tuple(filtros[c] for c in campos)))
+        return (acumulado or Acumulado()).a_dict()
+
+    def por_sede(self) -> Dict[int, dict]:
+        """Resumen de cada sede con ofertas registradas."""
+        return {valores[0]: acumulado.a_dict()
+                for (campos, valores), acumulado in self._acumulados.items()
+                if campos == ('sede_id',)}
+
+
+# Cada subconjunto de los campos (incluido el vacío = total general) tiene su acumulado
+_SUBCONJUNTOS = [combinacion for n in range(len(ResumenSedes.CAMPOS) + 1)
+                 for combinacion in combinations(ResumenSedes.CAMPOS, n)]
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import random
+    import time
+    from models.ofertaCarrera import OfertaCarrera
+    from models.RepositorioInscripciones import RepositorioInscripciones
+
+    print("=" * 70)
+    print("PRUEBA: RESUMEN INCREMENTAL POR SEDE")
+    print("=" * 70)
+
+    generador = random.Random(7)
+    ofertas = [OfertaCarrera(100 + i, f"CARRERA {i}", i % 9 + 1, f"SEDE {i % 9 + 1}", 200,
+                             "TERCER NIVEL", generador.choice(OfertaCarrera.MODALIDADES),
+                             generador.choice(OfertaCarrera.JORNADAS[:3]), mostrar=False)
+               for i in range(2000)]
+    repositorio = RepositorioInscripciones()
+    resumen = ResumenSedes(ofertas, repositorio)
+
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(100_000):
+            generador.choice(ofertas).reservarCupo('GENERAL')
+    duracion = time.perf_counter() - inicio
+
+    filas = [{'id_postulante': i, 'carrera_id': oferta.carrera_id, 'orden_preferencia': 1,
+              'sede_id': oferta.sede_id, 'jornada': oferta.jornada.lower(),
+              'cedula_postulante': f"13{i:08d}"}
+             for i, oferta in enumerate(generador.sample(ofertas, 1500), 1)]
+    repositorio.crear_inscripciones(filas, crear_evaluaciones=False)
+
+    inicio_consulta = time.perf_counter()
+    manta = resumen.resumen(sede_id=1)
+    consulta = time.perf_counter() - inicio_consulta
+
+    print(f"\n100.000 reservas (con impresión de cada oferta) en {duracion:.2f} s")
+    print(f"Sede 1: {manta['total_cupos']:,} cupos | {manta['asignados']:,} asignados | "
+          f"{manta['inscripciones']} inscripciones ({consulta * 1e6:.1f} µs)")
+    print(f"Matutina presencial: {resumen.resumen(jornada='matutina', modalidad='presencial')['ofertas']} ofertas")
+    print(f"Total general asignados: {resumen.resumen()['asignados']:,}")
+    print("=" * 70)
@@ -0,0 +1,487 @@
+"""
+Módulo: ServicioInscripciones
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Servicio asíncrono (asyncio) de recepción de inscripciones para el día de
+    apertura. Expone el mismo flujo de main.crear_inscripcion
+    (RegistroNacional -> Postulante -> Inscripcion) como un endpoint HTTP/JSON
+    local, con:
+      - Cola de solicitudes acotada (si se llena responde 503 + Retry-After).
+      - Límite de solicitudes por cliente con token bucket (429 + Retry-After).
+        El cliente es la IP de la conexión; la cabecera X-Cliente-Id solo se
+        acepta si la conexión viene de un proxy configurado.
+      - Trabajadores que procesan la cola sin bloquear la recepción.
+    Incluye un arnés de carga que mide solicitudes por segundo en un núcleo.
+
+    Los reintentos son idempotentes: la misma cédula + carrera + orden (o la
+    misma cabecera Idempotency-Key) devuelve la inscripción ya creada con
+    estado 200, sin crear otro Postulante ni otra Evaluacion.
+
+    Endpoints:
+      POST /inscripciones  {"cedula", "carrera_id", "sede_id", "orden_preferencia"}
+                           + "jornada" si la carrera se oferta en varias jornadas
+                           en la sede, o {"cedula", "ofa_id", "orden_preferencia"}
+      GET  /salud          estadísticas del servicio
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import models.Categorias as Categorias
+from models.AsignadorIds import AsignadorIds
+from models.CatalogoOfertas import CatalogoOfertas
+from models.RegistroNacional import RegistroNacional
+from models.RegistroPostulantes import RegistroPostulantes
+from models.RepositorioInscripciones import RepositorioInscripciones
+from models.TablaIdempotencia import TablaIdempotencia
+
+
+# ==============================
+# LÍMITE DE TASA POR CLIENTE
+# ==============================
+
+class LimitadorTasa:
+    """Token bucket por cliente: 'tasa' solicitudes por segundo con ráfagas de 'capacidad'."""
+
+    def __init__(self, tasa: float = 20.0, capacidad: float = 40.0):
+        self.tasa = tasa
+        self.capacidad = capacidad
+        self._cubetas: Dict[str, list] = {}
+
+    def permitir(self, cliente: str, ahora: Optional[float] = None) -> Tuple[bool, float]:
+        """
+        Consume un token del cliente.
+
+        Returns:
+            tuple: (permitido, segundos a esperar si no se permitió)
+        """
+        ahora = time.monotonic() if ahora is None else ahora
+        cubeta = self._cubetas.get(cliente)
+        if cubeta is None:
+            cubeta = self._cubetas[cliente] = [self.capacidad, ahora]
+
+        tokens = min(self.capacidad, cubeta[0] + (ahora - cubeta[1]) * self.tasa)
+        cubeta[1] = ahora
+        if tokens >= 1:
+            cubeta[0] = tokens - 1
+            return True, 0.0
+        cubeta[0] = tokens
+        return False, (1 - tokens) / self.tasa
+
+    def limpiar(self, inactividad: float = 300.0, ahora: Optional[float] = None) -> None:
+        """Elimina clientes sin actividad reciente para acotar la memoria."""
+        limite = (time.monotonic() if ahora is None else ahora) - inactividad
+        for cliente in [c for c, (_, ultimo) in self._cubetas.items() if ultimo < limite]:
+            del self._cubetas[cliente]
+
+
+def longitud_contenido(valor: Optional[str]) -> Optional[int]:
+    """Valor de Content-Length (0 si falta), o None si no es un entero no negativo."""
+    valor = (valor or '0').strip()
+    return int(valor) if valor.isdigit() else None
+
+
+# ==============================
+# SERVICIO
+# ==============================
+
+class ErrorSolicitud(Exception):
+    """Error de negocio que se traduce a una respuesta HTTP."""
+
+    def __init__(self, estado: int, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+
+
+class ServicioInscripciones:
+    """
+    Recibe solicitudes por HTTP y las procesa con una cola acotada y
+    un número fijo de trabajadores.
+    """
+
+    RAZONES = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 409: 'Conflict', 413: 'Payload Too Large',
+               422: 'Unprocessable Entity', 429: 'Too Many Requests',
+               503: 'Service Unavailable', 504: 'Gateway Timeout'}
+    TAMANO_MAXIMO_CUERPO = 16 * 1024
+
+    def __init__(self, ofertas: Iterable, repositorio: Optional[RepositorioInscripciones] = None,
+                 tamano_cola: int = 1000, trabajadores: int = 4,
+                 limitador: Optional[LimitadorTasa] = None, tiempo_espera: float = 5.0,
+                 idempotencia: Optional[TablaIdempotencia] = None,
+                 postulantes: Optional[RegistroPostulantes] = None,
+                 proxies_confiables: Iterable[str] = (), intervalo_limpieza: float = 60.0):
+        """
+        Args:
+            proxies_confiables: IPs de proxies cuya cabecera X-Cliente-Id identifica
+                al cliente real; a las demás conexiones se las limita por su IP
+            intervalo_limpieza: Segundos entre limpiezas de clientes inactivos del limitador
+        """
+        self.ofertas = ofertas if isinstance(ofertas, CatalogoOfertas) else CatalogoOfertas(ofertas)
+        self.repositorio = repositorio or RepositorioInscripciones()
+        self.idempotencia = idempotencia or TablaIdempotencia()
+        self.postulantes = postulantes or RegistroPostulantes()
+        self.tamano_cola = tamano_cola
+        self.num_trabajadores = trabajadores
+        self.limitador = limitador or LimitadorTasa()
+        self.tiempo_espera = tiempo_espera
+        self.proxies_confiables = frozenset(proxies_confiables)
+        self.intervalo_limpieza = intervalo_limpieza
+
+        self._cola: Optional[asyncio.Queue] = None
+        self._tareas = []
+        self._servidor = None
+        self.estadisticas = {'recibidas': 0, 'creadas': 0, 'repetidas': 0, 'rechazadas': 0,
+                             'limitadas': 0, 'sobrecarga': 0}
+
+    # ---------- flujo de negocio (igual que main.crear_inscripcion) ----------
+
+    def procesar(self, solicitud: dict, clave_idempotencia: Optional[str] = None) -> Tuple[int, dict]:
+        """
+        Registro nacional -> Postulante -> Inscripcion.
+
+        Returns:
+            tuple: (201, inscripción creada) o (200, inscripción existente si es un reintento)
+        """
+        try:
+            cedula = str(solicitud['cedula']).strip()
+            orden = int(solicitud['orden_preferencia'])
+        except (KeyError, TypeError, ValueError):
+            raise ErrorSolicitud(400, "Se requiere cedula, carrera_id, sede_id y orden_preferencia")
+        oferta = self._buscar_oferta(solicitud)
+
+        clave = clave_idempotencia or TablaIdempotencia.clave_inscripcion(cedula, oferta.carrera_id, orden)
+        existente = self.idempotencia.obtener(clave)
+        if existente is not None and existente.estado != 'CANCELADA':
+            return 200, self._a_dict(existente)
+
+        registro = RegistroNacional.consultar_por_cedula(cedula)
+        if registro is None:
+            raise ErrorSolicitud(404, f"No existe registro nacional con cedula {cedula}")
+        if registro.estado != 'COMPLETO':
+            raise ErrorSolicitud(422, f"El registro debe estar COMPLETO. Estado actual: {registro.estado}")
+
+        try:
+            postulante, _ = self.postulantes.obtener_o_crear(
+                cedula=registro.identificacion,
+                nombre_completo=registro.obtener_nombre_completo(),
+                email=registro.correo or "sin_correo@uleam.edu.ec",
+                telefono=registro.celular or "0000000000",
+                fecha_nacimiento="2000-01-01",
+                mostrar=False
+            )
+
+            # Reintento cuya clave ya expiró: la inscripción sigue en el repositorio
+            existente = self.repositorio.obtener_activa(postulante.id_postulante, orden)
+            if existente is not None and existente.carrera_id == oferta.carrera_id:
+                self.idempotencia.guardar(clave, existente)
+                return 200, self._a_dict(existente)
+
+            inscripcion = self.repositorio.crear_inscripcion(
+                id_postulante=postulante.id_postulante,
+                carrera_id=oferta.carrera_id,
+                orden_preferencia=orden,
+                sede_id=oferta.sede_id,
+                jornada=oferta.jornada,
+                cedula_postulante=cedula,
+                evaluacion_diferida=True
+            )
+        except ValueError as error:
+            raise ErrorSolicitud(409, str(error))
+
+        self.postulantes.vincular_inscripcion(inscripcion)
+        self.idempotencia.guardar(clave, inscripcion)
+        return 201, self._a_dict(inscripcion)
+
+    def _buscar_oferta(self, solicitud: dict):
+        """Oferta por ofa_id, o por carrera_id + sede_id (+ jornada si hay varias)."""
+        try:
+            if solicitud.get('ofa_id') is not None:
+                oferta = self.ofertas.por_ofa_id(int(solicitud['ofa_id']))
+                candidatas = [] if oferta is None else [oferta]
+            else:
+                carrera_id, sede_id = int(solicitud['carrera_id']), int(solicitud['sede_id'])
+                candidatas = [o for o in self.ofertas.por_carrera(carrera_id) if o.sede_id == sede_id]
+        except (KeyError, TypeError, ValueError):
+            raise ErrorSolicitud(400, "Se requiere cedula, carrera_id, sede_id y orden_preferencia")
+
+        if solicitud.get('jornada') is not None:
+            jornada = Categorias.JORNADAS.oficial(solicitud['jornada'])
+            if jornada is None:
+                raise ErrorSolicitud(400, f"Jornada inválida: {solicitud['jornada']!r}. "
+                                          f"Debe ser: {', '.join(Categorias.JORNADAS)}.")
+            candidatas = [o for o in candidatas if o.jornada == jornada]
+        if not candidatas:
+            raise ErrorSolicitud(404, "No existe la oferta solicitada")
+        if len(candidatas) > 1:
+            raise ErrorSolicitud(400, "La carrera se oferta en varias jornadas en la sede "
+                                      f"({', '.join(o.jornada for o in candidatas)}): indique jornada u ofa_id")
+
+        oferta = candidatas[0]
+        # La evaluación necesita una jornada con horario (ver Categorias.JORNADAS_EVALUACION)
+        if oferta.jornada not in Categorias.JORNADAS_EVALUACION:
+            raise ErrorSolicitud(422, f"La oferta {oferta.ofa_id} ({oferta.jornada}) no tiene jornada "
+                                      "con horario de evaluación; no admite inscripciones por este servicio")
+        return oferta
+
+    @staticmethod
+    def _a_dict(inscripcion) -> dict:
+        return {
+            'id_inscripcion': inscripcion.id_inscripcion,
+            'id_postulante': inscripcion.id_postulante,
+            'carrera_id': inscripcion.carrera_id,
+            'sede_id': inscripcion.sede_id,
+            'jornada': inscripcion.jornada,
+            'orden_preferencia': inscripcion.orden_preferencia,
+            'comprobante': inscripcion.comprobante_pdf_url,
+            'estado': inscripcion.estado
+        }
+
+    # ---------- cola y trabajadores ----------
+
+    async def _trabajador(self) -> None:
+        while True:
+            solicitud, clave, futuro = await self._cola.get()
+            try:
+                if not futuro.done():
+                    futuro.set_result(self.procesar(solicitud, clave))
+            except ErrorSolicitud as error:
+                futuro.set_result((error.estado, {'error': error.mensaje}))
+            except Exception as error:  # el trabajador no debe morir
+                if not futuro.done():
+                    futuro.set_exception(error)
+            finally:
+                self._cola.task_done()
+
+    async def encolar(self, solicitud: dict, cliente: str,
+                      clave_idempotencia: Optional[str] = None) -> Tuple[int, dict, dict]:
+        """Aplica límite por cliente y cola acotada. Devuelve (estado, cuerpo, cabeceras)."""
+        self.estadisticas['recibidas'] += 1
+
+        permitido, espera = self.limitador.permitir(cliente)
+        if not permitido:
+            self.estadisticas['limitadas'] += 1
+            return 429, {'error': 'Demasiadas solicitudes'}, {'Retry-After': str(max(1, round(espera)))}
+
+        futuro = asyncio.get_running_loop().create_future()
+        try:
+            self._cola.put_nowait((solicitud, clave_idempotencia, futuro))
+        except asyncio.QueueFull:
+            self.estadisticas['sobrecarga'] += 1
+            return 503, {'error': 'Servicio saturado, intente nuevamente'}, {'Retry-After': '2'}
+
+        try:
+            estado, cuerpo = await asyncio.wait_for(futuro, self.tiempo_espera)
+        except asyncio.TimeoutError:
+            return 504, {'error': 'Tiempo de espera agotado'}, {}
+
+        if estado == 201:
+            self.estadisticas['creadas'] += 1
+        elif estado == 200:
+            self.estadisticas['repetidas'] += 1
+            return estado, cuerpo, {'Idempotent-Replay': 'true'}
+        else:
+            self.estadisticas['rechazadas'] += 1
+        return estado, cuerpo, {}
+
+    # ---------- HTTP ----------
+
+    async def _atender_conexion(self, lector: asyncio.StreamReader,
+                                escritor: asyncio.StreamWriter) -> None:
+        peer = escritor.get_extra_info('peername')
+        ip_cliente = peer[0] if peer else 'desconocido'
+        try:
+            while True:
+                try:
+                    cabecera = await lector.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lineas = cabecera.decode('latin-1').split('\r\n')
+                partes = lineas[0].split(' ')
+                if len(partes) != 3:
+                    await self._responder(escritor, 400, {'error': 'Solicitud mal formada'}, {}, False)
+                    break
+                metodo, ruta, version = partes
+                cabeceras = {}
+                for linea in lineas[1:]:
+                    if ':' in linea:
+                        nombre, valor = linea.split(':', 1)
+                        cabeceras[nombre.strip().lower()] = valor.strip()
+
+                mantener = (cabeceras.get('connection', '').lower() != 'close'
+                            and version == 'HTTP/1.1')
+                longitud = longitud_contenido(cabeceras.get('content-length'))
+                if longitud is None:
+                    await self._responder(escritor, 400, {'error': 'Content-Length inválido'}, {}, False)
+                    break
+                if longitud > self.TAMANO_MAXIMO_CUERPO:
+                    await self._responder(escritor, 413, {'error': 'Cuerpo demasiado grande'}, {}, False)
+                    break
+                cuerpo = await lector.readexactly(longitud) if longitud else b''
+
+                estado, respuesta, extra = await self._enrutar(
+                    metodo, ruta, cuerpo, self._cliente(ip_cliente, cabeceras),
+                    cabeceras.get('idempotency-key'))
+                await self._responder(escritor, estado, respuesta, extra, mantener)
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    def _cliente(self, ip_cliente: str, cabeceras: Dict[str, str]) -> str:
+        """Clave del límite de tasa: la IP, o X-Cliente-Id si la envía un proxy confiable."""
+        if ip_cliente in self.proxies_confiables:
+            return cabeceras.get('x-cliente-id', ip_cliente)
+        return ip_cliente
+
+    async def _enrutar(self, metodo: str, ruta: str, cuerpo: bytes, cliente: str,
+                       clave_idempotencia: Optional[str] = None):
+        if ruta == '/salud' and metodo == 'GET':
+            datos = dict(self.estadisticas, en_cola=self._cola.qsize(), capacidad_cola=self.tamano_cola)
+            return 200, datos, {}
+        if ruta != '/inscripciones':
+            return 404, {'error': 'Ruta no encontrada'}, {}
+        if metodo != 'POST':
+            return 405, {'error': 'Use POST'}, {'Allow': 'POST'}
+        try:
+            solicitud = json.loads(cuerpo or b'{}')
+        except ValueError:
+            return 400, {'error': 'JSON inválido'}, {}
+        if not isinstance(solicitud, dict):
+            return 400, {'error': 'Se esperaba un objeto JSON'}, {}
+        return await self.encolar(solicitud, cliente, clave_idempotencia)
+
+    async def _responder(self, escritor, estado: int, cuerpo: dict, extra: dict,
+                         mantener: bool) -> None:
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+        lineas = [f"HTTP/1.1 {estado} {self.RAZONES.get(estado, '')}",
+                  "Content-Type: application/json; charset=utf-8",
+                  f"Content-Length: {len(datos)}",
+                  f"Connection: {'keep-alive' if mantener else 'close'}"]
+        lineas += [f"{k}: {v}" for k, v in extra.items()]
+        escritor.write(('\r\n'.join(lineas) + '\r\n\r\n').encode('latin-1') + datos)
+        await escritor.drain()
+
+    # ---------- ciclo de vida ----------
+
+    async def iniciar(self, host: str = '127.0.0.1', puerto: int = 8080):
+        """Inicia trabajadores y servidor. Devuelve el puerto real usado."""
+        # IDs compartidos con main.py y otros procesos del servicio si hay ULEAM_IDS
+        AsignadorIds.configurar_desde_entorno()
+        self._cola = asyncio.Queue(maxsize=self.tamano_cola)
+        self._tareas = [asyncio.create_task(self._trabajador())
+                        for _ in range(self.num_trabajadores)]
+        self._tareas.append(asyncio.create_task(self._limpiar_periodicamente()))
+        self._servidor = await asyncio.start_server(self._atender_conexion, host, puerto)
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def _limpiar_periodicamente(self) -> None:
+        while True:
+            await asyncio.sleep(self.intervalo_limpieza)
+            self.limitador.limpiar()
+
+    async def detener(self) -> None:
+        """Deja de aceptar conexiones, vacía la cola y detiene los trabajadores."""
+        if self._servidor:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        if self._cola is not None:
+            await self._cola.join()
+        for tarea in self._tareas:
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        self._tareas = []
+
+
+# ==============================
+# ARNÉS DE CARGA
+# ==============================
+
+async def prueba_carga(host: str, puerto: int, solicitudes: Iterable[dict],
+                       conexiones: int = 50) -> dict:
+    """
+    Envía solicitudes por 'conexiones' conexiones persistentes y mide
+    las solicitudes por segundo sostenidas.
+    """
+    pendientes = list(solicitudes)
+    estados: Dict[int, int] = {}
+    invalidas = 0
+    siguiente = iter(range(len(pendientes)))
+
+    async def cliente(numero: int):
+        nonlocal invalidas
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        try:
+            for posicion in siguiente:
+                cuerpo = json.dumps(pendientes[posicion]).encode('utf-8')
+                escritor.write((f"POST /inscripciones HTTP/1.1\r\nHost: {host}\r\n"
+                                f"X-Cliente-Id: carga-{numero}\r\n"
+                                f"Content-Type: application/json\r\n"
+                                f"Content-Length: {len(cuerpo)}\r\n\r\n").encode('latin-1') + cuerpo)
+                await escritor.drain()
+                cabecera = await lector.readuntil(b'\r\n\r\n')
+                partes = cabecera.lower().split(b'content-length:')
+                longitud = longitud_contenido(partes[1].split(b'\r\n')[0].decode('latin-1')
+                                              if len(partes) > 1 else None)
+                estado = cabecera.split(b' ', 2)[1]
+                if longitud is None or not estado.isdigit():
+                    invalidas += 1  # sin largo confiable no se puede seguir en esta conexión
+                    break
+                await lector.readexactly(longitud)
+                estado = int(estado)
+                estados[estado] = estados.get(estado, 0) + 1
+        finally:
+            escritor.close()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(n) for n in range(conexiones)))
+    duracion = time.perf_counter() - inicio
+    return {'solicitudes': len(pendientes), 'segundos': round(duracion, 3),
+            'solicitudes_por_segundo': round(len(pendientes) / duracion, 1),
+            'estados': estados, 'respuestas_invalidas': invalidas}
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    from models.ofertaCarrera import OfertaCarrera
+
+    print("=" * 70)
+    print("PRUEBA DE CARGA: SERVICIO DE INSCRIPCIONES (un núcleo)")
+    print("=" * 70)
+
+    TOTAL_POSTULANTES = 5000
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ofertas = [OfertaCarrera(100 + i, f"CARRERA {i}", 1, "Matriz - Manta", 500,
+                                 "TERCER NIVEL", "PRESENCIAL", "MATUTINA") for i in range(1, 4)]
+        for numero in range(TOTAL_POSTULANTES):
+            cedula = f"13{numero:08d}"
+            registro = RegistroNacional(cedula, "POSTULANTE", f"PRUEBA {numero}")
+            registro.completar_ubicacion("MANABI", "MANTA", "MANTA", "CENTRO", "CALLE 1")
+            registro.completar_contacto("0999999999", f"p{numero}@uleam.edu.ec")
+            registro.completar_datos_academicos("U.E. MANTA", "FISCAL", 9.0)
+            registro.validar_completitud()
+
+    solicitudes = [{'cedula': f"13{n:08d}", 'carrera_id': 101 + n % 3, 'sede_id': 1,
+                    'orden_preferencia': 1} for n in range(TOTAL_POSTULANTES)]
+
+    async def ejecutar():
+        servicio = ServicioInscripciones(ofertas, limitador=LimitadorTasa(tasa=1e6, capacidad=1e6))
+        puerto = await servicio.iniciar(puerto=0)
+        resultado = await prueba_carga('127.0.0.1', puerto, solicitudes)
+        await servicio.detener()
+        return resultado, servicio.estadisticas
+
+    resultado, estadisticas = asyncio.run(ejecutar())
+    print(f"\nResultado: {resultado}")
+    print(f"Estadísticas del servicio: {estadisticas}")
+    print("=" * 70)
@@ -0,0 +1,71 @@
+"""
+Módulo: TablaIdempotencia
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Tabla de claves de idempotencia con expiración (TTL). Permite que un
+    reintento de la misma solicitud (cédula + carrera + orden) devuelva la
+    inscripción ya creada en lugar de crear objetos nuevos.
+    Búsqueda, inserción y expiración son O(1) amortizado.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TablaIdempotencia:
+    """
+    Diccionario ordenado por antigüedad: como todas las entradas tienen el
+    mismo TTL, las que vencen primero siempre están al inicio.
+    """
+
+    def __init__(self, ttl_segundos: float = 900.0, capacidad_maxima: int = 1_000_000,
+                 reloj: Callable[[], float] = time.monotonic):
+        if ttl_segundos <= 0:
+            raise ValueError("El TTL debe ser mayor a 0")
+        self.ttl_segundos = ttl_segundos
+        self.capacidad_maxima = capacidad_maxima
+        self._reloj = reloj
+        self._entradas: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+
+    @staticmethod
+    def clave_inscripcion(cedula: str, carrera_id: int, orden_preferencia: int) -> tuple:
+        """Clave natural de una solicitud de inscripción."""
+        return (str(cedula).strip(), int(carrera_id), int(orden_preferencia))
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        """Devuelve el valor guardado para la clave si no ha expirado."""
+        ahora = self._reloj()
+        self._expirar(ahora)
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            return None
+        return entrada[1]
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """Guarda (o renueva) el valor de una clave."""
+        ahora = self._reloj()
+        self._expirar(ahora)
+        self._entradas[clave] = (ahora + self.ttl_segundos, valor)
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.capacidad_maxima:
+            self._entradas.popitem(last=False)
+
+    def eliminar(self, clave: Hashable) -> None:
+        self._entradas.pop(clave, None)
+
+    def _expirar(self, ahora: float) -> None:
+        entradas = self._entradas
+        while entradas:
+            clave, (vence, _) = next(iter(entradas.items()))
+            if vence > ahora:
+                break
+            del entradas[clave]
+
+    def __len__(self) -> int:
+        self._expirar(self._reloj())
+        return len(self._entradas)
+
+    def __contains__(self, clave: Hashable) -> bool:
+        return self.obtener(clave) is not None
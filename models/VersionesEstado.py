@@ -0,0 +1,257 @@
+"""
+Módulo: VersionesEstado
+Autores: Jean Pierre Flores Piloso, Braddy Londre Vera, Bismark Grabriel Cevallos
+Fecha: Octubre 2025
+Descripción:
+    Versiones de los cupos de las ofertas y del estado de las asignaciones
+    para que los reportes lean una foto consistente mientras corre la
+    asignación.
+      - Cada cambio (reservarCupo, liberarCupo, confirmar...) publica una
+        versión nueva con un número creciente; los valores de una versión
+        no se modifican nunca (cupos_asignados se copia al escribir).
+      - lectura() toma el último número confirmado: el reporte ve cada
+        oferta y asignación tal como estaba en ese momento, sin bloquear
+        a quien escribe. Los objetos creados después no aparecen.
+      - transaccion() agrupa varios cambios (reservar el cupo y crear la
+        asignación) bajo un mismo número: se ven todos o ninguno.
+    Solo se guardan las versiones que alguna lectura abierta todavía puede
+    necesitar.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, Optional
+
+from models.Asignacion import Asignacion
+from models.ofertaCarrera import OfertaCarrera
+
+
+# Modelos versionados (atributos de clase versiones y CAMPOS_VERSIONADOS)
+MODELOS_VERSIONADOS = (OfertaCarrera, Asignacion)
+
+
+class Version:
+    """Valores de los campos versionados de un objeto desde el número dado."""
+
+    __slots__ = ('numero', 'valores', 'anterior')
+
+    def __init__(self, numero: int, valores: Dict[str, object], anterior: Optional['Version']):
+        self.numero = numero
+        self.valores = valores
+        self.anterior = anterior
+
+
+# ==============================
+# LECTURA CONSISTENTE
+# ==============================
+
+class LecturaConsistente:
+    """Foto del estado en la versión numero (se usa con with o se cierra con cerrar())."""
+
+    def __init__(self, control: 'ControlVersiones', numero: int):
+        self._control = control
+        self.numero = numero
+        self._abierta = True
+
+    def valores(self, objeto) -> Optional[Dict[str, object]]:
+        """Campos versionados del objeto en esta foto, o None si todavía no existía."""
+        version = getattr(objeto, '_version', None)
+        if version is None:
+            # Sin cambios desde que se activaron las versiones: los atributos
+            # valen si nadie publicó mientras se leían (_version se fija primero)
+            valores = {campo: getattr(objeto, campo) for campo in objeto.CAMPOS_VERSIONADOS}
+            version = getattr(objeto, '_version', None)
+            if version is None:
+                return valores
+        while version is not None and version.numero > self.numero:
+            version = version.anterior
+        return None if version is None else version.valores
+
+    def valor(self, objeto, campo: str):
+        valores = self.valores(objeto)
+        if valores is None:
+            raise ValueError(f"{objeto} no existía en la versión {self.numero}")
+        return valores[campo]
+
+    def visibles(self, objetos: Iterable) -> Iterator:
+        """Objetos de la colección que ya existían en esta foto."""
+        for objeto in list(objetos):
+            if self.valores(objeto) is not None:
+                yield objeto
+
+    def cerrar(self) -> None:
+        if self._abierta:
+            self._abierta = False
+            self._control._terminar_lectura(self.numero)
+
+    def __enter__(self) -> 'LecturaConsistente':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
+
+
+# ==============================
+# CONTROL DE VERSIONES
+# ==============================
+
+class _Transaccion:
+    """Bloque de cambios con un mismo número de versión (ver ControlVersiones.transaccion)."""
+
+    __slots__ = ('_control', '_propia')
+
+    def __init__(self, control: 'ControlVersiones'):
+        self._control = control
+
+    def __enter__(self) -> None:
+        control = self._control
+        control._escritura.acquire()
+        # Con el candado tomado, un número en curso solo puede ser de este mismo hilo
+        self._propia = control._en_curso is None
+        if self._propia:
+            control._en_curso = control.actual + 1
+
+    def __exit__(self, *_) -> None:
+        control = self._control
+        if self._propia:
+            control.actual = control._en_curso
+            control._en_curso = None
+        control._escritura.release()
+
+
+class ControlVersiones:
+    """Numera las versiones publicadas por los modelos y abre lecturas."""
+
+    def __init__(self):
+        self.actual = 0                          # última versión confirmada
+        self._en_curso: Optional[int] = None     # número de la transacción abierta
+        self._escritura = threading.RLock()      # ordena a quienes escriben
+        self._candado_lectores = threading.Lock()
+        self._lectores: Counter = Counter()      # versión -> lecturas abiertas
+
+    def activar(self) -> 'ControlVersiones':
+        """Los modelos versionados empiezan a publicar sus cambios aquí."""
+        for clase in MODELOS_VERSIONADOS:
+            clase.versiones = self
+        return self
+
+    def desactivar(self) -> None:
+        for clase in MODELOS_VERSIONADOS:
+            if clase.versiones is self:
+                clase.versiones = None
+
+    # ---------- escritura ----------
+
+    def transaccion(self) -> _Transaccion:
+        """
+        Los cambios dentro del bloque with comparten número y se confirman
+        juntos al salir (también si hay una excepción: no se deshacen).
+        """
+        return _Transaccion(self)
+
+    def publicar(self, objeto, cambios: Dict[str, object], alta: bool = False) -> None:
+        """
+        Aplica los cambios al objeto y los publica como una versión nueva.
+        Con alta=True el objeto es nuevo: las lecturas anteriores no lo ven.
+        """
+        with self._escritura:
+            numero = self._en_curso
+            propia = numero is None
+            if propia:
+                numero = self.actual + 1
+
+            anterior = getattr(objeto, '_version', None)
+            if anterior is None and not alta:
+                anterior = Version(0, {c: getattr(objeto, c) for c in objeto.CAMPOS_VERSIONADOS}, None)
+            if anterior is not None:
+                valores = dict(anterior.valores)
+                # Siempre con el candado: lectura() lee actual y se registra
+                # dentro de él, así ninguna lectura queda entre ambos pasos
+                with self._candado_lectores:
+                    limite = min(self._lectores, default=self.actual)
+                limite = min(limite, self.actual)
+                if anterior.numero <= limite:
+                    anterior.anterior = None
+            else:
+                valores = {c: getattr(objeto, c) for c in objeto.CAMPOS_VERSIONADOS}
+            valores.update(cambios)
+
+            # _version antes que los atributos (ver LecturaConsistente.valores)
+            objeto._version = Version(numero, valores, anterior)
+            for nombre, valor in cambios.items():
+                setattr(objeto, nombre, valor)
+            if propia:
+                self.actual = numero
+
+    # ---------- lectura ----------
+
+    def lectura(self) -> LecturaConsistente:
+        """Foto de la última versión confirmada (no espera a las transacciones en curso)."""
+        with self._candado_lectores:
+            numero = self.actual
+            self._lectores[numero] += 1
+        return LecturaConsistente(self, numero)
+
+    def _terminar_lectura(self, numero: int) -> None:
+        with self._candado_lectores:
+            self._lectores[numero] -= 1
+            if not self._lectores[numero]:
+                del self._lectores[numero]
+
+
+# ========== EJEMPLO DE USO ==========
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import random
+    import time
+
+    print("=" * 70)
+    print("PRUEBA: REPORTES CONSISTENTES DURANTE LA ASIGNACIÓN")
+    print("=" * 70)
+
+    def asignar(ofertas, asignaciones, cantidad: int, semilla: int) -> float:
+        generador = random.Random(semilla)
+        inicio = time.perf_counter()
+        for i in range(cantidad):
+            oferta = generador.choice(ofertas)
+            with control.transaccion():
+                if oferta.reservarCupo('GENERAL'):
+                    asignaciones.append(Asignacion(i, oferta.carrera_id, 1, 800.0, f"13{i:08d}"))
+        return time.perf_counter() - inicio
+
+    def nuevas_ofertas():
+        ofertas = [OfertaCarrera(100 + i, f"CARRERA {i}", 1, "MANTA", 5000, "TERCER NIVEL",
+                                 "PRESENCIAL", "MATUTINA", mostrar=False) for i in range(50)]
+        for oferta in ofertas:
+            oferta.configurar_desde_pdf(cupos_nivelacion=5000, mostrar=False)
+        return ofertas
+
+    control = ControlVersiones().activar()
+    with contextlib.redirect_stdout(io.StringIO()):
+        solo = asignar(nuevas_ofertas(), [], 30_000, 1)
+
+        ofertas, asignaciones = nuevas_ofertas(), []
+        terminado = threading.Event()
+        reportes = inconsistentes = 0
+
+        def reportar() -> None:
+            global reportes, inconsistentes
+            while not terminado.is_set():
+                with control.lectura() as foto:
+                    estadisticas = [oferta.obtener_estadisticas(foto) for oferta in ofertas]
+                    cupos = sum(e['asignados'] for e in estadisticas)
+                    if cupos != sum(1 for _ in foto.visibles(asignaciones)):
+                        inconsistentes += 1
+                reportes += 1
+
+        lector = threading.Thread(target=reportar)
+        lector.start()
+        concurrente = asignar(ofertas, asignaciones, 30_000, 1)
+        terminado.set()
+        lector.join()
+
+    print(f"\nAsignación sola: {solo * 1000:.0f} ms | con reportes en paralelo: {concurrente * 1000:.0f} ms")
+    print(f"{reportes} reportes durante la asignación | inconsistentes: {inconsistentes}")
+    control.desactivar()
+    print("=" * 70)
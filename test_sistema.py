@@ -123,6 +123,1101 @@ def test_completo():
     print(f"Estado: {asignacion.estado}")
     print("=" * 70)
 
+def test_importador_calificaciones_reanudable():
+    """Importa calificaciones por bloques, se interrumpe y se reanuda"""
+    import os
+    import tempfile
+    from models.ImportadorCalificaciones import ImportadorCalificaciones, IndiceEvaluaciones
+
+    indice = IndiceEvaluaciones()
+    evaluaciones = []
+    for id_inscripcion in range(1, 7):
+        evaluacion = Evaluacion(id_inscripcion=id_inscripcion, tipo="escrito", sede_id=1)
+        indice.agregar(evaluacion, cedula=f"13000000{id_inscripcion:02d}")
+        evaluaciones.append(evaluacion)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "notas.csv")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("id_inscripcion,cedula,calificacion\n")
+            archivo.write("1,,900\n2,,1001\n,1300000003,640\n77,,500\n5,,x\n6,,720\n")
+
+        importador = ImportadorCalificaciones(indice, tamano_bloque=2)
+        original = importador._procesar_bloque
+        llamadas = []
+
+        def procesar_con_falla(bloque, escritor):
+            llamadas.append(len(bloque))
+            if len(llamadas) == 3:
+                raise RuntimeError("corte simulado")
+            original(bloque, escritor)
+
+        importador._procesar_bloque = procesar_con_falla
+        try:
+            importador.importar(ruta)
+        except RuntimeError:
+            pass
+        assert os.path.exists(ruta + ".progreso")
+
+        resumen = ImportadorCalificaciones(indice, tamano_bloque=2).importar(ruta)
+        assert resumen["filas_procesadas"] == 6
+        assert resumen["aplicadas"] == 3
+        assert resumen["rechazadas"] == 3
+        assert not os.path.exists(ruta + ".progreso")
+
+        with open(resumen["archivo_errores"], encoding="utf-8") as archivo:
+            lineas = archivo.read().splitlines()
+        assert len(lineas) == 4
+
+    assert evaluaciones[0].calificacion == 900 and evaluaciones[0].esta_completada
+    assert evaluaciones[2].calificacion == 640
+    assert evaluaciones[5].calificacion == 720
+    assert evaluaciones[1].calificacion is None
+
+    # Reanudar en otro proceso (evaluaciones recién cargadas, sin notas): las
+    # filas ya contadas se vuelven a aplicar sin duplicar contadores ni rechazos
+    import models.ImportadorCalificaciones as modulo
+    nuevo_indice = IndiceEvaluaciones()
+    nuevas = [Evaluacion(id_inscripcion=e.id_inscripcion, tipo="escrito", sede_id=1) for e in evaluaciones]
+    for evaluacion in nuevas:
+        nuevo_indice.agregar(evaluacion, cedula=f"13000000{evaluacion.id_inscripcion:02d}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "notas.csv")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("id_inscripcion,cedula,calificacion\n")
+            archivo.write("1,,900\n2,,1001\n,1300000003,640\n77,,500\n5,,x\n6,,720\n")
+        importador = ImportadorCalificaciones(indice, tamano_bloque=2)
+        original = importador._procesar_bloque
+        llamadas.clear()
+        importador._procesar_bloque = procesar_con_falla
+        try:
+            importador.importar(ruta)
+        except RuntimeError:
+            pass
+
+        ejecucion = modulo._EJECUCION
+        modulo._EJECUCION = "otro-proceso"
+        try:
+            resumen = ImportadorCalificaciones(nuevo_indice, tamano_bloque=3).importar(ruta)
+        finally:
+            modulo._EJECUCION = ejecucion
+        assert (resumen["aplicadas"], resumen["rechazadas"]) == (3, 3)
+        with open(resumen["archivo_errores"], encoding="utf-8") as archivo:
+            assert len(archivo.read().splitlines()) == 4
+    assert [e.calificacion for e in nuevas] == [900, None, 640, None, None, 720]
+
+def test_motor_calificacion_por_tipo_y_forma():
+    """Califica hojas de respuesta de dos tipos y dos formas"""
+    import numpy as np
+    from models.MotorCalificacion import MotorCalificacion
+
+    motor = MotorCalificacion(num_items=4)
+    motor.agregar_clave("escrito", 0, [0, 1, 2, 3])
+    motor.agregar_clave("escrito", 1, [3, 2, 1, 255])
+    motor.agregar_clave("practico", 0, [1, 1, 1, 1])
+
+    respuestas = np.array([
+        [0, 1, 2, 3],    # escrito forma 0: 4/4
+        [3, 2, 0, 0],    # escrito forma 1: 2/3 (ítem 4 anulado)
+        [1, 1, 255, 0],  # practico forma 0: 2/4
+    ], dtype=np.uint8)
+    evaluaciones = [
+        Evaluacion(id_inscripcion=1, tipo="escrito", sede_id=1),
+        Evaluacion(id_inscripcion=2, tipo="escrito", sede_id=1),
+        Evaluacion(id_inscripcion=3, tipo="practico", sede_id=1),
+    ]
+
+    resumen = motor.calificar_evaluaciones(evaluaciones, respuestas, formas=[0, 1, 0])
+    assert resumen == {"escrito": 2, "practico": 1}
+    assert [e.calificacion for e in evaluaciones] == [1000.0, 666.67, 500.0]
+    assert all(e.esta_completada for e in evaluaciones)
+
+    # Sin formas todas las filas usan la forma 0: sin su clave no se califica a nadie con 0
+    import pytest
+    solo_forma_1 = MotorCalificacion(num_items=4)
+    solo_forma_1.agregar_clave("escrito", 1, [3, 2, 1, 0])
+    with pytest.raises(ValueError, match=r"sin clave registrada.*\[0\]"):
+        solo_forma_1.puntuar(respuestas, "escrito")
+    with pytest.raises(ValueError, match=r"\[2\]"):
+        motor.puntuar(respuestas, "escrito", formas=[0, 1, 2])
+
+def test_analisis_items_contra_calculo_manual():
+    """Dificultad, discriminación corregida y distractores de una matriz 4 × 3 hecha a mano"""
+    import numpy as np
+    from models.AnalisisItems import AnalisisItems
+    from models.MotorCalificacion import MotorCalificacion
+
+    motor = MotorCalificacion(num_items=3)
+    motor.agregar_clave("escrito", 0, [0, 1, 2])
+    respuestas = np.array([
+        [0, 1, 2],      # aciertos 1 1 1 -> total 3
+        [0, 1, 3],      # aciertos 1 1 0 -> total 2
+        [0, 0, 255],    # aciertos 1 0 0 -> total 1 (ítem 3 en blanco)
+        [1, 0, 3],      # aciertos 0 0 0 -> total 0
+    ], dtype=np.uint8)
+
+    resultado = AnalisisItems(motor).analizar(respuestas, "ESCRITO", sedes=[1, 1, 2, 2])
+    reporte = resultado['por_forma'][0]
+    assert reporte['postulantes'] == 4
+    assert reporte['dificultad'] == [0.75, 0.5, 0.25]
+    # Ítem 1: x = 1110, t - x = 2100 -> r = 0.1875 / sqrt(0.1875 * 0.6875)
+    # Ítem 2: x = 1100, t - x = 2110 -> r = 0.25 / sqrt(0.25 * 0.5)
+    # Ítem 3: x = 1000, t - x = 2210 -> r = 0.1875 / sqrt(0.1875 * 0.6875)
+    assert reporte['discriminacion'] == [0.522, 0.707, 0.522]
+    assert reporte['distractores'] == [[0.75, 0.25, 0.0, 0.0, 0.0],
+                                       [0.5, 0.5, 0.0, 0.0, 0.0],
+                                       [0.0, 0.0, 0.25, 0.5, 0.25]]
+    assert reporte['items_revisar'] == []
+    assert sorted(resultado['por_sede']) == [(0, 1), (0, 2)]
+    assert resultado['por_sede'][(0, 2)]['dificultad'] == [0.5, 0.0, 0.0]
+
+def test_inscripciones_con_evaluacion_diferida_y_en_lote():
+    """Evaluaciones creadas al primer acceso o en lote con una sola programación"""
+    diferida = Inscripcion(id_postulante=1, carrera_id=101, orden_preferencia=1, sede_id=1,
+                           jornada="MATUTINA", cedula_postulante="1316202082",
+                           evaluacion_diferida=True)
+    assert diferida._evaluacion is None
+    evaluacion = diferida.obtenerEvaluacion()
+    assert evaluacion.tipo == "practico"
+    assert evaluacion.id_inscripcion == diferida.id_inscripcion
+    assert diferida.obtenerEvaluacion() is evaluacion
+
+    lote = [Inscripcion(id_postulante=2, carrera_id=103 + i % 2, orden_preferencia=1 + i % 3,
+                        sede_id=2, jornada=("vespertina", "nocturna")[i % 2],
+                        cedula_postulante="1350432058", evaluacion_diferida=True)
+            for i in range(6)]
+    lote[0].cancelar()
+    creadas = Inscripcion.crear_evaluaciones_lote(lote)
+    assert len(creadas) == 5
+    assert lote[0].obtenerEvaluacion() is None
+    assert len({e.fecha_programada for e in creadas}) == 1
+    assert {(e.jornada, e.hora_inicio) for e in creadas} == {("vespertina", "14:00"),
+                                                              ("nocturna", "18:00")}
+
+def test_repositorio_inscripciones_unicidad_y_demanda():
+    """Carga en bloque con límite de preferencias, unicidad y demanda por oferta"""
+    from models.RepositorioInscripciones import RepositorioInscripciones
+
+    def fila(id_postulante, carrera_id, orden, jornada="matutina"):
+        return {"id_postulante": id_postulante, "carrera_id": carrera_id,
+                "orden_preferencia": orden, "sede_id": 1, "jornada": jornada,
+                "cedula_postulante": f"13162020{id_postulante:02d}"}
+
+    repositorio = RepositorioInscripciones()
+    creadas, rechazadas = repositorio.crear_inscripciones([
+        fila(1, 101, 1), fila(1, 102, 2), fila(1, 103, 3),
+        fila(1, 104, 1),              # supera MAX_PREFERENCIAS
+        fila(2, 101, 1), fila(2, 101, 2),  # carrera repetida
+        fila(2, 102, 1),              # orden repetido
+        fila(3, 101, 4),              # orden fuera de rango
+        fila(3, 102, 1, "sabatina"),  # jornada inválida
+    ])
+    assert len(creadas) == 4
+    assert [r[0] for r in rechazadas] == [3, 5, 6, 7, 8]
+    assert all(i._evaluacion is not None for i in creadas)
+
+    assert repositorio.demanda(101) == 2
+    assert repositorio.demanda(101, 1, "MATUTINA") == 2
+    assert len(repositorio.buscar_por_cedula("1316202001")) == 3
+
+    repositorio.cancelar(creadas[0].id_inscripcion)
+    assert repositorio.demanda(101) == 1
+    assert repositorio.preferencias_disponibles(1) == [1]
+    nueva = repositorio.crear_inscripcion(**fila(1, 104, 1))
+    assert nueva.estado == "ACTIVA"
+
+def test_servicio_inscripciones_http_y_limites():
+    """Flujo HTTP completo, límite por cliente y respuesta ante saturación"""
+    import asyncio
+    import json
+    from models.ServicioInscripciones import LimitadorTasa, ServicioInscripciones
+
+    limitador = LimitadorTasa(tasa=1, capacidad=2)
+    assert limitador.permitir("a", ahora=0)[0] and limitador.permitir("a", ahora=0)[0]
+    permitido, espera = limitador.permitir("a", ahora=0)
+    assert not permitido and espera == 1
+    assert limitador.permitir("a", ahora=1)[0]
+    limitador.limpiar(inactividad=10, ahora=20)
+    assert limitador._cubetas == {}
+
+    registro = RegistroNacional("1316202082", "JEAN PIERRE", "FLORES PILOSO")
+    registro.completar_ubicacion("MANABI", "MANTA", "MANTA", "CENTRO", "CALLE 1")
+    registro.completar_contacto("0999999999", "jean@uleam.edu.ec")
+    registro.completar_datos_academicos("U.E. MANTA", "FISCAL", 9.5)
+    registro.validar_completitud()
+    oferta = OfertaCarrera(101, "Tecnologias de la Informacion", 1, "Matriz - Manta", 40,
+                           "TERCER NIVEL", "PRESENCIAL", "MATUTINA")
+
+    async def solicitar(puerto, cuerpo):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        datos = json.dumps(cuerpo).encode()
+        escritor.write(b"POST /inscripciones HTTP/1.1\r\nConnection: close\r\n"
+                       + f"Content-Length: {len(datos)}\r\n\r\n".encode() + datos)
+        respuesta = await lector.read()
+        escritor.close()
+        cabecera, cuerpo_respuesta = respuesta.split(b"\r\n\r\n", 1)
+        return int(cabecera.split(b" ")[1]), json.loads(cuerpo_respuesta)
+
+    async def escenario():
+        servicio = ServicioInscripciones([oferta], tamano_cola=1, trabajadores=1)
+        puerto = await servicio.iniciar(puerto=0)
+        solicitud = {"cedula": "1316202082", "carrera_id": 101, "sede_id": 1,
+                     "orden_preferencia": 1}
+        creada = await solicitar(puerto, solicitud)
+        postulantes = Postulante._contador_postulantes
+        repetida = await solicitar(puerto, solicitud)
+        assert Postulante._contador_postulantes == postulantes
+        orden_invalido = await solicitar(puerto, dict(solicitud, orden_preferencia=7))
+        inexistente = await solicitar(puerto, dict(solicitud, cedula="0999999999"))
+
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        escritor.write(b"POST /inscripciones HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+        largo_invalido = int((await lector.read()).split(b" ")[1])
+        escritor.close()
+
+        # X-Cliente-Id solo cuenta si la conexión viene de un proxy configurado
+        assert servicio._cliente("10.0.0.5", {"x-cliente-id": "otro"}) == "10.0.0.5"
+        servicio.proxies_confiables = frozenset({"10.0.0.1"})
+        assert servicio._cliente("10.0.0.1", {"x-cliente-id": "otro"}) == "otro"
+
+        # Sin trabajadores libres la cola (tamaño 1) se llena y responde 503
+        for tarea in servicio._tareas:
+            tarea.cancel()
+        servicio._cola.put_nowait(({}, None, asyncio.get_running_loop().create_future()))
+        saturada = await servicio.encolar(solicitud, "cliente-x")
+        servicio._cola.get_nowait()
+        servicio._cola.task_done()
+        await servicio.detener()
+        return creada, repetida, orden_invalido, inexistente, largo_invalido, saturada
+
+    creada, repetida, orden_invalido, inexistente, largo_invalido, saturada = asyncio.run(escenario())
+    assert creada[0] == 201 and creada[1]["jornada"] == "matutina"
+    assert repetida[0] == 200 and repetida[1]["id_inscripcion"] == creada[1]["id_inscripcion"]
+    assert orden_invalido[0] == 409
+    assert inexistente[0] == 404
+    assert largo_invalido == 400
+    assert saturada[0] == 503 and saturada[2]["Retry-After"]
+
+    # Varias jornadas de la misma carrera y sede: se elige por jornada u ofa_id
+    import pytest
+    from models.ServicioInscripciones import ErrorSolicitud
+    nocturna = OfertaCarrera(101, "Tecnologias de la Informacion", 1, "Matriz - Manta", 30,
+                             "TERCER NIVEL", "PRESENCIAL", "NOCTURNA", mostrar=False)
+    sin_horario = OfertaCarrera(105, "Software", 1, "Matriz - Manta", 30,
+                                "TERCER NIVEL", "DISTANCIA", "NO APLICA JORNADA", mostrar=False)
+    software = OfertaCarrera(102, "Software", 1, "Matriz - Manta", 30,
+                             "TERCER NIVEL", "PRESENCIAL", "VESPERTINA", mostrar=False)
+    servicio = ServicioInscripciones([oferta, nocturna, sin_horario, software])
+    base = {"cedula": "1316202082", "carrera_id": 101, "sede_id": 1, "orden_preferencia": 2}
+    with pytest.raises(ErrorSolicitud, match="indique jornada u ofa_id") as error:
+        servicio.procesar(base)
+    assert error.value.estado == 400
+    estado, cuerpo = servicio.procesar(dict(base, jornada="Nocturna"))
+    assert estado == 201 and cuerpo["jornada"] == "nocturna"
+    estado, cuerpo = servicio.procesar({"cedula": "1316202082", "ofa_id": software.ofa_id,
+                                        "orden_preferencia": 3})
+    assert estado == 201 and cuerpo["jornada"] == "vespertina"
+    with pytest.raises(ErrorSolicitud, match="no tiene jornada con horario") as error:
+        servicio.procesar(dict(base, carrera_id=105, orden_preferencia=1))
+    assert error.value.estado == 422
+    with pytest.raises(ErrorSolicitud) as error:
+        servicio.procesar(dict(base, jornada="madrugada"))
+    assert error.value.estado == 400
+
+def test_registro_postulantes_vinculos_por_cedula():
+    """Un postulante por cédula con sus inscripciones, puntajes y asignación"""
+    from models.RegistroPostulantes import RegistroPostulantes
+
+    registro = RegistroPostulantes()
+    datos = dict(cedula="1316202033", nombre_completo="Ana Zambrano", email="ana@uleam.edu.ec",
+                 telefono="0999999999", fecha_nacimiento="2006-05-10", mostrar=False)
+    postulante, creado = registro.obtener_o_crear(**datos)
+    repetido, creado_otra_vez = registro.obtener_o_crear(**datos)
+    assert creado and not creado_otra_vez and repetido is postulante
+    assert registro.obtener_por_id(postulante.id_postulante) is postulante
+
+    inscripcion = Inscripcion(postulante.id_postulante, 101, 1, 1, "MATUTINA",
+                              cedula_postulante=postulante.cedula, evaluacion_diferida=True)
+    registro.vincular_inscripcion(inscripcion)
+    registro.vincular_puntaje(PuntajePostulacion(postulante.id_postulante, 9.0, 800, postulante.cedula))
+    asignacion = Asignacion(postulante.id_postulante, 101, 1, 800, postulante.cedula)
+    registro.vincular_asignacion(asignacion)
+
+    assert registro.inscripciones("1316202033") == [inscripcion]
+    assert registro.evaluaciones("1316202033")[0].id_inscripcion == inscripcion.id_inscripcion
+    segunda = Inscripcion(postulante.id_postulante, 102, 2, 1, "MATUTINA",
+                          cedula_postulante=postulante.cedula)
+    registro.vincular_inscripcion(segunda)
+    segunda.cancelar()
+    assert [e.id_inscripcion for e in registro.evaluaciones("1316202033")] == [inscripcion.id_inscripcion]
+    assert registro.inscripciones("1316202033") == [inscripcion, segunda]
+    assert len(registro.puntajes("1316202033")) == 1
+    assert registro.asignacion("1316202033") is asignacion and postulante.tieneAsignacionActiva()
+    assert registro.obtener_por_cedula("0999999999") is None
+
+    # Vistas sin copia: misma instancia en cada llamada y sin métodos de mutación
+    vista = postulante.obtenerInscripciones()
+    assert vista is postulante.obtenerInscripciones() and not hasattr(vista, "append")
+    assert not hasattr(postulante, "__dict__")
+
+def test_despachador_notificaciones_smtp_y_reintentos(capsys):
+    """Lotes por SMTP contra un servidor local falso y reintentos con backoff"""
+    import socketserver
+    import threading
+    from models.DespachadorNotificaciones import DespachadorNotificaciones, ServicioSMTP
+    from models.PRINCIPIOSOLIDD5 import InterfazEmail
+
+    recibidos = []
+    conexiones = []
+
+    class ManejadorSMTP(socketserver.StreamRequestHandler):
+        """Servidor SMTP mínimo: acepta todo (salvo rechazado@) y guarda los destinatarios"""
+        def handle(self):
+            conexiones.append(1)
+            self.wfile.write(b"220 prueba ESMTP\r\n")
+            while True:
+                linea = self.rfile.readline()
+                if not linea:
+                    return
+                comando = linea[:4].upper()
+                if comando == b"DATA":
+                    self.wfile.write(b"354 fin con .\r\n")
+                    while self.rfile.readline() not in (b".\r\n", b""):
+                        pass
+                    recibidos.append(self.destinatario)
+                    self.wfile.write(b"250 OK\r\n")
+                elif comando == b"RCPT":
+                    self.destinatario = linea.split(b"<", 1)[1].split(b">", 1)[0].decode()
+                    if self.destinatario.startswith("rechazado@"):
+                        self.wfile.write(b"550 buzon inexistente\r\n")
+                    else:
+                        self.wfile.write(b"250 OK\r\n")
+                elif comando == b"QUIT":
+                    self.wfile.write(b"221 adios\r\n")
+                    return
+                else:
+                    self.wfile.write(b"250 OK\r\n")
+
+    servidor = socketserver.ThreadingTCPServer(("127.0.0.1", 0), ManejadorSMTP)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    try:
+        smtp = ServicioSMTP("127.0.0.1", servidor.server_address[1])
+        despachador = DespachadorNotificaciones(smtp, tamano_lote=10, trabajadores=2).iniciar()
+        Asignacion.configurar_notificador(despachador)
+        try:
+            asignacion = Asignacion(1, 101, 1, 850, "1316202082", email_postulante="jean@uleam.edu.ec")
+            asignacion.confirmar()
+            for i in range(25):
+                despachador.enviar_confirmacion(f"p{i}@mail.com", "Cupo asignado")
+                if i == 10:
+                    despachador.enviar_confirmacion("rechazado@mail.com", "Cupo asignado")
+            despachador.detener()
+        finally:
+            Asignacion.configurar_notificador(None)
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+    assert sorted(recibidos) == sorted(["jean@uleam.edu.ec"] + [f"p{i}@mail.com" for i in range(25)])
+    assert despachador.estadisticas["enviadas"] == 26 and despachador.pendientes == 0
+    # El 550 no tumba la conexión (una por trabajador) ni se reintenta
+    assert len(conexiones) <= 2
+    assert [(n.email, n.intentos) for n, _ in despachador.fallidas] == [("rechazado@mail.com", 1)]
+
+    class ServicioInestable(InterfazEmail):
+        def __init__(self):
+            self.llamadas = 0
+        def enviar_confirmacion(self, email, mensaje):
+            self.llamadas += 1
+            if self.llamadas <= 2 or email == "malo@mail.com":
+                raise ConnectionError("servidor ocupado")
+
+    despachador = DespachadorNotificaciones(ServicioInestable(), trabajadores=1, max_intentos=3,
+                                            espera_base=0.001).iniciar()
+    despachador.enviar_confirmacion("bueno@mail.com", "hola")
+    despachador.enviar_confirmacion("malo@mail.com", "hola")
+    assert despachador.esperar_vaciado(5)
+    despachador.detener()
+    assert despachador.estadisticas["enviadas"] == 1
+    assert [n.email for n, _ in despachador.fallidas] == ["malo@mail.com"]
+
+    # Con la cola llena el aviso de la asignación se informa en lugar de perderse
+    lleno = DespachadorNotificaciones(ServicioInestable(), tamano_cola=1)
+    lleno.enviar_confirmacion("otro@mail.com", "hola")
+    Asignacion.configurar_notificador(lleno)
+    try:
+        capsys.readouterr()
+        Asignacion(2, 101, 1, 800, "1316202083", email_postulante="ana@uleam.edu.ec").confirmar()
+    finally:
+        Asignacion.configurar_notificador(None)
+    salida = capsys.readouterr().out
+    assert "No se pudo encolar el correo a ana@uleam.edu.ec" in salida
+    assert "Notificación enviada" not in salida
+
+def test_base_datos_sqlite_lotes_y_cache(tmp_path):
+    """Escritura por lotes multi-fila, lectura del búfer y caché LRU"""
+    from models.BaseDatosSQLite import BaseDatosSQLite, CacheLRU
+    import models.PRINCIPIOSOLIDD5 as PRINCIPIOSOLIDD5
+
+    ruta = str(tmp_path / "admision.db")
+    bd = BaseDatosSQLite(ruta, tamano_pool=2, tamano_lote=3, intervalo_vaciado=0)
+    inscripciones = [Inscripcion(i, 101, 1, 1, "MATUTINA", cedula_postulante="1316202082",
+                                 evaluacion_diferida=True) for i in range(1, 5)]
+    for inscripcion in inscripciones[:2]:
+        bd.guardar_inscripcion(inscripcion)
+    bd.guardar_inscripcion(inscripciones[0])  # se fusiona con el anterior
+    assert bd.contar() == 0
+    assert bd.buscar_inscripcion(inscripciones[1].id_inscripcion)["jornada"] == "matutina"
+
+    bd.guardar_inscripcion(inscripciones[2])
+    assert bd.contar() == 3 and bd.estadisticas["transacciones"] == 1
+
+    demo = PRINCIPIOSOLIDD5.Inscripcion("Ana", "Medicina", "2025-1", bd,
+                                        PRINCIPIOSOLIDD5.InterfazEmail())
+    bd.guardar_inscripcion(demo)
+    bd.cerrar()
+
+    with BaseDatosSQLite(ruta, capacidad_cache=1, intervalo_vaciado=0) as reabierta:
+        assert reabierta.contar() == 4
+        assert reabierta.buscar_inscripcion(demo.numero_inscripcion)["carrera"] == "Medicina"
+        assert reabierta.buscar_inscripcion(demo.numero_inscripcion) is not None
+        assert reabierta.cache.aciertos == 1 and reabierta.buscar_inscripcion("NO-EXISTE") is None
+
+    cache = CacheLRU(capacidad=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    cache.obtener("a")
+    cache.guardar("c", 3)
+    assert cache.obtener("b") is None and cache.obtener("a") == 1
+
+def test_inscripcion_async_concurrente_y_en_lote():
+    """Guardar y notificar en paralelo; el lote reporta los fallos sin detenerse"""
+    import asyncio
+    import models.PRINCIPIOSOLIDD5 as PRINCIPIOSOLIDD5
+    from models.InscripcionAsync import InscripcionAsync, InterfazEmailAsync, procesar_lote
+
+    eventos = []
+
+    class EmailAsync(InterfazEmailAsync):
+        async def enviar_confirmacion(self, email, mensaje):
+            eventos.append("email-inicio")
+            await asyncio.sleep(0.01)
+            eventos.append("email-fin")
+
+    class BaseDatosFalla(PRINCIPIOSOLIDD5.InterfazBaseDatos):
+        def guardar_inscripcion(self, inscripcion):
+            eventos.append("bd")
+            if inscripcion.postulante == "Falla":
+                raise RuntimeError("sin conexion")
+
+    bd = BaseDatosFalla()
+    lote = [InscripcionAsync(nombre, "Medicina", "2025-1", bd, EmailAsync())
+            for nombre in ("Ana", "Falla", "Luis")]
+    resultados = asyncio.run(procesar_lote(lote, concurrencia=3))
+
+    # Las tres inscripciones empezaron a notificar antes de que terminara alguna
+    ultimo_inicio = max(i for i, evento in enumerate(eventos) if evento == "email-inicio")
+    assert eventos.index("email-fin") > ultimo_inicio and eventos.count("bd") == 3
+    assert [r is None for r in resultados] == [True, False, True]
+    assert [i.estado for i in lote] == ["CONFIRMADA", "PENDIENTE", "CONFIRMADA"]
+
+def test_buscador_ofertas_sin_tildes_prefijos_y_filtros():
+    """Búsqueda por palabras parciales, sin tildes, con errores de tipeo y filtros"""
+    from models.BuscadorOfertas import BuscadorOfertas
+    from models.Normalizacion import plegar_acentos
+
+    assert plegar_acentos("ADMINISTRACIÓN Peña") == "administracion peña"
+    ofertas = [
+        OfertaCarrera(101, "Tecnologías de la Información", 1, "Matriz - Manta", 40,
+                      "TERCER NIVEL", "PRESENCIAL", "MATUTINA"),
+        OfertaCarrera(102, "Ingeniería en Software", 1, "Matriz - Manta", 35,
+                      "TERCER NIVEL", "PRESENCIAL", "VESPERTINA"),
+        OfertaCarrera(104, "Administración de Empresas", 2, "Chone", 30,
+                      "TERCER NIVEL", "HIBRIDA", "NOCTURNA"),
+        OfertaCarrera(105, "Ingeniería Civil", 2, "Chone", 30,
+                      "TERCER NIVEL", "PRESENCIAL", "MATUTINA"),
+    ]
+    buscador = BuscadorOfertas(ofertas)
+
+    assert [o.carrera_id for o in buscador.buscar("tecnologias")] == [101]
+    assert {o.carrera_id for o in buscador.buscar("ingenieria")} == {102, 105}
+    assert [o.carrera_id for o in buscador.buscar("ing chone")] == [105]
+    assert [o.carrera_id for o in buscador.buscar("administracion")] == [104]
+    assert [o.carrera_id for o in buscador.buscar("ingenieira softwre")] == [102]
+    assert [o.carrera_id for o in buscador.buscar("ingenieria", jornada="matutina")] == [105]
+    assert [o.carrera_id for o in buscador.buscar(sede_id=2, modalidad="hibrida")] == [104]
+    assert buscador.buscar("medicina") == []
+
+def test_catalogo_ofertas_indices_y_carga_masiva(capsys):
+    """Índices por carrera, OFA_ID, CUS_ID y filtros compuestos; carga sin impresiones"""
+    from models.CatalogoOfertas import CatalogoOfertas
+
+    catalogo = CatalogoOfertas()
+    cargadas, rechazadas = catalogo.cargar_desde_pdf([
+        {'carrera_id': 101, 'CAR_NOMBRE_CARRERA': "TI", 'sede_id': 1, 'CUS_TOTAL_CUPOS': 40,
+         'CUS_CUPOS_NIVELACION': 38, 'CUS_CUPOS_PC': 2, 'OFA_ID': 1, 'CUS_ID': 11},
+        {'carrera_id': 101, 'CAR_NOMBRE_CARRERA': "TI", 'sede_id': 2, 'CUS_TOTAL_CUPOS': 30,
+         'JORNADA': 'NOCTURNA', 'MODALIDAD': 'HIBRIDA', 'OFA_ID': 2, 'CUS_ID': 12},
+        {'carrera_id': 102, 'CAR_NOMBRE_CARRERA': "SOFTWARE", 'sede_id': 1,
+         'CUS_TOTAL_CUPOS': 35, 'OFA_ID': 1, 'CUS_ID': 13},
+    ])
+    assert capsys.readouterr().out == ""
+    assert len(cargadas) == 2 and [r[0] for r in rechazadas] == [2]
+    assert catalogo.por_ofa_id(1).cupos_total == 40
+    assert catalogo.por_cus_id(12).cupos_total == 30
+    assert len(catalogo.por_carrera(101)) == 2 and catalogo.por_carrera(999) == []
+    assert catalogo.obtener(101, 2).ofa_id == 2
+    assert catalogo.obtener(101, 2, jornada="matutina") is None
+
+    assert [o.ofa_id for o in catalogo.filtrar(jornada="nocturna")] == [2]
+    assert [o.ofa_id for o in catalogo.filtrar(sede_id=1, modalidad="presencial")] == [1]
+    assert catalogo.filtrar(sede_id=2, jornada="MATUTINA") == []
+    # Cualquier escritura de la categoría, no solo las mayúsculas
+    assert [o.ofa_id for o in catalogo.filtrar(modalidad="Híbrida")] == [2]
+    assert catalogo.filtrar(modalidad="semipresencial") == [] and catalogo.filtrar(modalidad="otra") == []
+    assert len(catalogo.filtrar(nivel="tercer nivel")) == 2
+    assert len(catalogo.filtrar()) == 2
+    try:
+        catalogo.agregar(catalogo.por_ofa_id(1))
+        assert False, "Debió rechazar el OFA_ID duplicado"
+    except ValueError:
+        pass
+
+def test_distribucion_cupos_resto_mayor():
+    """Reparto vectorizado exacto, igual al de cada oferta, y cambio de política"""
+    from models.DistribucionCupos import DistribucionCupos
+
+    ofertas = [OfertaCarrera(100 + i, f"C{i}", 1, "Manta", total, "TERCER NIVEL",
+                             "PRESENCIAL", "MATUTINA", mostrar=False)
+               for i, total in enumerate([0, 1, 7, 37, 40, 123])]
+    matriz = DistribucionCupos().repartir([o.cupos_total for o in ofertas])
+    assert matriz.sum(axis=1).tolist() == [0, 1, 7, 37, 40, 123]
+    assert matriz[3].tolist() == [1, 7, 11, 0, 0, 0, 18]  # 36 -> 7.2 / 10.8 / 18
+    for oferta, fila in zip(ofertas, matriz.tolist()):
+        assert (fila[0], fila[1], fila[2], fila[6]) == (oferta.cupos_pc, oferta.cupos_vulnerabilidad,
+                                                       oferta.cupos_merito, oferta.cupos_general)
+
+    DistribucionCupos(0.10, pesos={'VULNERABILIDAD': 1, 'BACHILLERES': 1,
+                                   'GENERAL': 2}).aplicar(ofertas)
+    oferta = ofertas[4]
+    assert (oferta.cupos_pc, oferta.cupos_vulnerabilidad, oferta.cupos_merito,
+            oferta.cupos_general) == (4, 9, 0, 18)
+    assert oferta.calcularCuposDisponibles('BACHILLERES') == 9
+
+    # Porcentaje exacto: 100 * 0.29 en flotante es 28.999...
+    assert DistribucionCupos(0.29).repartir([100, 1000])[:, 0].tolist() == [29, 290]
+
+    # Un reparto que deja un segmento por debajo de lo ya asignado no se aplica
+    import pytest
+    for _ in range(10):
+        oferta.reservarCupo('VULNERABILIDAD')
+    with pytest.raises(ValueError, match=r"VULNERABILIDAD \(9 > 0\)"):
+        DistribucionCupos(pesos={'GENERAL': 1}).aplicar(ofertas)
+    assert (oferta.cupos_vulnerabilidad, oferta.cupos_general) == (9, 18)
+    try:
+        DistribucionCupos(pesos={'OTRO': 1})
+        assert False, "Debió rechazar el segmento inválido"
+    except ValueError:
+        pass
+
+def test_resumen_sedes_incremental(capsys):
+    """Totales por sede/jornada/modalidad al reservar, liberar, inscribir y cancelar"""
+    from models.ResumenSedes import ResumenSedes
+    from models.RepositorioInscripciones import RepositorioInscripciones
+
+    ti = OfertaCarrera(101, "TI", 1, "Manta", 40, "TERCER NIVEL", "PRESENCIAL", "MATUTINA", mostrar=False)
+    sw = OfertaCarrera(102, "Software", 1, "Manta", 35, "TERCER NIVEL", "HIBRIDA", "NOCTURNA", mostrar=False)
+    adm = OfertaCarrera(104, "Administracion", 2, "Chone", 30, "TERCER NIVEL", "PRESENCIAL", "MATUTINA",
+                        mostrar=False)
+    repositorio = RepositorioInscripciones()
+    resumen = ResumenSedes([ti, sw], repositorio)
+    sede = SedeCampus(1)
+    resumen.registrar_sede(sede)
+    resumen.registrar_oferta(adm)
+    assert (sede.total_carreras, sede.total_cupos) == (2, 75)
+
+    ti.reservarCupo('GENERAL')
+    ti.reservarCupo('CUOTAS')
+    adm.reservarCupo('GENERAL')
+    ti.liberarCupo('CUOTAS')
+    capsys.readouterr()
+    assert resumen.resumen(sede_id=1)['segmentos']['GENERAL'] == 1
+    assert resumen.resumen(sede_id=1)['asignados'] == 1
+    assert resumen.resumen(jornada='matutina', modalidad='presencial')['asignados'] == 2
+    assert resumen.resumen()['total_cupos'] == 105
+
+    primera = repositorio.crear_inscripcion(id_postulante=1, carrera_id=101, orden_preferencia=1,
+                                            sede_id=1, jornada='matutina', cedula_postulante='1316202082',
+                                            evaluacion_diferida=True)
+    repositorio.crear_inscripcion(id_postulante=1, carrera_id=102, orden_preferencia=2, sede_id=1,
+                                  jornada='nocturna', cedula_postulante='1316202082',
+                                  evaluacion_diferida=True)
+    assert resumen.resumen(sede_id=1)['por_preferencia'] == {1: 1, 2: 1}
+    assert resumen.resumen(modalidad='hibrida')['inscripciones'] == 1
+    assert resumen.resumen(modalidad='Híbrida')['inscripciones'] == 1
+    repositorio.cancelar(primera.id_inscripcion)
+    assert resumen.resumen(sede_id=1, jornada='matutina')['inscripciones'] == 0
+
+    ti.configurar_desde_pdf(cupos_nivelacion=50, cupos_pc=2, mostrar=False)
+    assert resumen.resumen(sede_id=1)['total_cupos'] == 87 and sede.total_cupos == 87
+    assert resumen.por_sede()[2]['total_cupos'] == 30
+
+def test_sede_campus_flyweight_e_indices(capsys):
+    """Datos de sede compartidos, búsquedas sin tildes y ofertas que resuelven su sede"""
+    contador = SedeCampus.obtener_total_sedes()
+    manta = SedeCampus.obtener(1)
+    assert manta is SedeCampus.obtener(1)
+    assert SedeCampus.obtener_total_sedes() == contador
+    try:
+        manta.nombre = "Otra"
+        assert False, "Los datos de la sede deben ser inmutables"
+    except AttributeError:
+        pass
+    try:
+        SedeCampus.obtener(99)
+        assert False, "Debió rechazar la sede inexistente"
+    except ValueError:
+        pass
+
+    assert SedeCampus.obtener_sede_por_canton("  el carmen ") == 3
+    assert SedeCampus.obtener_sede_por_canton("Manta") == 1
+    assert SedeCampus.obtener_sede_por_canton("Portoviejo") is None
+    assert [s.sede_id for s in SedeCampus.sedes_por_provincia("Santo Domingo de los Tsachilas")] == [7]
+    assert len(SedeCampus.sedes_por_provincia("manabi")) == 8
+
+    oferta = OfertaCarrera(101, "TI", 2, None, 40, "TERCER NIVEL", "PRESENCIAL", "MATUTINA", mostrar=False)
+    assert oferta.nombre_sede == "Chone"
+    assert SedeCampus(2, mostrar=False).nombre_sede == "Chone"
+    assert capsys.readouterr().out == ""
+
+def test_distancias_sedes_cercanas_y_cohorte():
+    """Sedes y ofertas cercanas por cantón y anotación vectorizada de una cohorte"""
+    from models.CatalogoOfertas import CatalogoOfertas
+    from models.DistanciasSedes import DistanciasSedes
+
+    distancias = DistanciasSedes()
+    assert distancias.distancias_km.dtype.name == 'float32'
+    assert distancias.sedes_cercanas("Jipijapa", 1)[0][0].sede_id == 1
+    assert distancias.sedes_cercanas("pedernales", 1)[0][0].sede_id == 4
+    assert distancias.sedes_cercanas(1308, 1)[0][0].nombre == "Matriz - Manta"
+    assert distancias.sedes_cercanas("Quito") == []
+    assert distancias.distancia("Manta", 1) == 0
+    assert 60 < distancias.distancia("Manta", 2) < 130
+
+    registro = RegistroNacional("1316202082", "JEAN PIERRE", "FLORES PILOSO")
+    registro.completar_ubicacion("MANABI", "PUERTO LÓPEZ", "PUERTO LOPEZ", "CENTRO", "MALECON")
+    assert distancias.sedes_cercanas_registro(registro, 1)[0][0].sede_id == 1
+
+    catalogo = CatalogoOfertas([
+        OfertaCarrera(101, "TI", 1, None, 40, "TERCER NIVEL", "PRESENCIAL", "MATUTINA", mostrar=False),
+        OfertaCarrera(104, "Administracion", 2, None, 30, "TERCER NIVEL", "PRESENCIAL", "NOCTURNA",
+                      mostrar=False),
+    ])
+    assert [o.carrera_id for o, _ in distancias.ofertas_cercanas("Chone", catalogo)] == [104, 101]
+    assert [o.carrera_id for o, _ in distancias.ofertas_cercanas("Chone", catalogo, radio_km=10)] == [104]
+
+    otro = RegistroNacional("1350432058", "BRADDY", "VERA")
+    anotacion = distancias.anotar_cohorte([registro, otro])
+    assert anotacion['sede_id'].tolist() == [1, 0]
+    assert anotacion['distancia_km'][1] != anotacion['distancia_km'][1]  # NaN
+    assert distancias.conteo_por_sede(anotacion) == {0: 1, 1: 1}
+
+def test_catalogo_dpa_codigos_y_agrupacion():
+    """Ubicaciones normalizadas a códigos DPA, nombres internados y agrupación entera"""
+    import numpy as np
+    from models.CatalogoDPA import CatalogoDPA
+
+    dpa = CatalogoDPA.predeterminado()
+    assert len(dpa.hijos()) == 24
+    assert list(dpa.hijos(13)) == list(range(1301, 1323))
+    assert dpa.resolver("manabi", "Bolívar", "calceta") == (13, 1302, 130250)
+    assert dpa.resolver("Bolivar") == (2, None, None)
+    assert dpa.resolver("SANTO DOMINGO", "santo domingo", "Santo Domingo") == (23, 2301, 230150)
+    assert dpa.resolver("Manabí", "Quito", "Quito") == (13, None, None)
+    assert CatalogoDPA.a_nivel(130850, 'provincia') == 13
+    assert CatalogoDPA.a_nivel(np.array([130850, 1303, 23]), 'provincia').tolist() == [13, 13, 23]
+    assert CatalogoDPA.a_nivel(np.array([130850, 1303]), 'canton').tolist() == [1308, 1303]
+
+    primero = RegistroNacional("1316202082", "JEAN PIERRE", "FLORES PILOSO")
+    primero.completar_ubicacion("MANABI", "MANTA", "TARQUI", "CENTRO", "CALLE 10")
+    segundo = RegistroNacional("1350432058", "BRADDY", "VERA")
+    segundo.completar_ubicacion("manabí", "manta", "manta", "LOS ESTEROS", "AV. 24 DE MAYO")
+    assert (primero.codigo_provincia, primero.codigo_canton, primero.codigo_parroquia) == (13, 1308, None)
+    assert primero.parroquia_reside == "TARQUI"
+    assert segundo.codigo_parroquia == 130850
+    assert primero.provincia_reside == "MANABÍ" and primero.provincia_reside is segundo.provincia_reside
+    assert primero.canton_reside is segundo.canton_reside
+
+def test_categorias_codigos_compartidos(capsys):
+    """Categorías con código entero común y etiqueta internada en todos los modelos"""
+    import pytest
+    import models.Categorias as Categorias
+
+    assert Categorias.JORNADAS.codificar('matutina') == Categorias.JORNADAS_EVALUACION.codificar('MATUTINA') == 0
+    assert 'no aplica jornada' in Categorias.JORNADAS and 'NO APLICA JORNADA' not in Categorias.JORNADAS_EVALUACION
+    assert Categorias.NIVELES.normalizar('tecnologico superior') == 'TERCER NIVEL TECNOLÓGICO SUPERIOR'
+
+    inscripcion = Inscripcion(1, 101, 1, 1, "Vespertina", "1316202082", evaluacion_diferida=True)
+    assert inscripcion.jornada == 'vespertina'
+    assert inscripcion.jornada is Categorias.JORNADAS_EVALUACION.normalizar('VESPERTINA')
+
+    oferta = OfertaCarrera(101, "TI", 1, "MANTA", 40, "tercer nivel", "hibrida", "matutina", mostrar=False)
+    assert (oferta.nivel, oferta.modalidad, oferta.jornada) == ("TERCER NIVEL", "HIBRIDA", "MATUTINA")
+    with pytest.raises(ValueError):
+        OfertaCarrera(102, "TI", 1, "MANTA", 40, "TERCER NIVEL", "VIRTUAL", "MATUTINA", mostrar=False)
+
+    assert Evaluacion(1, 'ESCRITO', 1, auto_programar=False).tipo == 'escrito'
+
+    registro = RegistroNacional("1350432058", "BRADDY", "VERA")
+    registro.completar_datos_personales("2003-01-10", "mujer", "MESTIZO")
+    assert (registro.sexo, registro.genero) == ('MUJER', 'FEMENINO')
+
+    # Segmentos por alias y sin tildes; estados con las etiquetas compartidas
+    assert oferta.reservarCupo('merito') and oferta.reservarCupo('Mérito_Académico')
+    assert oferta.cupos_asignados['MERITO_ACADEMICO'] == 2
+    oferta.liberarCupo('merito')
+    assert oferta.calcularCuposDisponibles('merito') == oferta.cupos_merito - 1
+    assert not oferta.reservarCupo('otro') and oferta.calcularCuposDisponibles('otro') == 0
+
+    evaluacion = Evaluacion(1, 'escrito', 1, auto_programar=False)
+    assert evaluacion.estado is Categorias.ESTADOS_EVALUACION.normalizar('programada')
+    evaluacion.registrarCalificacion(800, mostrar=False)
+    assert evaluacion.esta_completada and evaluacion.estado in Evaluacion.ESTADOS_VALIDOS
+    asignacion = Asignacion(1, 101, 1, 800, "1350432058")
+    asignacion.expirar()
+    assert asignacion.estado is Categorias.ESTADOS_ASIGNACION.normalizar('expirada')
+    assert 'pendiente' in Postulante.ESTADOS_VALIDOS
+
+def test_asignador_ids_bloques_hilos_y_reinicio(tmp_path):
+    """IDs por bloques: únicos entre hilos y procesos, y persistentes entre ejecuciones"""
+    from concurrent.futures import ThreadPoolExecutor
+    from models.AsignadorIds import AsignadorIds
+
+    memoria = AsignadorIds(tamano_bloque=3)
+    assert [memoria.siguiente('x') for _ in range(5)] == [1, 2, 3, 4, 5]
+    assert memoria.reservar('x', 10) == range(7, 17)
+
+    ruta = str(tmp_path / "ids.sqlite3")
+    asignador = AsignadorIds(ruta, tamano_bloque=50)
+    with ThreadPoolExecutor(max_workers=4) as ejecutor:
+        lotes = list(ejecutor.map(lambda n: [asignador.siguiente('inscripcion') for _ in range(n)], [120] * 4))
+    ids = [i for lote in lotes for i in lote]
+    assert len(set(ids)) == 480 and all(lote == sorted(lote) for lote in lotes)
+    otro_proceso = AsignadorIds(ruta, tamano_bloque=50)
+    assert otro_proceso.siguiente('inscripcion') > max(ids)
+    asignador.cerrar()
+    otro_proceso.cerrar()
+
+    reinicio = AsignadorIds(ruta)
+    assert reinicio.maximo('inscripcion') >= max(ids) and reinicio.maximo('evaluacion') == 0
+    reinicio.cerrar()
+
+    primera = Inscripcion(1, 101, 1, 1, "matutina", "1316202082", evaluacion_diferida=True)
+    segunda = Inscripcion(1, 102, 2, 1, "matutina", "1316202082", evaluacion_diferida=True)
+    assert segunda.id_inscripcion == primera.id_inscripcion + 1
+
+    # ULEAM_IDS persiste los IDs del asignador de los modelos
+    import os
+    anterior = AsignadorIds.predeterminado()
+    os.environ[AsignadorIds.VARIABLE_ENTORNO] = ruta
+    try:
+        entorno = AsignadorIds.configurar_desde_entorno()
+        assert entorno.ruta == ruta and AsignadorIds.configurar_desde_entorno() is entorno
+        assert entorno.siguiente('inscripcion') > max(ids)
+    finally:
+        del os.environ[AsignadorIds.VARIABLE_ENTORNO]
+        AsignadorIds._predeterminado = anterior
+        entorno.cerrar()
+
+    # Tras fork el hijo abre su propia conexión y sigue después del padre
+    if hasattr(os, 'fork'):
+        compartido = AsignadorIds(ruta, tamano_bloque=10)
+        del_padre = compartido.siguiente('fork')
+        conexion_padre = compartido._conexion
+        lectura, escritura = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                propia = compartido._conexion is not conexion_padre
+                os.write(escritura, str(compartido.siguiente('fork') if propia else -1).encode())
+            finally:
+                os._exit(0)
+        os.close(escritura)
+        del_hijo = int(os.read(lectura, 32))
+        os.close(lectura)
+        os.waitpid(pid, 0)
+        assert del_hijo > del_padre + 9 and compartido.siguiente('fork') == del_padre + 1
+        compartido.cerrar()
+
+def test_instantanea_estado_admision(tmp_path, capsys):
+    """Instantánea binaria: restauración perezosa, relaciones y continuidad de IDs"""
+    import pytest
+    from models.Instantanea import EstadoAdmision
+
+    registro = RegistroNacional("1316202082", "JEAN PIERRE", "FLORES PILOSO")
+    registro.completar_ubicacion("MANABI", "MANTA", "MANTA", "LOS ESTEROS", "AV. 24 DE MAYO")
+    registro.completar_datos_academicos("U.E. MANTA", "FISCAL", 9.5, "SI")
+    oferta = OfertaCarrera(101, "TI", 1, None, 40, "TERCER NIVEL", "PRESENCIAL", "MATUTINA", mostrar=False)
+    oferta.reservarCupo('GENERAL')
+    postulante = Postulante("1316202082", "JEAN PIERRE FLORES", "jean@uleam.edu.ec", "0999999999",
+                            "2007-05-15", mostrar=False)
+    inscripcion = Inscripcion(postulante.id_postulante, 101, 1, 1, "matutina", "1316202082")
+    postulante.agregarInscripcion(inscripcion, mostrar=False)
+    postulante.agregarPuntaje(PuntajePostulacion(postulante.id_postulante, 9.5, 850, "1316202082"))
+    postulante.establecerAsignacion(Asignacion(postulante.id_postulante, 101, 1, 900.5, "1316202082"))
+
+    ruta = str(tmp_path / "admision.snap")
+    resumen = EstadoAdmision(registros=[registro], postulantes=[postulante], ofertas=[oferta]).guardar(ruta)
+    assert (resumen['inscripciones'], resumen['evaluaciones'], resumen['asignaciones']) == (1, 1, 1)
+
+    estado = EstadoAdmision.cargar(ruta)
+    assert estado.postulantes.materializados == 0 and estado.resumen()['puntajes'] == 1
+    restaurado = estado.postulantes.por_id(postulante.id_postulante)
+    copia = restaurado.obtenerInscripciones()[0]
+    assert copia is estado.inscripciones[0] and copia.obtenerEvaluacion() is estado.evaluaciones[0]
+    assert copia.fecha_inscripcion == inscripcion.fecha_inscripcion
+    assert copia.obtenerEvaluacion().fecha_programada == inscripcion.obtenerEvaluacion().fecha_programada
+    assert restaurado.obtenerAsignacion().puntaje_final == 900.5
+    assert restaurado.obtenerPuntajes()[0].puntaje_final == postulante.obtenerPuntajes()[0].puntaje_final
+
+    copia_oferta = estado.ofertas[0]
+    assert copia_oferta.cupos_asignados == oferta.cupos_asignados and copia_oferta.calcularCuposDisponibles() == 39
+    assert copia_oferta.reservarCupo('GENERAL') and estado.ofertas[0].cupos_asignados['GENERAL'] == 2
+    copia_registro = estado.registros.por_id("1316202082")
+    assert vars(copia_registro) == vars(registro)
+    assert estado.registros.valores('canton_reside') == ["MANTA"]
+
+    assert Inscripcion(1, 102, 2, 1, "matutina", "1316202082",
+                       evaluacion_diferida=True).id_inscripcion > inscripcion.id_inscripcion
+    estado.cerrar()
+    with pytest.raises(ValueError):
+        EstadoAdmision(matriculas=[])
+
+def test_instantanea_continua_ids_de_ofertas(tmp_path):
+    """Una oferta creada tras restaurar no repite el OFA_ID/CUS_ID de las guardadas"""
+    from models.AsignadorIds import AsignadorIds
+    from models.BitacoraEventos import BitacoraEventos
+    from models.CatalogoOfertas import CatalogoOfertas
+    from models.Instantanea import EstadoAdmision
+
+    anterior = AsignadorIds._predeterminado
+    try:
+        AsignadorIds._predeterminado = AsignadorIds()
+        guardada = OfertaCarrera(101, "TI", 1, "MANTA", 40, "TERCER NIVEL", "PRESENCIAL",
+                                 "MATUTINA", mostrar=False)
+        ruta = str(tmp_path / "ofertas.snap")
+        EstadoAdmision(ofertas=[guardada]).guardar(ruta)
+
+        # Otro proceso: el asignador empieza de cero y avanza al restaurar
+        AsignadorIds._predeterminado = AsignadorIds()
+        estado = EstadoAdmision.cargar(ruta)
+        nueva = OfertaCarrera(102, "SOFTWARE", 1, "MANTA", 35, "TERCER NIVEL", "PRESENCIAL",
+                              "MATUTINA", mostrar=False)
+        assert (nueva.ofa_id, nueva.cus_id) == (guardada.ofa_id + 1, guardada.cus_id + 1)
+        catalogo = CatalogoOfertas(estado.ofertas)
+        catalogo.agregar(nueva)
+        assert len(catalogo) == 2
+
+        # La bitácora distingue ambas ofertas al reproducir
+        bitacora = BitacoraEventos(str(tmp_path / "ofertas.log"), intervalo_vaciado=0)
+        bitacora.registrar('oferta_creada', estado.ofertas[0])
+        bitacora.registrar('oferta_creada', nueva)
+        assert len(bitacora.reconstruir().ofertas) == 2
+        bitacora.cerrar()
+        estado.cerrar()
+    finally:
+        AsignadorIds._predeterminado = anterior
+
+def test_codec_binario_ida_y_vuelta(capsys):
+    """Codec binario por esquema: ida y vuelta exacta, nulos, varints y tamaño frente a pickle"""
+    import pickle
+    import pytest
+    from models.CodecBinario import CodecBinario, escribir_varint, leer_varint
+
+    for numero in (0, 127, 128, 300, 2 ** 63):
+        salida = bytearray()
+        escribir_varint(salida, numero)
+        assert leer_varint(salida, 0) == (numero, len(salida))
+
+    registro = RegistroNacional("1316202082", "JEAN PIERRE", "FLORES PILOSO")
+    registro.completar_datos_personales("2007-05-15", "HOMBRE", "MESTIZO")
+    registro.completar_ubicacion("MANABÍ", "MANTA", "MANTA", "LOS ESTEROS", "AV. 24 DE MAYO")
+    inscripcion = Inscripcion(7, 101, 2, 1, "vespertina", "1316202082", evaluacion_diferida=True)
+    inscripcion.cancelar()
+    asignacion = Asignacion(7, 101, 1, 912.75, "1316202082", "jean@uleam.edu.ec")
+    asignacion.confirmar()
+    oferta = OfertaCarrera(101, "TI", 1, None, 40, "TERCER NIVEL", "PRESENCIAL", "MATUTINA", mostrar=False)
+    oferta.reservarCupo('MERITO_ACADEMICO')
+    evaluacion = Evaluacion(inscripcion.id_inscripcion, 'practico', 1)
+    evaluacion.registrarCalificacion(815.5, mostrar=False)
+
+    codec = CodecBinario()
+    objetos = [registro, inscripcion, asignacion, oferta, evaluacion]
+    for objeto in objetos:
+        copia = codec.decodificar(codec.codificar(objeto))
+        assert type(copia) is type(objeto)
+        assert {k: v for k, v in vars(copia).items() if not k.startswith('_')} == \
+               {k: v for k, v in vars(objeto).items() if not k.startswith('_')}
+    copias = codec.decodificar_lote(codec.codificar_lote(objetos * 50))
+    assert len(copias) == 250 and vars(copias[-1]) == vars(evaluacion)
+    assert copias[3].calcularCuposDisponibles('MERITO_ACADEMICO') == oferta.calcularCuposDisponibles('MERITO_ACADEMICO')
+    assert copias[1]._evaluacion is None
+
+    lote = [registro] * 200
+    assert len(codec.codificar_lote(lote)) * 3 < len(pickle.dumps(lote[:1])) * 200
+    assert len(codec.codificar(registro)) < len(pickle.dumps(registro)) / 3
+
+    with pytest.raises(ValueError):
+        codec.decodificar(codec.codificar(registro)[:-3])
+    with pytest.raises(ValueError):
+        codec.codificar(object())
+    inscripcion.sede_id = "1"
+    with pytest.raises(ValueError):
+        codec.codificar(inscripcion)
+
+def test_bitacora_eventos_reproduccion_y_puntos_control(tmp_path, capsys):
+    from datetime import datetime, timedelta
+    from models.Asignacion import Asignacion
+    from models.BitacoraEventos import BitacoraEventos
+    from models.Instantanea import EstadoAdmision
+    from models.ofertaCarrera import OfertaCarrera
+
+    marcas = iter(datetime(2025, 10, 1) + timedelta(seconds=s) for s in range(10_000))
+    ruta = str(tmp_path / "admision.log")
+    bitacora = BitacoraEventos(ruta, tamano_lote=4, reloj=lambda: next(marcas)).activar()
+    try:
+        oferta = OfertaCarrera(101, "SOFTWARE", 1, "MANTA", 10, "TERCER NIVEL", "PRESENCIAL",
+                               "MATUTINA", mostrar=False)
+        estado = EstadoAdmision(ofertas=[oferta])
+        for cedula in ("1300000001", "1300000002"):
+            oferta.reservarCupo('GENERAL')
+            estado.asignaciones.append(Asignacion(1, 101, 1, 850.0, cedula))
+        bitacora.punto_control(estado)
+        corte = bitacora.secuencia
+
+        estado.asignaciones[0].confirmar()
+        estado.asignaciones[1].rechazar("No aceptó")
+        oferta.liberarCupo('GENERAL')
+    finally:
+        bitacora.cerrar()
+    assert Asignacion.bitacora is None
+
+    # Un registro a medias al final (caída durante la escritura) se descarta
+    with open(ruta, 'ab') as archivo:
+        archivo.write(b"\x40\x00\x00\x00roto")
+    bitacora = BitacoraEventos(ruta, tamano_lote=1000, intervalo_vaciado=0.05)
+    assert bitacora.secuencia == corte + 3
+    assert [e.tipo for e in bitacora.eventos()][-3:] == [
+        'asignacion_confirmada', 'asignacion_rechazada', 'cupo_liberado']
+
+    # Sin más eventos, el pendiente llega al disco al vencer el plazo
+    import os
+    import time
+    tamano = os.path.getsize(ruta)
+    bitacora.registrar('oferta_configurada', oferta)
+    limite = time.monotonic() + 5
+    while os.path.getsize(ruta) == tamano and time.monotonic() < limite:
+        time.sleep(0.01)
+    assert os.path.getsize(ruta) > tamano
+
+    # Reproducir el pasado no mueve los IDs que entregan los modelos
+    from models.AsignadorIds import AsignadorIds
+    anterior = AsignadorIds._predeterminado
+    AsignadorIds._predeterminado = AsignadorIds()
+    try:
+        actual = bitacora.reconstruir()
+        assert AsignadorIds.predeterminado().maximo('asignacion') == 0
+    finally:
+        AsignadorIds._predeterminado = anterior
+    assert actual.ofertas[0].cupos_asignados['GENERAL'] == 1
+    assert [a.estado for a in actual.asignaciones] == ['CONFIRMADA', 'RECHAZADA']
+    assert actual.asignaciones[1].observaciones == "Rechazada: No aceptó"
+
+    pasado = bitacora.reconstruir(hasta_secuencia=corte + 1)
+    assert pasado.ofertas[0].cupos_asignados['GENERAL'] == 2
+    assert [a.estado for a in pasado.asignaciones] == ['CONFIRMADA', 'PENDIENTE']
+
+    desde_cero = bitacora.reconstruir(hasta=datetime(2025, 10, 1, 0, 0, 1))
+    assert desde_cero.resumen()['ofertas'] == 1 and desde_cero.resumen()['asignaciones'] == 0
+    for estado in (actual, pasado, desde_cero):
+        estado.cerrar()
+    bitacora.cerrar()
+
+
+def test_versiones_estado_lectura_consistente(capsys):
+    import pytest
+    from models.Asignacion import Asignacion
+    from models.ofertaCarrera import OfertaCarrera
+    from models.VersionesEstado import ControlVersiones
+
+    control = ControlVersiones().activar()
+    try:
+        oferta = OfertaCarrera(101, "SOFTWARE", 1, "MANTA", 10, "TERCER NIVEL", "PRESENCIAL",
+                               "MATUTINA", mostrar=False)
+        asignaciones = []
+        with control.transaccion():
+            oferta.reservarCupo('GENERAL')
+            asignaciones.append(Asignacion(1, 101, 1, 850.0, "1300000001"))
+
+        with control.lectura() as foto:
+            # La asignación sigue mientras el reporte lee
+            with control.transaccion():
+                oferta.reservarCupo('GENERAL')
+                asignaciones.append(Asignacion(2, 101, 1, 840.0, "1300000002"))
+            asignaciones[0].confirmar()
+
+            assert oferta.obtener_estadisticas(foto)['asignados'] == 1
+            assert oferta.obtener_estadisticas()['asignados'] == 2
+            assert list(foto.visibles(asignaciones)) == asignaciones[:1]
+            assert foto.valor(asignaciones[0], 'estado') == 'PENDIENTE'
+            with pytest.raises(ValueError):
+                foto.valor(asignaciones[1], 'estado')
+
+        # Sin lecturas abiertas no se guardan versiones viejas
+        oferta.liberarCupo('GENERAL')
+        assert oferta._version.anterior.anterior is None
+        with control.lectura() as foto:
+            assert foto.valor(asignaciones[0], 'estado') == 'CONFIRMADA'
+            assert foto.valores(oferta)['cupos_asignados']['GENERAL'] == 1
+    finally:
+        control.desactivar()
+    assert Asignacion.versiones is None and OfertaCarrera.versiones is None
+
+
+def test_versiones_estado_lectura_no_pierde_versiones(capsys):
+    import threading
+    from collections import Counter
+    from models.ofertaCarrera import OfertaCarrera
+    from models.VersionesEstado import ControlVersiones
+
+    control = ControlVersiones().activar()
+    try:
+        oferta = OfertaCarrera(101, "SOFTWARE", 1, "MANTA", 10, "TERCER NIVEL", "PRESENCIAL",
+                               "MATUTINA", mostrar=False)
+        oferta.reservarCupo('GENERAL')
+        escritor = []
+
+        class LectoresConPausa(Counter):
+            def __missing__(self, numero):
+                # La lectura ya leyó actual pero aún no se registró: otro hilo
+                # publica dos versiones (la segunda podaría la que necesita)
+                hilo = threading.Thread(target=lambda: [oferta.reservarCupo('GENERAL') for _ in range(2)])
+                escritor.append(hilo)
+                hilo.start()
+                hilo.join(timeout=0.2)
+                return 0
+
+        control._lectores = LectoresConPausa()
+        with control.lectura() as foto:
+            escritor[0].join()
+            assert oferta.cupos_asignados['GENERAL'] == 3
+            assert foto.valores(oferta) is not None
+            assert oferta.obtener_estadisticas(foto)['segmentos']['GENERAL'] == 1
+    finally:
+        control.desactivar()
+
+
 if __name__ == "__main__":
     try:
         test_completo()